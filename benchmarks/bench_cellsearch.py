@@ -0,0 +1,136 @@
+"""Throughput and memory of the streaming cell search (nr/cellsearch.py).
+
+A synthetic IQ stream carries the SSBs of a few cells every 20 ms in AWGN.
+It is fed to ``cell_search`` in chunks of several sizes, and per chunk size
+this script records:
+
+- msps: million samples searched per second (median over repeats)
+- ms_per_signal_s: CPU milliseconds per second of IQ, the real-time budget
+- peak_kib: peak memory allocated during the search (tracemalloc, separate run)
+- detected: whether every cell was found with the right PCI
+
+Results go to benchmarks/results/cellsearch_latest.json and are compared
+against benchmarks/results/cellsearch_baseline.json when present.
+
+Usage (from the repository root):
+
+    python benchmarks/bench_cellsearch.py
+    python benchmarks/bench_cellsearch.py --seconds 1 --block-size 2048
+    python benchmarks/bench_cellsearch.py --save-baseline
+"""
+
+import argparse
+import json
+import os
+import statistics
+import sys
+import time
+import tracemalloc
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import numpy as np
+
+from bench_pages import RESULTS_DIR, _write, compare
+from nr.cellsearch import cell_search, ssb_waveform
+
+CHUNK_SIZES = (1024, 4096, 16384, 65536, 262144)
+
+# (PCI, offset in ms, amplitude) of the cells in the synthetic stream
+CELLS = ((17, 0.5, 1.0), (502, 6.0, 0.7), (1007, 13.0, 2.0))
+SSB_PERIOD_MS = 20
+
+
+def synthetic_stream(seconds, scs_khz, fft_size, snr_db, seed=0):
+    """(complex64 IQ, sample rate) with every cell's SSB repeated each 20 ms in unit-power noise"""
+    rng = np.random.default_rng(seed)
+    rate = fft_size * scs_khz * 1000
+    num_samples = int(seconds * rate)
+    iq = rng.normal(scale=np.sqrt(0.5), size=(num_samples, 2)).astype(np.float32).view(np.complex64)[:, 0]
+    gain = 10**(snr_db / 20)
+    for pci, offset_ms, amplitude in CELLS:
+        ssb = ssb_waveform(pci, scs_khz, fft_size) * np.complex64(gain * amplitude * np.exp(2j * np.pi * rng.random()))
+        for start in range(int(offset_ms * rate / 1000), num_samples - ssb.size, SSB_PERIOD_MS * rate // 1000):
+            iq[start:start + ssb.size] += ssb
+    return iq, rate
+
+
+def run(iq, chunk_size, **search_kwargs):
+    chunks = (iq[i:i + chunk_size] for i in range(0, iq.size, chunk_size))
+    return cell_search(chunks, **search_kwargs)
+
+
+def measure(iq, rate, chunk_size, repeats, **search_kwargs):
+    times = []
+    for _ in range(repeats):
+        t0 = time.perf_counter()
+        found = run(iq, chunk_size, **search_kwargs)
+        times.append(time.perf_counter() - t0)
+
+    tracemalloc.start()
+    run(iq, chunk_size, **search_kwargs)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    elapsed = statistics.median(times)
+    return {
+        'msps': round(iq.size / elapsed / 1e6, 2),
+        'ms_per_signal_s': round(1000 * elapsed * rate / iq.size, 2),
+        'peak_kib': round(peak / 1024, 1),
+        'detected': {pci for pci, _, _ in CELLS} <= set(found['pci'].tolist()),
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[0])
+    parser.add_argument('-r', '--repeats', type=int, default=3)
+    parser.add_argument('--seconds', type=float, default=0.2, help="length of the IQ stream")
+    parser.add_argument('--scs', type=int, default=30, help="subcarrier spacing in kHz")
+    parser.add_argument('--fft-size', type=int, default=256)
+    parser.add_argument('--block-size', type=int, default=1024, help="overlap-save FFT length")
+    parser.add_argument('--snr', type=float, default=0.0, help="SNR of a unit-amplitude cell in dB")
+    parser.add_argument('--save-baseline', action='store_true')
+    parser.add_argument('--time-tolerance', type=float, default=0.25)
+    parser.add_argument('--size-tolerance', type=float, default=0.05)
+    args = parser.parse_args(argv)
+
+    iq, rate = synthetic_stream(args.seconds, args.scs, args.fft_size, args.snr)
+    search_kwargs = {'scs_khz': args.scs, 'fft_size': args.fft_size, 'block_size': args.block_size}
+    print(f"{iq.size} samples at {rate / 1e6:g} Msps, FFT block {args.block_size}\n")
+
+    results = {}
+    print(f"{'chunk':>8}{'Msps':>9}{'ms per s':>10}{'peak KiB':>11}  detected")
+    for chunk_size in CHUNK_SIZES:
+        metrics = measure(iq, rate, chunk_size, args.repeats, **search_kwargs)
+        results[str(chunk_size)] = metrics
+        print(f"{chunk_size:>8}{metrics['msps']:>9.1f}{metrics['ms_per_signal_s']:>10.1f}"
+              f"{metrics['peak_kib']:>11.0f}  {'yes' if metrics['detected'] else 'NO'}")
+
+    record = {'repeats': args.repeats, 'sample_rate': rate, 'block_size': args.block_size, 'results': results}
+    os.makedirs(RESULTS_DIR, exist_ok=True)
+    baseline_path = os.path.join(RESULTS_DIR, 'cellsearch_baseline.json')
+    _write(os.path.join(RESULTS_DIR, 'cellsearch_latest.json'), record)
+    if args.save_baseline:
+        _write(baseline_path, record)
+        print(f"\nBaseline saved to {os.path.relpath(baseline_path, ROOT)}")
+        return 0
+    if not os.path.exists(baseline_path):
+        print("\nNo baseline yet; run with --save-baseline to record one.")
+        return 0
+
+    with open(baseline_path) as f:
+        baseline = json.load(f)['results']
+    regressions = compare(results, baseline, args.time_tolerance, args.size_tolerance,
+                          time_metrics=('ms_per_signal_s',), size_metrics=('peak_kib',))
+    if not regressions:
+        print("\nNo regressions against baseline.")
+        return 0
+    print("\nRegressions against baseline:")
+    for chunk_size, metric, base, current in regressions:
+        print(f"  {chunk_size:<10}{metric:<17}{base:>12} -> {current}")
+    return 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,253 @@
+"""Headless page benchmarks for frame_structure.py.
+
+Each scenario selects a page, applies widget settings through Streamlit's
+AppTest and then times full reruns with the figure cache cleared, so every
+figure is rebuilt. Per scenario it records:
+
+- total_ms: wall time of one script run (median over repeats)
+- build_ms: time spent inside figure builders
+- compute_ms: total_ms - build_ms (widgets, engines, serialization)
+- payload_bytes: serialized size of every element sent to the browser
+- figure_bytes: the part of payload_bytes that is Plotly figure specs
+
+Results go to benchmarks/results/latest.json (plus a timestamped copy) and
+are compared against benchmarks/results/baseline.json when present.
+
+Usage (from the repository root):
+
+    python benchmarks/bench_pages.py                   # run and compare
+    python benchmarks/bench_pages.py --save-baseline   # record a new baseline
+    python benchmarks/bench_pages.py -k tdd -r 5       # subset, more repeats
+"""
+
+import argparse
+import contextlib
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+from datetime import datetime, timezone
+from fractions import Fraction
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import streamlit as st
+from streamlit.testing.v1 import AppTest
+
+from viz.figcache import FigureCache
+
+APP = os.path.join(ROOT, 'frame_structure.py')
+RESULTS_DIR = os.path.join(ROOT, 'benchmarks', 'results')
+BASELINE = os.path.join(RESULTS_DIR, 'baseline.json')
+
+# (name, page, [(widget kind, label, value), ...]); settings apply in order
+SCENARIOS = [
+    ('frame_default', "🕐 Frame & Slot Structure", []),
+    ('frame_240khz', "🕐 Frame & Slot Structure", [
+        ('selectbox', "Subcarrier Spacing", '240 kHz (μ=4)'),
+        ('radio', "View Level", "Frame (10 ms)"),
+        ('slider', "Number of Frames", 8),
+    ]),
+    ('resource_grid_default', "📊 Resource Grid", []),
+    ('resource_grid_273rb', "📊 Resource Grid", [
+        ('selectbox', "Subcarrier Spacing (kHz)", 30),
+        ('selectbox', "Channel Bandwidth (MHz)", 100),
+    ]),
+    ('physical_channels_default', "📡 Physical Channels", []),
+    ('reference_signals_default', "🎯 Reference Signals", []),
+    ('time_domain_default', "⏱️ Time Domain Analysis", []),
+    ('time_domain_10_slots', "⏱️ Time Domain Analysis", [
+        ('checkbox', "Show Multiple Slots", True),
+        ('slider', "Number of Slots", 10),
+    ]),
+    ('tdd_default', "🔧 TDD Configuration", []),
+    ('tdd_10ms', "🔧 TDD Configuration", [
+        ('selectbox', "Reference Subcarrier Spacing (kHz)", 120),
+        ('selectbox', "dl-UL-TransmissionPeriodicity (ms)", Fraction(10)),
+    ]),
+    ('tdd_dual_pattern', "🔧 TDD Configuration", [
+        ('checkbox', "Add pattern2", True),
+    ]),
+]
+
+# Timings below this many milliseconds over the baseline are never flagged
+MIN_TIME_DELTA_MS = 5.0
+
+
+@contextlib.contextmanager
+def timed_builds():
+    """Accumulate time spent in figure builders called through FigureCache"""
+    spent = [0.0]
+    original = FigureCache.get_or_build
+
+    def get_or_build(self, key, builder):
+        def timed():
+            t0 = time.perf_counter()
+            try:
+                return builder()
+            finally:
+                spent[0] += time.perf_counter() - t0
+        return original(self, key, timed)
+
+    FigureCache.get_or_build = get_or_build
+    try:
+        yield spent
+    finally:
+        FigureCache.get_or_build = original
+
+
+def _elements(node):
+    """All leaf elements below an AppTest tree node"""
+    children = getattr(node, 'children', None)
+    if not children:
+        yield node
+        return
+    for child in children.values():
+        yield from _elements(child)
+
+
+def payload_sizes(at):
+    """(total, figure) serialized bytes of the rendered page"""
+    total = figure = 0
+    for element in _elements(at._tree):
+        proto = getattr(element, 'proto', None)
+        if proto is None:
+            continue
+        size = proto.ByteSize()
+        total += size
+        if element.type == 'plotly_chart':
+            figure += size
+    return total, figure
+
+
+def _widget(at, kind, label):
+    for widget in getattr(at, kind):
+        if widget.label == label:
+            return widget
+    raise LookupError(f"No {kind} labelled {label!r} on this page")
+
+
+def run_scenario(page, settings, repeats, timeout):
+    at = AppTest.from_file(APP, default_timeout=timeout)
+    at.run()
+    at.sidebar.selectbox[0].select(page).run()
+    for kind, label, value in settings:
+        _widget(at, kind, label).set_value(value).run()
+    if at.exception:
+        raise RuntimeError(at.exception[0].message)
+
+    totals, builds = [], []
+    for _ in range(repeats):
+        st.cache_resource.clear()
+        with timed_builds() as spent:
+            t0 = time.perf_counter()
+            at.run()
+            totals.append(time.perf_counter() - t0)
+        builds.append(spent[0])
+        if at.exception:
+            raise RuntimeError(at.exception[0].message)
+
+    total_ms = 1000 * statistics.median(totals)
+    build_ms = 1000 * statistics.median(builds)
+    payload, figure = payload_sizes(at)
+    return {
+        'total_ms': round(total_ms, 2),
+        'build_ms': round(build_ms, 2),
+        'compute_ms': round(total_ms - build_ms, 2),
+        'payload_bytes': payload,
+        'figure_bytes': figure,
+    }
+
+
+def compare(results, baseline, time_tolerance, size_tolerance,
+            time_metrics=('total_ms', 'build_ms', 'compute_ms'),
+            size_metrics=('payload_bytes', 'figure_bytes')):
+    """List of (scenario, metric, baseline, current) regressions"""
+    regressions = []
+    for name, metrics in results.items():
+        base = baseline.get(name)
+        if base is None:
+            continue
+        for metric in time_metrics:
+            if (metrics[metric] > base[metric] * (1 + time_tolerance)
+                    and metrics[metric] - base[metric] > MIN_TIME_DELTA_MS):
+                regressions.append((name, metric, base[metric], metrics[metric]))
+        for metric in size_metrics:
+            if metrics[metric] > base[metric] * (1 + size_tolerance):
+                regressions.append((name, metric, base[metric], metrics[metric]))
+    return regressions
+
+
+def _write(path, data):
+    with open(path, 'w') as f:
+        json.dump(data, f, indent=2, ensure_ascii=False)
+        f.write('\n')
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[0])
+    parser.add_argument('-k', '--select', default='',
+                        help="only run scenarios whose name contains this string")
+    parser.add_argument('-r', '--repeats', type=int, default=3)
+    parser.add_argument('--timeout', type=float, default=120)
+    parser.add_argument('--save-baseline', action='store_true',
+                        help="store this run as the new baseline")
+    parser.add_argument('--time-tolerance', type=float, default=0.25,
+                        help="relative slowdown flagged as a regression")
+    parser.add_argument('--size-tolerance', type=float, default=0.05,
+                        help="relative payload growth flagged as a regression")
+    args = parser.parse_args(argv)
+
+    results = {}
+    print(f"{'scenario':<28}{'total ms':>10}{'build ms':>10}{'compute ms':>12}{'payload KiB':>13}")
+    for name, page, settings in SCENARIOS:
+        if args.select not in name:
+            continue
+        metrics = run_scenario(page, settings, args.repeats, args.timeout)
+        results[name] = metrics
+        print(f"{name:<28}{metrics['total_ms']:>10.1f}{metrics['build_ms']:>10.1f}"
+              f"{metrics['compute_ms']:>12.1f}{metrics['payload_bytes'] / 1024:>13.1f}")
+
+    record = {
+        'timestamp': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'streamlit': st.__version__,
+        'repeats': args.repeats,
+        'results': results,
+    }
+    os.makedirs(RESULTS_DIR, exist_ok=True)
+    _write(os.path.join(RESULTS_DIR, 'latest.json'), record)
+    _write(os.path.join(RESULTS_DIR, f"{record['timestamp'].replace(':', '')}.json"), record)
+
+    if args.save_baseline:
+        if os.path.exists(BASELINE):
+            with open(BASELINE) as f:
+                merged = json.load(f)
+            merged['results'].update(results)
+            record = dict(record, results=merged['results'])
+        _write(BASELINE, record)
+        print(f"\nBaseline saved to {os.path.relpath(BASELINE, ROOT)}")
+        return 0
+
+    if not os.path.exists(BASELINE):
+        print("\nNo baseline yet; run with --save-baseline to record one.")
+        return 0
+
+    with open(BASELINE) as f:
+        baseline = json.load(f)['results']
+    regressions = compare(results, baseline, args.time_tolerance, args.size_tolerance)
+    if not regressions:
+        print("\nNo regressions against baseline.")
+        return 0
+
+    print("\nRegressions against baseline:")
+    for name, metric, base, current in regressions:
+        print(f"  {name:<28}{metric:<15}{base:>12} -> {current}")
+    return 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,122 @@
+"""Cold-start benchmarks for frame_structure.py.
+
+Every measurement runs in a fresh Python process, so nothing is cached in
+sys.modules or in Streamlit's resource caches. Per page it records:
+
+- import_ms: importing Streamlit and its AppTest harness
+- first_paint_ms: the first script run, landing directly on the page
+  (app, page module and its dependencies imported on demand), i.e. what
+  a user waits for after a cold start
+- pandas: whether pandas was imported by the end of that run
+
+Results go to benchmarks/results/startup_latest.json and are compared
+against benchmarks/results/startup_baseline.json when present.
+
+Usage (from the repository root):
+
+    python benchmarks/bench_startup.py
+    python benchmarks/bench_startup.py --save-baseline
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+APP = os.path.join(ROOT, 'frame_structure.py')
+
+PAGES = [
+    "🕐 Frame & Slot Structure",
+    "📊 Resource Grid",
+    "📡 Physical Channels",
+    "🎯 Reference Signals",
+    "⏱️ Time Domain Analysis",
+    "🔧 TDD Configuration",
+]
+
+
+def child(page):
+    """Measure one cold start in this (fresh) process and print JSON"""
+    t0 = time.perf_counter()
+    from streamlit.testing.v1 import AppTest
+    t1 = time.perf_counter()
+
+    at = AppTest.from_file(APP, default_timeout=120)
+    at.session_state['app_mode'] = page
+    at.run()
+    t2 = time.perf_counter()
+    if at.exception:
+        raise RuntimeError(at.exception[0].message)
+
+    print(json.dumps({
+        'import_ms': round(1000 * (t1 - t0), 2),
+        'first_paint_ms': round(1000 * (t2 - t1), 2),
+        'pandas': 'pandas' in sys.modules,
+    }))
+
+
+def measure(page, repeats):
+    runs = []
+    for _ in range(repeats):
+        out = subprocess.run([sys.executable, __file__, '--child', page], cwd=ROOT,
+                             capture_output=True, text=True, check=True).stdout
+        runs.append(json.loads(out.strip().splitlines()[-1]))
+    result = {key: round(statistics.median(run[key] for run in runs), 2)
+              for key in ('import_ms', 'first_paint_ms')}
+    result['pandas'] = runs[-1]['pandas']
+    return result
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[0])
+    parser.add_argument('--child', help=argparse.SUPPRESS)
+    parser.add_argument('-r', '--repeats', type=int, default=3)
+    parser.add_argument('--save-baseline', action='store_true')
+    parser.add_argument('--time-tolerance', type=float, default=0.25)
+    args = parser.parse_args(argv)
+
+    if args.child:
+        child(args.child)
+        return 0
+
+    from bench_pages import RESULTS_DIR, _write, compare
+    baseline_path = os.path.join(RESULTS_DIR, 'startup_baseline.json')
+
+    results = {}
+    print(f"{'page':<28}{'import ms':>11}{'first paint ms':>16}  pandas")
+    for page in PAGES:
+        metrics = measure(page, args.repeats)
+        results[page] = metrics
+        print(f"{page:<28}{metrics['import_ms']:>11.0f}{metrics['first_paint_ms']:>16.0f}"
+              f"  {'loaded' if metrics['pandas'] else '-'}")
+
+    record = {'repeats': args.repeats, 'results': results}
+    os.makedirs(RESULTS_DIR, exist_ok=True)
+    _write(os.path.join(RESULTS_DIR, 'startup_latest.json'), record)
+    if args.save_baseline:
+        _write(baseline_path, record)
+        print(f"\nBaseline saved to {os.path.relpath(baseline_path, ROOT)}")
+        return 0
+    if not os.path.exists(baseline_path):
+        print("\nNo baseline yet; run with --save-baseline to record one.")
+        return 0
+
+    with open(baseline_path) as f:
+        baseline = json.load(f)['results']
+    regressions = compare(results, baseline, args.time_tolerance, 0,
+                          time_metrics=('first_paint_ms',), size_metrics=())
+    if not regressions:
+        print("\nNo regressions against baseline.")
+        return 0
+    print("\nRegressions against baseline:")
+    for page, metric, base, current in regressions:
+        print(f"  {page:<28}{metric:<15}{base:>12} -> {current}")
+    return 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,5 @@
+"""Headless 5G NR building blocks used by the Streamlit visualizer.
+
+Modules in this package depend only on NumPy (and SciPy where noted) so they
+can be imported from batch jobs without pulling in Streamlit or Plotly.
+"""
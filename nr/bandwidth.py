@@ -0,0 +1,66 @@
+"""Maximum transmission bandwidth configuration N_RB per channel bandwidth.
+
+FR1 values are TS 38.101-1 Table 5.3.2-1 and FR2 values TS 38.101-2
+Table 5.3.2-1 (FR2-1). Combinations the tables mark N/A are absent.
+"""
+
+from nr.grid import SUBCARRIERS_PER_RB
+
+# {scs_khz: {channel bandwidth MHz: N_RB}}
+FR1_NRB = {
+    15: {5: 25, 10: 52, 15: 79, 20: 106, 25: 133, 30: 160, 35: 188, 40: 216, 45: 242, 50: 270},
+    30: {5: 11, 10: 24, 15: 38, 20: 51, 25: 65, 30: 78, 35: 92, 40: 106, 45: 119, 50: 133,
+         60: 162, 70: 189, 80: 217, 90: 245, 100: 273},
+    60: {10: 11, 15: 18, 20: 24, 25: 31, 30: 38, 35: 44, 40: 51, 45: 58, 50: 65,
+         60: 79, 70: 93, 80: 107, 90: 121, 100: 135},
+}
+
+FR2_NRB = {
+    60: {50: 66, 100: 132, 200: 264},
+    120: {50: 32, 100: 66, 200: 132, 400: 264},
+}
+
+NRB_TABLES = {'FR1': FR1_NRB, 'FR2': FR2_NRB}
+
+MAX_NRB = 275
+
+
+def scs_options(frequency_range='FR1'):
+    """Subcarrier spacings (kHz) with a defined N_RB table in the range"""
+    return sorted(NRB_TABLES[frequency_range])
+
+
+def bandwidth_options(scs_khz, frequency_range='FR1'):
+    """Channel bandwidths (MHz) defined for the SCS in the range"""
+    return sorted(_table(scs_khz, frequency_range))
+
+
+def max_transmission_bandwidth(bandwidth_mhz, scs_khz, frequency_range='FR1'):
+    """N_RB for a channel bandwidth and SCS; ValueError if the table has none"""
+    table = _table(scs_khz, frequency_range)
+    if bandwidth_mhz not in table:
+        raise ValueError(f"{bandwidth_mhz} MHz is not defined for {scs_khz} kHz SCS in "
+                         f"{frequency_range}; valid: {sorted(table)}")
+    return table[bandwidth_mhz]
+
+
+def minimum_guardband_khz(bandwidth_mhz, scs_khz, frequency_range='FR1'):
+    """Minimum guardband per side, (BW - N_RB * 12 * SCS) / 2 - SCS / 2"""
+    n_rb = max_transmission_bandwidth(bandwidth_mhz, scs_khz, frequency_range)
+    return (1000 * bandwidth_mhz - n_rb * SUBCARRIERS_PER_RB * scs_khz) / 2 - scs_khz / 2
+
+
+def spectrum_utilization(bandwidth_mhz, scs_khz, frequency_range='FR1'):
+    """Fraction of the channel bandwidth occupied by the N_RB resource blocks"""
+    n_rb = max_transmission_bandwidth(bandwidth_mhz, scs_khz, frequency_range)
+    return n_rb * SUBCARRIERS_PER_RB * scs_khz / (1000 * bandwidth_mhz)
+
+
+def _table(scs_khz, frequency_range):
+    if frequency_range not in NRB_TABLES:
+        raise ValueError(f"Frequency range must be one of {list(NRB_TABLES)}")
+    tables = NRB_TABLES[frequency_range]
+    if scs_khz not in tables:
+        raise ValueError(f"{scs_khz} kHz SCS has no N_RB table in {frequency_range}; "
+                         f"valid: {sorted(tables)}")
+    return tables[scs_khz]
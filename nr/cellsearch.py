@@ -0,0 +1,191 @@
+"""Streaming PSS/SSS cell search on time-domain IQ (TS 38.211 Section 7.4.2).
+
+``PssCorrelator`` matches an IQ stream, fed in chunks of any length,
+against the time-domain PSS of the three N_ID2 with overlap-save FFT
+correlation: the stream is cut into blocks of ``block_size`` samples that
+overlap by the replica length minus one, each block is transformed once and
+multiplied by the three conjugate replica spectra, and the first
+``block_size - N + 1`` outputs of every inverse FFT are kept. Outputs are
+normalized by the window energy, so the metric lies in [0, 1] whatever the
+gain. ``cell_search`` picks PSS peaks above a threshold, equalizes the SSS
+two symbols later with the PSS channel estimate and scores it against the
+336 N_ID1 candidates with one product against the SSS table.
+
+The IQ is taken to be frequency-synchronized, sampled at ``fft_size * scs``
+and centered on the SSB.
+"""
+
+from functools import lru_cache
+
+import numpy as np
+import scipy.fft
+from numpy.lib.stride_tricks import sliding_window_view
+
+from nr.ofdm import cp_samples, modulate, subcarrier_bins
+from nr.sync import (NUM_NID1, NUM_NID2, SEQUENCE_LENGTH, SSB_SUBCARRIERS, SYNC_SUBCARRIERS, pss_table,
+                     sss_table, ssb_sync_values)
+from nr.timing import MU_BY_SCS
+
+# SSB symbol 0 is never the first symbol of a half subframe, so the SSB has normal CPs
+SSB_FIRST_SYMBOL = 2
+SSS_SYMBOL = 2
+
+
+@lru_cache(maxsize=16)
+def pss_replicas(scs_khz, fft_size):
+    """(3, fft_size) complex64 useful part of the PSS symbol for N_ID2 = 0, 1, 2 (read-only)"""
+    symbols = np.zeros((NUM_NID2, 1, SSB_SUBCARRIERS), dtype=np.complex64)
+    symbols[:, 0, SYNC_SUBCARRIERS] = pss_table()
+    replicas = np.ascontiguousarray(modulate(symbols, scs_khz, fft_size, SSB_FIRST_SYMBOL)[:, -fft_size:])
+    replicas.setflags(write=False)
+    return replicas
+
+
+def ssb_waveform(pci, scs_khz=30, fft_size=256):
+    """complex64 IQ of the four SSB symbols carrying only PSS and SSS, one row per PCI"""
+    return modulate(ssb_sync_values(pci), scs_khz, fft_size, SSB_FIRST_SYMBOL)
+
+
+class PssCorrelator:
+    """Overlap-save correlator of an IQ stream against the three PSS replicas.
+
+    ``process`` can be called with chunks of any length; samples that do not
+    yet fill a block are kept for the next call. Memory per call is a few
+    (3, blocks, block_size) complex64 arrays, so it grows with the chunk.
+    """
+
+    def __init__(self, scs_khz=30, fft_size=256, block_size=1024):
+        if block_size <= fft_size:
+            raise ValueError(f"Block size must exceed the {fft_size}-sample PSS replica")
+        replicas = pss_replicas(scs_khz, fft_size)
+        self.scs_khz = scs_khz
+        self.fft_size = fft_size
+        self.block_size = block_size
+        self.step = block_size - fft_size + 1
+        self.position = 0  # stream index of the first sample not yet correlated
+        self._kernels = np.conj(scipy.fft.fft(replicas, n=block_size, axis=-1))[:, None, :]
+        self._replica_energy = float(np.vdot(replicas[0], replicas[0]).real)
+        self._pending = np.zeros(0, dtype=np.complex64)
+
+    def process(self, chunk):
+        """Correlate one more chunk.
+
+        Returns ``(start, metric)``: ``metric`` is a (3, n) float32 array of
+        normalized correlation power for N_ID2 = 0, 1, 2 at stream indices
+        ``start .. start + n - 1`` (n may be 0 for short chunks).
+        """
+        buffer = np.concatenate([self._pending, np.asarray(chunk, dtype=np.complex64)])
+        num_blocks = max(0, (buffer.size - self.fft_size + 1) // self.step)
+        num_outputs = num_blocks * self.step
+        start = self.position
+        if num_blocks == 0:
+            self._pending = buffer
+            return start, np.zeros((NUM_NID2, 0), dtype=np.float32)
+
+        blocks = sliding_window_view(buffer, self.block_size)[::self.step][:num_blocks]
+        spectra = scipy.fft.fft(blocks, axis=-1, workers=-1)
+        corr = scipy.fft.ifft(spectra[None] * self._kernels, axis=-1, overwrite_x=True, workers=-1)
+        power = np.abs(corr[..., :self.step]).reshape(NUM_NID2, num_outputs)**2
+
+        # Window energy from a running sum, one window per output
+        energy = np.concatenate(([0], np.cumsum(np.abs(buffer[:num_outputs + self.fft_size - 1])**2,
+                                                 dtype=np.float64)))
+        window = energy[self.fft_size:] - energy[:num_outputs]
+        metric = (power / np.maximum(window * self._replica_energy, np.finfo(np.float32).tiny))
+        metric = metric.astype(np.float32)
+
+        self._pending = buffer[num_outputs:]
+        self.position += num_outputs
+        return start, metric
+
+
+def detect_sss(pss_bodies, sss_bodies, nid2):
+    """(N_ID1, metric) of SSSs from the useful samples of their PSS and SSS symbols.
+
+    ``pss_bodies`` and ``sss_bodies`` are (detections, N_FFT) arrays and
+    ``nid2`` the detected N_ID2 of each row. The PSS gives a per-subcarrier
+    channel estimate, and the equalized SSS is scored against all 336 N_ID1
+    candidates; the metric is the best score over its Cauchy-Schwarz bound.
+    """
+    pss_bodies = np.atleast_2d(pss_bodies)
+    sss_bodies = np.atleast_2d(sss_bodies)
+    nid2 = np.atleast_1d(nid2)
+    bins = subcarrier_bins(SSB_SUBCARRIERS, pss_bodies.shape[-1])[SYNC_SUBCARRIERS]
+    y_pss = scipy.fft.fft(pss_bodies, axis=-1)[:, bins]
+    y_sss = scipy.fft.fft(sss_bodies, axis=-1)[:, bins]
+
+    channel = y_pss * pss_table()[nid2]
+    z = y_sss * np.conj(channel)
+    # (N_ID2, N_ID1, n) view of the SSS table, gathered per detection
+    candidates = sss_table().reshape(NUM_NID1, NUM_NID2, SEQUENCE_LENGTH).transpose(1, 0, 2)[nid2]
+    scores = np.einsum('dkn,dn->dk', candidates, z).real
+    nid1 = np.argmax(scores, axis=1)
+    bound = np.sqrt(SEQUENCE_LENGTH) * np.linalg.norm(z, axis=1)
+    metric = scores[np.arange(nid1.size), nid1] / np.maximum(bound, np.finfo(np.float32).tiny)
+    return nid1, metric
+
+
+def _peaks(metric, threshold):
+    """(nid2, index) of interior local maxima above ``threshold`` in a (3, n) metric"""
+    inner = metric[:, 1:-1]
+    peak = (inner > threshold) & (inner >= metric[:, :-2]) & (inner > metric[:, 2:])
+    nid2, index = np.nonzero(peak)
+    return nid2, index + 1
+
+
+def cell_search(chunks, scs_khz=30, fft_size=256, block_size=1024, threshold=0.15):
+    """Cells in an IQ stream given as an iterable of chunks.
+
+    Returns a dict of arrays with one entry per detected SSB: 'sample'
+    (stream index of the useful part of the PSS symbol), 'pci', 'nid2',
+    'pss_metric' and 'sss_metric'. Raw samples are kept only until the SSS
+    of every pending PSS peak has arrived; peaks whose SSS falls past the
+    end of the stream are dropped.
+    """
+    if scs_khz not in MU_BY_SCS:
+        raise ValueError(f"Unsupported subcarrier spacing: {scs_khz} kHz")
+    correlator = PssCorrelator(scs_khz, fft_size, block_size)
+    cp = cp_samples(MU_BY_SCS[scs_khz], fft_size)[SSB_FIRST_SYMBOL]
+    sss_offset = SSS_SYMBOL * (fft_size + cp)
+
+    history = np.zeros(0, dtype=np.complex64)
+    history_start = 0
+    tail = np.zeros((NUM_NID2, 0), dtype=np.float32)
+    pending = {'sample': [], 'nid2': [], 'pss_metric': []}
+    found = {key: [] for key in ('sample', 'pci', 'nid2', 'pss_metric', 'sss_metric')}
+
+    for chunk in chunks:
+        history = np.concatenate([history, np.asarray(chunk, dtype=np.complex64)])
+        start, metric = correlator.process(chunk)
+
+        # Peaks need both neighbors, so the last two outputs wait for the next chunk
+        metric = np.concatenate([tail, metric], axis=1)
+        start -= tail.shape[1]
+        nid2, index = _peaks(metric, threshold)
+        pending['sample'].append(start + index)
+        pending['nid2'].append(nid2)
+        pending['pss_metric'].append(metric[nid2, index])
+        tail = metric[:, -2:]
+
+        samples = np.concatenate(pending['sample'])
+        nid2 = np.concatenate(pending['nid2'])
+        pss_metric = np.concatenate(pending['pss_metric'])
+        ready = samples + sss_offset + fft_size <= history_start + history.size
+        if ready.any():
+            offset = samples[ready] - history_start
+            window = np.arange(fft_size)
+            nid1, sss_metric = detect_sss(history[offset[:, None] + window],
+                                          history[offset[:, None] + sss_offset + window], nid2[ready])
+            found['sample'].append(samples[ready])
+            found['pci'].append(NUM_NID2 * nid1 + nid2[ready])
+            found['nid2'].append(nid2[ready])
+            found['pss_metric'].append(pss_metric[ready])
+            found['sss_metric'].append(sss_metric)
+        pending = {'sample': [samples[~ready]], 'nid2': [nid2[~ready]], 'pss_metric': [pss_metric[~ready]]}
+
+        # Keep raw samples from the earliest PSS that may still need them
+        keep_from = min([start + metric.shape[1] - tail.shape[1]] + list(samples[~ready]))
+        history = history[keep_from - history_start:]
+        history_start = keep_from
+
+    return {key: np.concatenate(values) if values else np.zeros(0) for key, values in found.items()}
@@ -0,0 +1,266 @@
+"""CSI-RS resource mapping per TS 38.211 Section 7.4.1.5.3.
+
+Each row of Table 7.4.1.5.3-1 is stored as its CDM-group locations
+(k index, k offset, l0/l1 selector, l offset) plus the CDM type's
+(k', l') spread. A resource's REs within one RB are the broadcast sum of
+the two, the RB pattern is tiled over the scheduled RBs with one
+fancy-indexed write, and periodic expansion over the SFN cycle is plain
+``arange`` arithmetic on slot indices.
+"""
+
+from dataclasses import dataclass
+from functools import lru_cache
+
+import numpy as np
+
+from nr.gold import rs_sequence
+from nr.grid import CSIRS, SUBCARRIERS_PER_RB
+from nr.timing import MU_BY_SCS, SFN_CYCLE
+
+SYMBOLS_PER_SLOT = 14
+
+# CSI-ResourcePeriodicityAndOffset, in slots
+PERIODICITIES_SLOTS = (4, 5, 8, 10, 16, 20, 32, 40, 64, 80, 160, 320, 640)
+
+# cdm-Type -> (k' values, l' values); CDM group size is their product
+CDM_TYPES = {
+    'noCDM': ((0,), (0,)),
+    'fd-CDM2': ((0, 1), (0,)),
+    'cdm4-FD2-TD2': ((0, 1), (0, 1)),
+    'cdm8-FD2-TD4': ((0, 1), (0, 1, 2, 3)),
+}
+
+
+def _grid_locations(k_count, l_starts):
+    """Locations (k index, 0, l selector, l offset, j) for k-major rows, j counting up"""
+    locations = [(k, 0, l_sel, l_ofs) for l_sel, l_ofs in l_starts for k in range(k_count)]
+    return tuple(loc + (j,) for j, loc in enumerate(locations))
+
+
+# Table 7.4.1.5.3-1: row -> (ports, densities, cdm-Type, bitmap bits, k step,
+# locations as (k_i index, k offset, 0 for l0 / 1 for l1, l offset, CDM group j))
+CSI_RS_ROWS = {
+    1: (1, (3,), 'noCDM', 4, 1, ((0, 0, 0, 0, 0), (0, 4, 0, 0, 0), (0, 8, 0, 0, 0))),
+    2: (1, (1, 0.5), 'noCDM', 12, 1, ((0, 0, 0, 0, 0),)),
+    3: (2, (1, 0.5), 'fd-CDM2', 6, 2, ((0, 0, 0, 0, 0),)),
+    4: (4, (1,), 'fd-CDM2', 3, 4, ((0, 0, 0, 0, 0), (0, 2, 0, 0, 1))),
+    5: (4, (1,), 'fd-CDM2', 6, 2, ((0, 0, 0, 0, 0), (0, 0, 0, 1, 1))),
+    6: (8, (1,), 'fd-CDM2', 6, 2, _grid_locations(4, [(0, 0)])),
+    7: (8, (1,), 'fd-CDM2', 6, 2, _grid_locations(2, [(0, 0), (0, 1)])),
+    8: (8, (1,), 'cdm4-FD2-TD2', 6, 2, _grid_locations(2, [(0, 0)])),
+    9: (12, (1,), 'fd-CDM2', 6, 2, _grid_locations(6, [(0, 0)])),
+    10: (12, (1,), 'cdm4-FD2-TD2', 6, 2, _grid_locations(3, [(0, 0)])),
+    11: (16, (1, 0.5), 'fd-CDM2', 6, 2, _grid_locations(4, [(0, 0), (0, 1)])),
+    12: (16, (1, 0.5), 'cdm4-FD2-TD2', 6, 2, _grid_locations(4, [(0, 0)])),
+    13: (24, (1, 0.5), 'fd-CDM2', 6, 2, _grid_locations(3, [(0, 0), (0, 1), (1, 0), (1, 1)])),
+    14: (24, (1, 0.5), 'cdm4-FD2-TD2', 6, 2, _grid_locations(3, [(0, 0), (1, 0)])),
+    15: (24, (1, 0.5), 'cdm8-FD2-TD4', 6, 2, _grid_locations(3, [(0, 0)])),
+    16: (32, (1, 0.5), 'fd-CDM2', 6, 2, _grid_locations(4, [(0, 0), (0, 1), (1, 0), (1, 1)])),
+    17: (32, (1, 0.5), 'cdm4-FD2-TD2', 6, 2, _grid_locations(4, [(0, 0), (1, 0)])),
+    18: (32, (1, 0.5), 'cdm8-FD2-TD4', 6, 2, _grid_locations(4, [(0, 0)])),
+}
+
+
+def rows_for_ports(ports):
+    """Table rows defining a resource with the given number of ports"""
+    return [row for row, spec in CSI_RS_ROWS.items() if spec[0] == ports]
+
+
+def required_bits(row):
+    """Number of frequencyDomainAllocation bits that must be set for a row"""
+    return max(loc[0] for loc in CSI_RS_ROWS[row][5]) + 1
+
+
+def uses_l1(row):
+    return any(loc[2] == 1 for loc in CSI_RS_ROWS[row][5])
+
+
+def frequency_positions(row, bitmap):
+    """k_0, k_1, ... from frequencyDomainAllocation (an int; bit i is b_i)"""
+    _, _, _, num_bits, k_step, _ = CSI_RS_ROWS[row]
+    if not 0 <= bitmap < 2**num_bits:
+        raise ValueError(f"Row {row} takes a {num_bits}-bit frequencyDomainAllocation")
+    bits = np.flatnonzero((bitmap >> np.arange(num_bits)) & 1)
+    if bits.size != required_bits(row):
+        raise ValueError(f"Row {row} needs exactly {required_bits(row)} bits set, got {bits.size}")
+    return k_step * bits
+
+
+@dataclass(frozen=True)
+class CsiRsConfig:
+    """Hashable NZP-CSI-RS resource configuration.
+
+    ``density_offset`` picks the even (0) or odd (1) RBs for density 0.5;
+    ``periodicity`` and ``offset`` are in slots.
+    """
+    row: int = 4
+    frequency_bitmap: int = 0b001
+    l0: int = 5
+    l1: int = 9
+    density: float = 1
+    density_offset: int = 0
+    num_rbs: int = 52
+    start_rb: int = 0
+    periodicity: int = 20
+    offset: int = 0
+
+    def __post_init__(self):
+        if self.row not in CSI_RS_ROWS:
+            raise ValueError(f"Row must be 1-{len(CSI_RS_ROWS)}")
+        ports, densities, cdm_type, _, _, _ = CSI_RS_ROWS[self.row]
+        if self.density not in densities:
+            raise ValueError(f"Row {self.row} supports densities {densities}")
+        if self.periodicity not in PERIODICITIES_SLOTS:
+            raise ValueError(f"Periodicity must be one of {PERIODICITIES_SLOTS} slots")
+        if not 0 <= self.offset < self.periodicity:
+            raise ValueError("Slot offset must be below the periodicity")
+        k, l, _, _, _ = rb_pattern(self)
+        if l.max() >= SYMBOLS_PER_SLOT:
+            raise ValueError("CSI-RS symbols must lie within the slot")
+        if np.unique(l * SUBCARRIERS_PER_RB + k).size != k.size:
+            raise ValueError("CDM groups overlap; move l1 past the l0 group")
+
+    @property
+    def ports(self):
+        return CSI_RS_ROWS[self.row][0]
+
+    @property
+    def cdm_type(self):
+        return CSI_RS_ROWS[self.row][2]
+
+    @property
+    def cdm_size(self):
+        k_spread, l_spread = CDM_TYPES[self.cdm_type]
+        return len(k_spread) * len(l_spread)
+
+
+def rb_pattern(config):
+    """REs of one RB as arrays (subcarrier in RB, symbol, CDM group j, k', l')"""
+    _, _, cdm_type, _, _, locations = CSI_RS_ROWS[config.row]
+    k_spread, l_spread = CDM_TYPES[cdm_type]
+    k_i = frequency_positions(config.row, config.frequency_bitmap)
+
+    loc = np.asarray(locations)
+    k_bar = k_i[loc[:, 0]] + loc[:, 1]
+    l_bar = np.where(loc[:, 2] == 0, config.l0, config.l1) + loc[:, 3]
+
+    # (CDM group, k', l') -> RE
+    group, k_prime, l_prime = np.broadcast_arrays(
+        loc[:, 4, None, None], np.asarray(k_spread)[None, :, None], np.asarray(l_spread)[None, None, :]
+    )
+    k = k_bar[:, None, None] + k_prime
+    l = l_bar[:, None, None] + l_prime
+    return k.ravel(), l.ravel(), group.ravel(), k_prime.ravel(), l_prime.ravel()
+
+
+def cdm_group_ports(config):
+    """(CDM groups, CDM group size) antenna ports p = 3000 + s + j L of each group"""
+    num_groups = config.ports // config.cdm_size
+    return 3000 + np.arange(num_groups)[:, None] * config.cdm_size + np.arange(config.cdm_size)
+
+
+def symbol_positions(config):
+    """OFDM symbols of the slot carrying the resource"""
+    return np.unique(rb_pattern(config)[1])
+
+
+def scheduled_rbs(config):
+    """RBs carrying the resource, after density 0.5 decimation"""
+    rbs = np.arange(config.start_rb, config.start_rb + config.num_rbs)
+    if config.density == 0.5:
+        rbs = rbs[rbs % 2 == config.density_offset]
+    return rbs
+
+
+def res_per_rb(config):
+    """REs per scheduled RB per occasion (ports x density, density 3 for row 1)"""
+    return rb_pattern(config)[0].size
+
+
+@lru_cache(maxsize=128)
+def slot_grid(config, num_rbs=None):
+    """(14, subcarriers) uint8 grid of CDM group + 1 (0 where no CSI-RS), read-only.
+
+    ``num_rbs`` sizes the carrier (defaults to the end of the allocation).
+    """
+    num_rbs = config.start_rb + config.num_rbs if num_rbs is None else num_rbs
+    k, l, group, _, _ = rb_pattern(config)
+    rbs = scheduled_rbs(config)
+    rbs = rbs[rbs < num_rbs]
+
+    grid = np.zeros((SYMBOLS_PER_SLOT, num_rbs * SUBCARRIERS_PER_RB), dtype=np.uint8)
+    grid[l[None, :], rbs[:, None] * SUBCARRIERS_PER_RB + k[None, :]] = group[None, :] + 1
+    grid.setflags(write=False)
+    return grid
+
+
+def csirs_c_init(slot, symbol, n_id=0):
+    """CSI-RS c_init (TS 38.211 Section 7.4.1.5.2); works elementwise"""
+    slot, symbol = np.asarray(slot, dtype=np.int64), np.asarray(symbol, dtype=np.int64)
+    return (2**10 * (SYMBOLS_PER_SLOT * slot + symbol + 1) * (2 * n_id + 1) + n_id) % 2**31
+
+
+def slot_values(config, slot=0, n_id=0, num_rbs=None):
+    """complex64 r(m') on every RE of the resource, shape ``slot.shape + (14, subcarriers)``.
+
+    ``slot`` may be an array of slot numbers in the frame and ``n_id`` is
+    scramblingID. Values are before the CDM cover codes, i.e. those of the
+    first port of each CDM group.
+    """
+    num_rbs = config.start_rb + config.num_rbs if num_rbs is None else num_rbs
+    slot = np.asarray(slot)
+    k, l, _, k_prime, _ = rb_pattern(config)
+    k_bar = k - k_prime
+    rbs = scheduled_rbs(config)
+    rbs = rbs[rbs < num_rbs]
+
+    # m' = floor(n alpha) + k' + floor(k_bar rho / 12), alpha = rho for one port, 2 rho otherwise
+    alpha = config.density if config.ports == 1 else 2 * config.density
+    m = (np.floor(rbs[:, None] * alpha) + k_prime + np.floor(k_bar * config.density / 12)).astype(np.int64)
+    symbols, symbol_index = np.unique(l, return_inverse=True)
+
+    values = np.zeros(slot.shape + (SYMBOLS_PER_SLOT, num_rbs * SUBCARRIERS_PER_RB), dtype=np.complex64)
+    if rbs.size:
+        r = rs_sequence(csirs_c_init(slot[..., None], symbols, n_id), int(m.max()) + 1)
+        values[..., l[None, :], rbs[:, None] * SUBCARRIERS_PER_RB + k[None, :]] = r[..., symbol_index[None, :], m]
+    return values
+
+
+def occasion_slots(config, scs_khz, num_frames=SFN_CYCLE):
+    """Absolute slot indices (from SFN 0) carrying the resource"""
+    total_slots = num_frames * 10 * 2**MU_BY_SCS[scs_khz]
+    return np.arange(config.offset, total_slots, config.periodicity)
+
+
+def overhead(config, scs_khz, carrier_rbs=None, num_frames=SFN_CYCLE):
+    """CSI-RS RE budget over ``num_frames`` frames (the SFN cycle by default).
+
+    Returns a dict with 'occasions', 'res_per_occasion', 'total_res' and
+    'fraction' of all REs of a ``carrier_rbs``-wide carrier.
+    """
+    carrier_rbs = config.start_rb + config.num_rbs if carrier_rbs is None else carrier_rbs
+    occasions = occasion_slots(config, scs_khz, num_frames).size
+    per_occasion = res_per_rb(config) * scheduled_rbs(config).size
+    total_slots = num_frames * 10 * 2**MU_BY_SCS[scs_khz]
+    all_res = total_slots * SYMBOLS_PER_SLOT * carrier_rbs * SUBCARRIERS_PER_RB
+    return {
+        'occasions': occasions,
+        'res_per_occasion': per_occasion,
+        'total_res': occasions * per_occasion,
+        'fraction': occasions * per_occasion / all_res,
+    }
+
+
+def fill_csirs(grid, config, label=CSIRS):
+    """Write every CSI-RS occasion into a ``MultiFrameGrid`` in one assignment"""
+    k, l, _, _, _ = rb_pattern(config)
+    rbs = scheduled_rbs(config)
+    if rbs.size and rbs[-1] >= grid.num_rbs:
+        raise ValueError(f"CSI-RS RBs exceed the grid's {grid.num_rbs} RBs")
+
+    slots = occasion_slots(config, grid.scs_khz, grid.num_frames)
+    frame, slot = np.divmod(slots, grid.slots_per_frame)
+    subcarriers = (rbs[:, None] * SUBCARRIERS_PER_RB + k[None, :]).ravel()
+    symbols = np.broadcast_to(l[None, :], (rbs.size, l.size)).ravel()
+    grid.data[frame[:, None], slot[:, None], symbols[None, :], subcarriers[None, :]] = label
+    return slots.size
@@ -0,0 +1,257 @@
+"""Vectorized PDSCH DMRS masks (TS 38.211 Section 7.4.1.1).
+
+Symbol positions come from precomputed copies of Tables 7.4.1.1.2-3/-4
+(PDSCH mapping type A) and subcarrier patterns from per-RB CDM group
+combs, so single masks and whole batches of configurations are built with
+array indexing and broadcasting instead of Python loops. The QPSK values
+of a mask are taken from ``nr.gold`` sequences for all its slots and
+symbols at once.
+"""
+
+import numpy as np
+
+from nr.gold import rs_sequence
+
+SUBCARRIERS_PER_RB = 12
+SYMBOLS_PER_SLOT = 14
+
+# Maximum number of CDM groups and REs per RB per CDM group, per config type
+MAX_CDM_GROUPS = {1: 2, 2: 3}
+RES_PER_RB_PER_GROUP = {1: 6, 2: 4}
+
+# Highest antenna port for single- and double-symbol DMRS, per config type
+MAX_PORT = {(1, 1): 1003, (1, 2): 1007, (2, 1): 1005, (2, 2): 1011}
+
+# PDSCH mapping type A DMRS positions relative to l0, indexed by duration ld.
+# 'l0' is replaced by dmrs-TypeA-Position (2 or 3). Single-symbol DMRS
+# supports dmrs-AdditionalPosition 0-3, double-symbol DMRS 0-1, and
+# dmrs-AdditionalPosition 3 is only allowed with dmrs-TypeA-Position 2.
+_SINGLE_SYMBOL_POSITIONS = {
+    3: ['l0', 'l0', 'l0', 'l0'],
+    4: ['l0', 'l0', 'l0', 'l0'],
+    5: ['l0', 'l0', 'l0', 'l0'],
+    6: ['l0', 'l0', 'l0', 'l0'],
+    7: ['l0', 'l0', 'l0', 'l0'],
+    8: ['l0', 'l0,7', 'l0,7', 'l0,7'],
+    9: ['l0', 'l0,7', 'l0,7', 'l0,7'],
+    10: ['l0', 'l0,9', 'l0,6,9', 'l0,6,9'],
+    11: ['l0', 'l0,9', 'l0,6,9', 'l0,6,9'],
+    12: ['l0', 'l0,9', 'l0,6,9', 'l0,5,8,11'],
+    13: ['l0', 'l0,11', 'l0,7,11', 'l0,5,8,11'],
+    14: ['l0', 'l0,11', 'l0,7,11', 'l0,5,8,11'],
+}
+
+_DOUBLE_SYMBOL_POSITIONS = {
+    4: ['l0', 'l0'],
+    5: ['l0', 'l0'],
+    6: ['l0', 'l0'],
+    7: ['l0', 'l0'],
+    8: ['l0', 'l0'],
+    9: ['l0', 'l0'],
+    10: ['l0', 'l0,8'],
+    11: ['l0', 'l0,8'],
+    12: ['l0', 'l0,8'],
+    13: ['l0', 'l0,10'],
+    14: ['l0', 'l0,10'],
+}
+
+
+def _build_symbol_table():
+    """Boolean table [max_length-1, l0-2, additional_position, duration, symbol]"""
+    table = np.zeros((2, 2, 4, SYMBOLS_PER_SLOT + 1, SYMBOLS_PER_SLOT), dtype=bool)
+    valid = np.zeros(table.shape[:4], dtype=bool)
+
+    for ml_idx, rows in enumerate((_SINGLE_SYMBOL_POSITIONS, _DOUBLE_SYMBOL_POSITIONS)):
+        for l0 in (2, 3):
+            for duration, entries in rows.items():
+                for add_pos, entry in enumerate(entries):
+                    if add_pos == 3 and l0 != 2:
+                        continue
+                    starts = [l0 if p == 'l0' else int(p) for p in entry.split(',')]
+                    for start in starts:
+                        table[ml_idx, l0 - 2, add_pos, duration, start:start + ml_idx + 1] = True
+                    valid[ml_idx, l0 - 2, add_pos, duration] = True
+
+    table.setflags(write=False)
+    valid.setflags(write=False)
+    return table, valid
+
+
+def _build_comb_table():
+    """CDM group of every subcarrier in an RB, indexed [config_type-1, subcarrier]"""
+    k = np.arange(SUBCARRIERS_PER_RB)
+    table = np.stack([
+        k % 2,         # Type 1: k = 4n + 2k' + delta, delta in {0, 1}
+        (k % 6) // 2,  # Type 2: k = 6n + k' + delta, delta in {0, 2, 4}
+    ]).astype(np.int8)
+    table.setflags(write=False)
+    return table
+
+
+SYMBOL_TABLE, SYMBOL_TABLE_VALID = _build_symbol_table()
+CDM_GROUP_COMB = _build_comb_table()
+# [..., l] = number of DMRS symbols at or after slot symbol l
+_NUM_DMRS_SYMBOLS_FROM = SYMBOL_TABLE[..., ::-1].cumsum(axis=-1)[..., ::-1]
+_RES_PER_RB_PER_GROUP = np.array([0, RES_PER_RB_PER_GROUP[1], RES_PER_RB_PER_GROUP[2]])
+
+
+def cdm_group_of_port(port, config_type=1):
+    """CDM group index of a DMRS antenna port (1000-based numbering)"""
+    return ((np.asarray(port) - 1000) // 2) % MAX_CDM_GROUPS[config_type]
+
+
+def dmrs_symbol_positions(duration=14, typea_position=2, additional_position=0, max_length=1):
+    """DMRS symbol indices within the slot for PDSCH mapping type A"""
+    _validate(1, 1, additional_position, typea_position, duration, max_length)
+    return tuple(np.flatnonzero(
+        SYMBOL_TABLE[max_length - 1, typea_position - 2, additional_position, duration]
+    ).tolist())
+
+
+def dmrs_cdm_group_grid(num_rbs, num_symbols=14, config_type=1, num_cdm_groups=1, ports=(),
+                        additional_position=0, typea_position=2, duration=None, max_length=1,
+                        positions=None):
+    """Label grid (symbols, subcarriers): 0 for non-DMRS, g+1 for CDM group g.
+
+    The marked CDM groups are groups 0..num_cdm_groups-1 (CDM groups
+    without data) plus any group used by ``ports``. ``positions`` overrides
+    the table-driven DMRS symbols with explicit symbol indices.
+    """
+    groups = _groups_in_use(config_type, num_cdm_groups, ports, max_length)
+
+    if positions is None:
+        if duration is None:
+            duration = min(num_symbols, SYMBOLS_PER_SLOT)
+        _validate(config_type, num_cdm_groups, additional_position, typea_position, duration,
+                  max_length)
+        symbol_mask = SYMBOL_TABLE[max_length - 1, typea_position - 2, additional_position,
+                                   duration]
+    else:
+        symbol_mask = np.zeros(SYMBOLS_PER_SLOT, dtype=bool)
+        symbol_mask[[p for p in positions if 0 <= p < SYMBOLS_PER_SLOT]] = True
+
+    comb = CDM_GROUP_COMB[config_type - 1]
+    sc_labels = np.where(np.isin(comb, groups), comb + 1, 0).astype(np.uint8)
+    sc_labels = np.tile(sc_labels, num_rbs)
+
+    rows = np.zeros(num_symbols, dtype=bool)
+    rows[:SYMBOLS_PER_SLOT] = symbol_mask[:num_symbols]
+    return np.where(rows[:, None], sc_labels[None, :], 0).astype(np.uint8)
+
+
+def dmrs_mask(num_rbs, num_symbols=14, config_type=1, num_cdm_groups=1, ports=(),
+              additional_position=0, typea_position=2, duration=None, max_length=1,
+              positions=None):
+    """Boolean DMRS mask (symbols, subcarriers); see ``dmrs_cdm_group_grid``"""
+    return dmrs_cdm_group_grid(
+        num_rbs, num_symbols, config_type, num_cdm_groups, ports, additional_position,
+        typea_position, duration, max_length, positions
+    ) > 0
+
+
+def dmrs_mask_batch(num_rbs, config_type, num_cdm_groups, additional_position,
+                    typea_position=2, duration=14, max_length=1):
+    """Boolean DMRS masks for a batch of slot configurations.
+
+    All configuration arguments are broadcast against each other; the result
+    has shape ``broadcast_shape + (14, num_rbs * 12)``.
+    """
+    config_type, num_cdm_groups, additional_position, typea_position, duration, max_length = \
+        np.broadcast_arrays(config_type, num_cdm_groups, additional_position, typea_position,
+                            duration, max_length)
+    _validate(config_type, num_cdm_groups, additional_position, typea_position, duration,
+              max_length)
+
+    symbol_mask = SYMBOL_TABLE[max_length - 1, typea_position - 2, additional_position, duration]
+    rb_mask = CDM_GROUP_COMB[config_type - 1] < num_cdm_groups[..., None]
+    sc_mask = np.tile(rb_mask, num_rbs)
+
+    return symbol_mask[..., :, None] & sc_mask[..., None, :]
+
+
+def dmrs_re_count_batch(num_rbs, config_type, num_cdm_groups, additional_position,
+                        typea_position=2, duration=14, max_length=1, first_symbol=0):
+    """DMRS RE counts per slot for a batch of configurations, without building masks.
+
+    Only DMRS symbols at or after ``first_symbol`` are counted.
+    """
+    (config_type, num_cdm_groups, additional_position, typea_position, duration, max_length,
+     first_symbol) = np.broadcast_arrays(config_type, num_cdm_groups, additional_position,
+                                         typea_position, duration, max_length, first_symbol)
+    _validate(config_type, num_cdm_groups, additional_position, typea_position, duration,
+              max_length)
+
+    num_dmrs_symbols = _NUM_DMRS_SYMBOLS_FROM[
+        max_length - 1, typea_position - 2, additional_position, duration, first_symbol
+    ]
+    res_per_rb = _RES_PER_RB_PER_GROUP[config_type] * num_cdm_groups
+    return num_dmrs_symbols.astype(np.int64) * res_per_rb * np.asarray(num_rbs)
+
+
+def dmrs_c_init(slot, symbol, n_id=0, n_scid=0):
+    """PDSCH DMRS c_init (TS 38.211 Section 7.4.1.1.1); works elementwise"""
+    slot, symbol = np.asarray(slot, dtype=np.int64), np.asarray(symbol, dtype=np.int64)
+    return (2**17 * (SYMBOLS_PER_SLOT * slot + symbol + 1) * (2 * n_id + 1) + 2 * n_id + n_scid) % 2**31
+
+
+def dmrs_values(dmrs_grid, config_type=1, slot=0, n_id=0, n_scid=0):
+    """complex64 QPSK r(m) on the DMRS REs of a label grid, 0 elsewhere.
+
+    ``dmrs_grid`` is a (symbols, subcarriers) grid such as
+    ``dmrs_cdm_group_grid`` whose subcarrier 0 is in common RB 0. ``slot``
+    may be an array of slot numbers in the frame; the result has shape
+    ``slot.shape + dmrs_grid.shape`` and all sequences come from one
+    batched Gold-sequence call. Values are r(m) before the w_f / w_t cover
+    codes, i.e. those of the first port of each CDM group.
+    """
+    dmrs_grid = np.asarray(dmrs_grid)
+    slot = np.asarray(slot)
+    k = np.arange(dmrs_grid.shape[1])
+    # Type 1: k = 4n + 2k' + delta, type 2: k = 6n + k' + delta, both with m = 2n + k'
+    m = k // 2 if config_type == 1 else 2 * (k // 6) + (k % 6) % 2
+    rows = np.flatnonzero(dmrs_grid.any(axis=1))
+
+    values = np.zeros(slot.shape + dmrs_grid.shape, dtype=np.complex64)
+    if rows.size:
+        r = rs_sequence(dmrs_c_init(slot[..., None], rows % SYMBOLS_PER_SLOT, n_id, n_scid), int(m[-1]) + 1)
+        values[..., rows, :] = np.where(dmrs_grid[rows] > 0, r[..., m], 0)
+    return values
+
+
+def _groups_in_use(config_type, num_cdm_groups, ports, max_length):
+    ports = np.asarray(ports, dtype=int)
+    if ports.size and (ports.min() < 1000 or ports.max() > MAX_PORT[(config_type, max_length)]):
+        raise ValueError(
+            f"DMRS ports must be in 1000..{MAX_PORT[(config_type, max_length)]} for "
+            f"configuration type {config_type} with maxLength {max_length}"
+        )
+    port_groups = cdm_group_of_port(ports, config_type) if ports.size else []
+    return np.union1d(np.arange(num_cdm_groups), port_groups)
+
+
+def _validate(config_type, num_cdm_groups, additional_position, typea_position, duration,
+              max_length):
+    config_type = np.asarray(config_type)
+    num_cdm_groups = np.asarray(num_cdm_groups)
+    additional_position = np.asarray(additional_position)
+    typea_position = np.asarray(typea_position)
+    duration = np.asarray(duration)
+    max_length = np.asarray(max_length)
+
+    if np.any((config_type != 1) & (config_type != 2)):
+        raise ValueError("DMRS configuration type must be 1 or 2")
+    if np.any((num_cdm_groups < 1) | (num_cdm_groups > np.where(config_type == 1, 2, 3))):
+        raise ValueError("Number of CDM groups must be 1-2 for type 1 and 1-3 for type 2")
+    if np.any((typea_position != 2) & (typea_position != 3)):
+        raise ValueError("dmrs-TypeA-Position must be 2 or 3")
+    if np.any((max_length != 1) & (max_length != 2)):
+        raise ValueError("DMRS maxLength must be 1 or 2")
+    if np.any((additional_position < 0) | (additional_position > 3)
+              | (duration < 0) | (duration > SYMBOLS_PER_SLOT)):
+        raise ValueError("dmrs-AdditionalPosition must be 0-3 and duration 0-14 symbols")
+    if not np.all(SYMBOL_TABLE_VALID[max_length - 1, typea_position - 2, additional_position,
+                                     duration]):
+        raise ValueError(
+            "Unsupported DMRS combination: check duration, dmrs-AdditionalPosition "
+            "(0-1 for double-symbol DMRS) and dmrs-TypeA-Position"
+        )
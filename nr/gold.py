@@ -0,0 +1,86 @@
+"""Length-31 Gold sequences c(n) and QPSK reference-signal values (TS 38.211 Section 5.2.1).
+
+c(n) = x1(n + Nc) + x2(n + Nc) mod 2, where x1 has a fixed initial state
+and x2 starts from the 31 bits of c_init. Both shift registers are run
+28 outputs at a time, since each feedback tap reaches back at least 28
+positions. x2 is linear in its initial state, so the x2 outputs of the 31
+unit states are computed once per length and cached; the sequences for a
+whole batch of seeds are then one matrix product of their c_init bits
+with that basis, taken mod 2.
+"""
+
+from functools import lru_cache
+
+import numpy as np
+
+NC = 1600
+SEED_BITS = 31
+
+# Feedback taps: x(n + 31) = sum of x(n + t) mod 2
+X1_TAPS = (0, 3)
+X2_TAPS = (0, 1, 2, 3)
+
+
+def _shift_register(state, taps, length):
+    """Outputs Nc .. Nc + length - 1 of a 31-stage register for (..., 31) initial states"""
+    state = np.asarray(state, dtype=np.uint8)
+    total = max(NC + length, SEED_BITS)
+    x = np.zeros(state.shape[:-1] + (total + SEED_BITS - max(taps),), dtype=np.uint8)
+    x[..., :SEED_BITS] = state
+    step = SEED_BITS - max(taps)
+    for n in range(0, total - SEED_BITS, step):
+        feedback = x[..., n + taps[0]:n + taps[0] + step].copy()
+        for t in taps[1:]:
+            feedback ^= x[..., n + t:n + t + step]
+        x[..., n + SEED_BITS:n + SEED_BITS + step] = feedback
+    return x[..., NC:NC + length]
+
+
+@lru_cache(maxsize=16)
+def _x1(length):
+    state = np.zeros(SEED_BITS, dtype=np.uint8)
+    state[0] = 1
+    x1 = _shift_register(state, X1_TAPS, length)
+    x1.setflags(write=False)
+    return x1
+
+
+@lru_cache(maxsize=16)
+def _x2_basis(length):
+    """(31, length) float32 x2 outputs of each unit initial state"""
+    basis = _shift_register(np.eye(SEED_BITS, dtype=np.uint8), X2_TAPS, length).astype(np.float32)
+    basis.setflags(write=False)
+    return basis
+
+
+def gold_sequence(c_init, length):
+    """(..., length) uint8 c(n) for an array of c_init seeds, each distinct seed computed once"""
+    c_init = np.asarray(c_init, dtype=np.int64)
+    if c_init.size and (c_init.min() < 0 or c_init.max() >= 2**SEED_BITS):
+        raise ValueError(f"c_init must be 0 .. 2^{SEED_BITS} - 1")
+    seeds, inverse = np.unique(c_init, return_inverse=True)
+    bits = ((seeds[:, None] >> np.arange(SEED_BITS)) & 1).astype(np.float32)
+    c = (bits @ _x2_basis(length)).astype(np.uint8) & 1
+    c ^= _x1(length)
+    return c[inverse.ravel()].reshape(c_init.shape + (length,))
+
+
+@lru_cache(maxsize=1024)
+def cached_gold_sequence(c_init, length):
+    """``gold_sequence`` for an int or a tuple of seeds, memoized and read-only"""
+    c = gold_sequence(c_init, length)
+    c.setflags(write=False)
+    return c
+
+
+def qpsk(c):
+    """complex64 r(m) = ((1 - 2 c(2m)) + j (1 - 2 c(2m + 1))) / sqrt(2) along the last axis"""
+    c = np.asarray(c, dtype=np.float32)
+    values = ((1 - 2 * c[..., 0::2]) + 1j * (1 - 2 * c[..., 1::2])).astype(np.complex64)
+    values *= np.float32(np.sqrt(0.5))
+    return values
+
+
+def rs_sequence(c_init, length):
+    """(..., length) complex64 QPSK reference-signal sequence for an array of seeds"""
+    return qpsk(gold_sequence(c_init, 2 * length))
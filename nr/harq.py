@@ -0,0 +1,172 @@
+"""HARQ-ACK feedback timing on a semi-static TDD pattern.
+
+For every slot that starts with DL symbols, the PDSCH is taken to fill the
+slot's leading DL symbols and its HARQ-ACK goes on the first PUCCH that
+(TS 38.213 Section 9.2.3, TS 38.214 Section 5.3):
+
+- lies in slot n + K1 for a K1 from the configured dl-DataToUL-ACK set,
+- covers ``pucch_symbols`` consecutive UL symbols of that slot, and
+- starts at least T_proc,1 = N1 (2048 + 144) kappa 2^-mu Tc after the
+  PDSCH ends.
+
+All times are integer Tc, and the search runs over (DL slot, K1, symbol)
+at once with array operations. Packet latencies are then Monte Carlo
+samples: uniform arrivals are mapped to the next usable DL slot with
+``searchsorted``.
+"""
+
+from functools import lru_cache
+
+import numpy as np
+
+from nr.slot_format import DL, UL
+from nr.tdd import PATTERN_SPAN_MS, SYMBOLS_PER_SLOT, cycle_directions
+from nr.timing import KAPPA, TC_PER_MS, TC_PER_SUBFRAME, subframe_symbol_table
+
+# UE PDSCH processing time N1 in symbols per mu: (dmrs-AdditionalPosition pos0, otherwise)
+# Capability 1 is TS 38.214 Table 5.3-1, capability 2 Table 5.3-2 (mu 0-2 only).
+N1_SYMBOLS = {
+    1: {0: (8, 13), 1: (10, 13), 2: (17, 20), 3: (20, 24)},
+    2: {0: (3, 3), 1: (4.5, 4.5), 2: (9, 9)},
+}
+
+# dl-DataToUL-ACK default when the set is not configured
+DEFAULT_K1 = (1, 2, 3, 4, 5, 6, 7, 8)
+
+
+def processing_time_tc(mu, capability=1, additional_dmrs=False):
+    """T_proc,1 in Tc (d_1,1 = 0: mapping type A with 7 or more symbols)"""
+    if mu not in N1_SYMBOLS[capability]:
+        raise ValueError(f"UE capability {capability} has no N1 for mu={mu}")
+    n1 = N1_SYMBOLS[capability][mu][additional_dmrs]
+    # N1 may be 4.5 symbols, so scale by 2 before the integer shift
+    return int(2 * n1) * (2048 + 144) * KAPPA >> (mu + 1)
+
+
+def _symbol_edges(mu, num_slots):
+    """(start, end) Tc of every symbol in ``num_slots`` slots from a subframe boundary"""
+    table = subframe_symbol_table(mu)
+    per_subframe = table['start'].size
+    index = np.arange(num_slots * SYMBOLS_PER_SLOT)
+    subframe, symbol = np.divmod(index, per_subframe)
+    start = subframe * TC_PER_SUBFRAME + table['start'][symbol]
+    return start, start + table['length'][symbol]
+
+
+@lru_cache(maxsize=64)
+def harq_feedback(config, k1_set=DEFAULT_K1, capability=1, additional_dmrs=False, pucch_symbols=1):
+    """HARQ-ACK timing of every DL slot in one 20 ms span of the pattern.
+
+    Returns a dict of read-only arrays indexed by DL slot: 'slot',
+    'slot_start' (Tc), 'pdsch_end' (Tc), 'k1', 'ack_slot', 'ack_symbol',
+    'ack_end' (Tc) and 'feasible'; infeasible slots have k1 = -1.
+    """
+    k1_set = np.array(sorted(set(k1_set)))
+    if k1_set.size == 0 or k1_set.min() < 0:
+        raise ValueError("K1 set must hold non-negative slot offsets")
+    if not 1 <= pucch_symbols <= SYMBOLS_PER_SLOT:
+        raise ValueError(f"PUCCH length must be 1-{SYMBOLS_PER_SLOT} symbols")
+
+    mu = config.mu
+    t_proc = processing_time_tc(mu, capability, additional_dmrs)
+    span_slots = PATTERN_SPAN_MS * 2**mu
+    # A second span covers PUCCHs of the last DL slots; periods divide 20 ms
+    directions = cycle_directions(config, num_frames=2 * PATTERN_SPAN_MS // 10)
+    start, end = _symbol_edges(mu, directions.shape[0])
+    start = start.reshape(-1, SYMBOLS_PER_SLOT)
+
+    # PUCCH can start at symbol j of a slot if j..j+L-1 are all UL
+    ul_run = np.cumsum(np.pad(directions == UL, ((0, 0), (1, 0))), axis=1)
+    window = np.zeros(directions.shape, dtype=bool)
+    window[:, :SYMBOLS_PER_SLOT - pucch_symbols + 1] = (
+        ul_run[:, pucch_symbols:] - ul_run[:, :-pucch_symbols] == pucch_symbols)
+
+    # PDSCH in slots that start with DL, over their leading DL symbols
+    dl_slots = np.flatnonzero(directions[:span_slots, 0] == DL)
+    leading = np.where((directions[dl_slots] != DL).any(axis=1),
+                       np.argmax(directions[dl_slots] != DL, axis=1), SYMBOLS_PER_SLOT)
+    pdsch_end = end[dl_slots * SYMBOLS_PER_SLOT + leading - 1]
+
+    # (DL slot, K1, symbol) candidates; the first feasible K1 and symbol win
+    # n + K1 past the end of the cycle is infeasible; clipping only keeps the indexing valid
+    ack_slot = dl_slots[:, None] + k1_set[None, :]
+    in_range = ack_slot < directions.shape[0]
+    ack_slot = np.minimum(ack_slot, directions.shape[0] - 1)
+    ok = (window[ack_slot] & (start[ack_slot] >= (pdsch_end + t_proc)[:, None, None])
+          & in_range[:, :, None])
+    k1_ok = ok.any(axis=2)
+    feasible = k1_ok.any(axis=1)
+    k1_index = np.argmax(k1_ok, axis=1)
+    rows = np.arange(dl_slots.size)
+    ack_symbol = np.argmax(ok[rows, k1_index], axis=1)
+    ack_slot = ack_slot[rows, k1_index]
+    ack_end = end[ack_slot * SYMBOLS_PER_SLOT + ack_symbol + pucch_symbols - 1]
+
+    result = {
+        'slot': dl_slots,
+        'slot_start': start[dl_slots, 0],
+        'pdsch_end': pdsch_end,
+        'k1': np.where(feasible, k1_set[k1_index], -1),
+        'ack_slot': np.where(feasible, ack_slot, -1),
+        'ack_symbol': np.where(feasible, ack_symbol, -1),
+        'ack_end': np.where(feasible, ack_end, -1),
+        'feasible': feasible,
+    }
+    for arr in result.values():
+        arr.setflags(write=False)
+    return result
+
+
+def latency_samples(config, num_packets=100000, seed=0, scheduling_delay_tc=0, **harq_kwargs):
+    """Monte Carlo arrival-to-HARQ-ACK latencies in Tc (int64).
+
+    Packets arrive uniformly over a 20 ms span and go out in the first DL
+    slot with feasible feedback that starts ``scheduling_delay_tc`` or more
+    after the arrival. ``harq_kwargs`` are passed to ``harq_feedback``.
+    """
+    feedback = harq_feedback(config, **harq_kwargs)
+    usable = feedback['feasible']
+    if not usable.any():
+        raise ValueError("No DL slot of this pattern has a feasible HARQ-ACK occasion")
+
+    span_tc = PATTERN_SPAN_MS * TC_PER_MS
+    slot_start = feedback['slot_start'][usable]
+    ack_end = feedback['ack_end'][usable]
+    # Arrivals late in the span wrap to the next span's first DL slots
+    slot_start = np.concatenate([slot_start, slot_start + span_tc])
+    ack_end = np.concatenate([ack_end, ack_end + span_tc])
+
+    arrival = np.random.default_rng(seed).integers(0, span_tc, num_packets)
+    index = np.searchsorted(slot_start, arrival + scheduling_delay_tc, side='left')
+    return ack_end[index] - arrival
+
+
+def latency_cdf(samples, num_points=200):
+    """(latency, probability) points of the empirical CDF, at most ``num_points``"""
+    samples = np.sort(np.asarray(samples))
+    probability = np.linspace(0, 1, num_points)
+    index = np.minimum((probability * samples.size).astype(np.int64), samples.size - 1)
+    return samples[index], probability
+
+
+def latency_percentiles(samples, percentiles=(50, 90, 99, 100)):
+    """{percentile: latency} of the samples"""
+    values = np.percentile(samples, percentiles)
+    return dict(zip(percentiles, values))
+
+
+@lru_cache(maxsize=64)
+def latency_profile(config, k1_set=DEFAULT_K1, capability=1, additional_dmrs=False, pucch_symbols=1,
+                    num_packets=100000, seed=0):
+    """Cached latency summary: 'latency' and 'probability' CDF points, 'mean' and 'percentiles' (Tc)"""
+    samples = latency_samples(config, num_packets, seed, k1_set=k1_set, capability=capability,
+                              additional_dmrs=additional_dmrs, pucch_symbols=pucch_symbols)
+    latency, probability = latency_cdf(samples)
+    latency.setflags(write=False)
+    probability.setflags(write=False)
+    return {
+        'latency': latency,
+        'probability': probability,
+        'mean': float(samples.mean()),
+        'percentiles': latency_percentiles(samples),
+    }
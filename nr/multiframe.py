@@ -0,0 +1,140 @@
+"""Multi-frame resource grid indexed by (SFN, slot, symbol, subcarrier).
+
+The grid is backed by an ``np.memmap`` so a full 1024-frame SFN cycle at
+273 PRBs never has to be resident in RAM: slicing returns lazy memmap
+views, and bulk operations walk the SFN axis in bounded chunks.
+"""
+
+import os
+import tempfile
+
+import numpy as np
+
+from nr.grid import CHANNEL_NAMES, SUBCARRIERS_PER_RB
+
+SFN_CYCLE = 1024
+SYMBOLS_PER_SLOT = 14
+MU_BY_SCS = {15: 0, 30: 1, 60: 2, 120: 3, 240: 4}
+
+
+class MultiFrameGrid:
+    """uint8 channel-label grid of shape (frames, slots/frame, 14, subcarriers).
+
+    Without ``path`` the backing file is a temporary file removed by
+    ``close``; with ``path`` an existing file of the right size is reopened
+    with ``mode`` (``'r+'`` by default, ``'w+'`` when it does not exist).
+    """
+
+    def __init__(self, num_rbs=273, scs_khz=30, num_frames=SFN_CYCLE, path=None, mode=None,
+                 chunk_bytes=64 * 2**20):
+        if scs_khz not in MU_BY_SCS:
+            raise ValueError(f"Unsupported subcarrier spacing: {scs_khz} kHz")
+        if not 1 <= num_frames <= SFN_CYCLE:
+            raise ValueError(f"num_frames must be in 1..{SFN_CYCLE}")
+
+        self.num_rbs = num_rbs
+        self.scs_khz = scs_khz
+        self.mu = MU_BY_SCS[scs_khz]
+        self.num_frames = num_frames
+        self.slots_per_frame = 10 * 2**self.mu
+        self.num_subcarriers = num_rbs * SUBCARRIERS_PER_RB
+        self.shape = (num_frames, self.slots_per_frame, SYMBOLS_PER_SLOT, self.num_subcarriers)
+        frame_bytes = self.slots_per_frame * SYMBOLS_PER_SLOT * self.num_subcarriers
+        self.chunk_frames = max(1, chunk_bytes // frame_bytes)
+
+        self._owns_file = path is None
+        if path is None:
+            fd, path = tempfile.mkstemp(prefix='nr_grid_', suffix='.u8')
+            os.close(fd)
+            mode = 'w+'
+        elif mode is None:
+            mode = 'r+' if os.path.exists(path) else 'w+'
+        self.path = path
+        self._data = np.memmap(path, dtype=np.uint8, mode=mode, shape=self.shape)
+
+    @property
+    def nbytes(self):
+        return int(np.prod(self.shape, dtype=np.int64))
+
+    @property
+    def data(self):
+        """The underlying memmap; slices of it are lazy views"""
+        return self._data
+
+    def __getitem__(self, key):
+        return self._data[key]
+
+    def __setitem__(self, key, value):
+        self._data[key] = value
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def flush(self):
+        self._data.flush()
+
+    def close(self):
+        """Flush and release the memmap, deleting it if it was temporary"""
+        if self._data is None:
+            return
+        self._data.flush()
+        # Views handed out earlier keep the mapping alive; unlinking is safe on POSIX
+        self._data = None
+        if self._owns_file and os.path.exists(self.path):
+            os.remove(self.path)
+
+    def iter_chunks(self, sfn_start=0, sfn_stop=None):
+        """Yield (first SFN, memmap view) blocks of at most ``chunk_frames`` frames"""
+        sfn_stop = self.num_frames if sfn_stop is None else sfn_stop
+        for start in range(sfn_start, sfn_stop, self.chunk_frames):
+            stop = min(start + self.chunk_frames, sfn_stop)
+            yield start, self._data[start:stop]
+
+    def fill_slot(self, slot_grid, sfn=slice(None), slot=slice(None)):
+        """Broadcast a single-slot (symbols, subcarriers) label grid into many slots.
+
+        ``slot_grid`` may have fewer than 14 symbols (e.g. a ResourceGridEngine
+        grid); it then fills the leading symbols of each slot.
+        """
+        slot_grid = np.asarray(slot_grid, dtype=np.uint8)
+        if slot_grid.shape[1] != self.num_subcarriers:
+            raise ValueError(
+                f"Slot grid has {slot_grid.shape[1]} subcarriers, expected {self.num_subcarriers}"
+            )
+        num_symbols = slot_grid.shape[0]
+        frames = range(self.num_frames)[sfn] if isinstance(sfn, slice) else np.atleast_1d(sfn)
+
+        # Contiguous frame runs are written with one broadcast assignment per chunk
+        frames = np.asarray(frames)
+        for i in range(0, frames.size, self.chunk_frames):
+            block = frames[i:i + self.chunk_frames]
+            if block.size and np.all(np.diff(block) == 1):
+                self._data[block[0]:block[-1] + 1, slot, :num_symbols] = slot_grid
+            else:
+                for f in block:
+                    self._data[f, slot, :num_symbols] = slot_grid
+
+    def label_counts(self, sfn_start=0, sfn_stop=None):
+        """RE counts per channel label and frame, shape (frames, labels)"""
+        sfn_stop = self.num_frames if sfn_stop is None else sfn_stop
+        counts = np.zeros((sfn_stop - sfn_start, 256), dtype=np.int64)
+
+        for start, block in self.iter_chunks(sfn_start, sfn_stop):
+            for i, frame in enumerate(block):
+                counts[start - sfn_start + i] = np.bincount(frame.ravel(), minlength=256)
+
+        used = np.flatnonzero(counts.any(axis=0))
+        num_labels = max(len(CHANNEL_NAMES), used[-1] + 1 if used.size else 0)
+        return counts[:, :num_labels]
+
+    def slot_index(self, sfn, slot):
+        """Absolute slot index within the grid for (SFN, slot)"""
+        return np.asarray(sfn) * self.slots_per_frame + np.asarray(slot)
+
+    def locate_slot(self, absolute_slot):
+        """(SFN, slot) for absolute slot indices, wrapping over the grid's frames"""
+        absolute_slot = np.asarray(absolute_slot) % (self.num_frames * self.slots_per_frame)
+        return np.divmod(absolute_slot, self.slots_per_frame)
@@ -0,0 +1,147 @@
+"""OFDM modulation of resource grids to time-domain IQ (TS 38.211 Section 5.3.1).
+
+Symbols are modulated in batches: the subcarriers of every symbol in a
+block are placed into one (symbols, N_FFT) complex64 array and transformed
+with a single ``scipy.fft.ifft`` call. The cyclic prefix is then added to
+all of them with one gather, whose index arrays depend only on the block's
+position in the subframe and are cached. The first symbol of every 0.5 ms
+gets the longer CP. ``write_waveform`` streams the blocks of a
+``MultiFrameGrid`` to a file, so the length of a test vector is limited by
+disk and not by RAM.
+"""
+
+from functools import lru_cache
+
+import numpy as np
+import scipy.fft
+
+from nr.grid import EMPTY
+from nr.timing import MU_BY_SCS, subframe_symbol_table, useful_length
+
+MIN_FFT_SIZE = 128
+
+# Output sample formats for write_waveform
+SAMPLE_FORMATS = ('complex64', 'int16')
+
+
+def default_fft_size(num_subcarriers):
+    """Smallest power-of-two FFT leaving at least 20% of the band as guard"""
+    return max(MIN_FFT_SIZE, 1 << int(np.ceil(np.log2(num_subcarriers * 1.2))))
+
+
+def sample_rate_hz(fft_size, scs_khz):
+    return fft_size * scs_khz * 1000
+
+
+@lru_cache(maxsize=None)
+def cp_samples(mu, fft_size):
+    """CP length in samples of every symbol in a subframe (read-only)"""
+    # The normal CP is 144 / 2048 of the useful length, a whole number of samples
+    # only when the FFT size is a multiple of 128
+    if fft_size < MIN_FFT_SIZE or fft_size % MIN_FFT_SIZE:
+        raise ValueError(f"FFT size must be a multiple of {MIN_FFT_SIZE}")
+    cp_tc = subframe_symbol_table(mu)['cp']
+    cp = cp_tc * fft_size // useful_length(mu)
+    cp.setflags(write=False)
+    return cp
+
+
+@lru_cache(maxsize=64)
+def _cp_gather(mu, fft_size, first_symbol, num_symbols):
+    """(symbol, sample) indices turning IFFT outputs into CP + body samples"""
+    cp = cp_samples(mu, fft_size)
+    symbol_cp = cp[(first_symbol + np.arange(num_symbols)) % cp.size]
+    lengths = symbol_cp + fft_size
+    offsets = np.concatenate(([0], np.cumsum(lengths)[:-1]))
+
+    symbol = np.repeat(np.arange(num_symbols), lengths)
+    position = np.arange(lengths.sum()) - offsets[symbol]
+    sample = (position - symbol_cp[symbol]) % fft_size
+    for arr in (symbol, sample):
+        arr.setflags(write=False)
+    return symbol, sample
+
+
+def subcarrier_bins(num_subcarriers, fft_size):
+    """FFT bin of each grid subcarrier, centered on DC (k - N_sc / 2)"""
+    if num_subcarriers > fft_size:
+        raise ValueError(f"{num_subcarriers} subcarriers do not fit in a {fft_size}-point FFT")
+    return (np.arange(num_subcarriers) - num_subcarriers // 2) % fft_size
+
+
+def modulate(symbols, scs_khz, fft_size=None, first_symbol=0):
+    """Time-domain complex64 samples of consecutive OFDM symbols.
+
+    ``symbols`` is a (..., num_symbols, num_subcarriers) array of RE values;
+    leading axes are independent signals (e.g. one per cell) modulated in
+    the same FFT call. ``first_symbol`` is the index of the first symbol
+    within the subframe, which places the long CPs. Samples are scaled so
+    unit-power REs give unit average power.
+    """
+    symbols = np.asarray(symbols)
+    num_symbols, num_subcarriers = symbols.shape[-2:]
+    mu = MU_BY_SCS[scs_khz]
+    fft_size = default_fft_size(num_subcarriers) if fft_size is None else fft_size
+
+    spectrum = np.zeros(symbols.shape[:-1] + (fft_size,), dtype=np.complex64)
+    spectrum[..., subcarrier_bins(num_subcarriers, fft_size)] = symbols
+    body = scipy.fft.ifft(spectrum, axis=-1, norm='forward', overwrite_x=True, workers=-1)
+    body *= np.float32(1 / np.sqrt(num_subcarriers))
+
+    symbol, sample = _cp_gather(mu, fft_size, first_symbol % cp_samples(mu, fft_size).size, num_symbols)
+    return body[..., symbol, sample]
+
+
+def qpsk_symbols(labels, seed=0):
+    """Random unit-power QPSK on every non-empty RE of a label array, 0 elsewhere"""
+    labels = np.asarray(labels)
+    bits = np.random.default_rng(seed).integers(0, 2, size=labels.shape + (2,), dtype=np.int8)
+    values = ((1 - 2 * bits[..., 0]) + 1j * (1 - 2 * bits[..., 1])).astype(np.complex64)
+    values *= np.float32(np.sqrt(0.5))
+    values[labels == EMPTY] = 0
+    return values
+
+
+def grid_waveform_blocks(grid, fft_size=None, frames_per_block=1, seed=0):
+    """Yield complex64 IQ of a ``MultiFrameGrid``, ``frames_per_block`` frames at a time.
+
+    REs are filled with random QPSK wherever the label grid is non-empty.
+    Frames are whole subframes, so every block starts at symbol 0.
+    """
+    fft_size = default_fft_size(grid.num_subcarriers) if fft_size is None else fft_size
+    rng = np.random.default_rng(seed)
+    for start in range(0, grid.num_frames, frames_per_block):
+        labels = grid.data[start:start + frames_per_block]
+        labels = labels.reshape(-1, grid.num_subcarriers)
+        values = qpsk_symbols(labels, seed=rng.integers(2**32))
+        yield modulate(values, grid.scs_khz, fft_size)
+
+
+def write_waveform(path, grid, fft_size=None, sample_format='complex64', frames_per_block=1,
+                   full_scale=2**13, seed=0):
+    """Stream a grid's waveform to ``path`` as interleaved I/Q.
+
+    'complex64' writes float32 I/Q; 'int16' writes I/Q scaled so unit RMS
+    maps to ``full_scale`` and clipped to the int16 range. Memory stays at
+    one block of ``frames_per_block`` frames. Returns the number of samples.
+    """
+    if sample_format not in SAMPLE_FORMATS:
+        raise ValueError(f"Sample format must be one of {SAMPLE_FORMATS}")
+    num_samples = 0
+    with open(path, 'wb') as f:
+        for block in grid_waveform_blocks(grid, fft_size, frames_per_block, seed):
+            num_samples += block.size
+            if sample_format == 'int16':
+                iq = block.view(np.float32) * np.float32(full_scale)
+                block = np.clip(np.rint(iq), -2**15, 2**15 - 1).astype(np.int16)
+            block.tofile(f)
+    return num_samples
+
+
+def papr_db(samples):
+    """Peak-to-average power ratio in dB; NaN for an all-zero signal"""
+    power = np.abs(samples)**2
+    mean = power.mean()
+    if mean == 0:
+        return float('nan')
+    return float(10 * np.log10(power.max() / mean))
@@ -0,0 +1,261 @@
+"""PRACH Zadoff-Chu preamble banks (TS 38.211 Section 6.3.3.1).
+
+The 64 preambles of a cell are the cyclic shifts C_v of the root sequences
+x_u(i) = exp(-j pi u i (i + 1) / L_RA), taken in order of increasing C_v
+and then of increasing logical root index from prach-RootSequenceIndex
+(Tables 6.3.3.1-3/-4), until 64 are found. Cyclic shifts follow N_CS from
+zeroCorrelationZoneConfig (Tables 6.3.3.1-5/-6/-7) and the unrestricted
+or restricted type A rules (type B is not generated). All roots a cell
+needs are generated in one broadcast call with exact integer phases, and
+each preamble is a fancy-indexed cyclic shift of its root; the (64, L_RA)
+complex64 bank is cached per configuration.
+"""
+
+from dataclasses import dataclass
+from functools import lru_cache
+
+import numpy as np
+
+NUM_PREAMBLES = 64
+LONG_SEQUENCE = 839
+SHORT_SEQUENCE = 139
+
+# Delta f_RA in kHz allowed per sequence length
+PRACH_SCS_KHZ = {LONG_SEQUENCE: (1.25, 5), SHORT_SEQUENCE: (15, 30, 60, 120)}
+
+# Sets with cyclic-shift generation; the type B N_CS columns below are reference data only
+RESTRICTED_SETS = ('unrestricted', 'typeA')
+
+# Table 6.3.3.1-3: physical root u in order of logical root index 0-837 (L_RA = 839)
+_LOGICAL_ROOTS_839 = (
+    129, 710, 140, 699, 120, 719, 210, 629, 168, 671, 84, 755, 105, 734, 93, 746, 70, 769, 60, 779,
+    2, 837, 1, 838, 56, 783, 112, 727, 148, 691, 80, 759, 42, 797, 40, 799, 35, 804, 73, 766,
+    146, 693, 31, 808, 28, 811, 30, 809, 27, 812, 29, 810, 24, 815, 48, 791, 68, 771, 74, 765,
+    178, 661, 136, 703, 86, 753, 78, 761, 43, 796, 39, 800, 20, 819, 21, 818, 95, 744, 202, 637,
+    190, 649, 181, 658, 137, 702, 125, 714, 151, 688, 217, 622, 128, 711, 142, 697, 122, 717, 203, 636,
+    118, 721, 110, 729, 89, 750, 103, 736, 61, 778, 55, 784, 15, 824, 14, 825, 12, 827, 23, 816,
+    34, 805, 37, 802, 46, 793, 207, 632, 179, 660, 145, 694, 130, 709, 223, 616, 228, 611, 227, 612,
+    132, 707, 133, 706, 143, 696, 135, 704, 161, 678, 201, 638, 173, 666, 106, 733, 83, 756, 91, 748,
+    66, 773, 53, 786, 10, 829, 9, 830, 7, 832, 8, 831, 16, 823, 47, 792, 64, 775, 57, 782,
+    104, 735, 101, 738, 108, 731, 208, 631, 184, 655, 197, 642, 191, 648, 121, 718, 141, 698, 149, 690,
+    216, 623, 218, 621, 152, 687, 144, 695, 134, 705, 138, 701, 199, 640, 162, 677, 176, 663, 119, 720,
+    158, 681, 164, 675, 174, 665, 171, 668, 170, 669, 87, 752, 169, 670, 88, 751, 107, 732, 81, 758,
+    82, 757, 100, 739, 98, 741, 71, 768, 59, 780, 65, 774, 50, 789, 49, 790, 26, 813, 17, 822,
+    13, 826, 6, 833, 5, 834, 33, 806, 51, 788, 75, 764, 99, 740, 96, 743, 97, 742, 166, 673,
+    172, 667, 175, 664, 187, 652, 163, 676, 185, 654, 200, 639, 114, 725, 189, 650, 115, 724, 194, 645,
+    195, 644, 192, 647, 182, 657, 157, 682, 156, 683, 211, 628, 154, 685, 123, 716, 139, 700, 212, 627,
+    153, 686, 213, 626, 215, 624, 150, 689, 225, 614, 224, 615, 221, 618, 220, 619, 127, 712, 147, 692,
+    124, 715, 193, 646, 205, 634, 206, 633, 116, 723, 160, 679, 186, 653, 167, 672, 79, 760, 85, 754,
+    77, 762, 92, 747, 58, 781, 62, 777, 69, 770, 54, 785, 36, 803, 32, 807, 25, 814, 18, 821,
+    11, 828, 4, 835, 3, 836, 19, 820, 22, 817, 41, 798, 38, 801, 44, 795, 52, 787, 45, 794,
+    63, 776, 67, 772, 72, 767, 76, 763, 94, 745, 102, 737, 90, 749, 109, 730, 165, 674, 111, 728,
+    209, 630, 204, 635, 117, 722, 188, 651, 159, 680, 198, 641, 113, 726, 183, 656, 180, 659, 177, 662,
+    196, 643, 155, 684, 214, 625, 126, 713, 131, 708, 219, 620, 222, 617, 226, 613, 230, 609, 232, 607,
+    262, 577, 252, 587, 418, 421, 416, 423, 413, 426, 411, 428, 376, 463, 395, 444, 283, 556, 285, 554,
+    379, 460, 390, 449, 363, 476, 384, 455, 388, 451, 386, 453, 361, 478, 387, 452, 360, 479, 310, 529,
+    354, 485, 328, 511, 315, 524, 337, 502, 349, 490, 335, 504, 324, 515, 323, 516, 320, 519, 334, 505,
+    359, 480, 295, 544, 385, 454, 292, 547, 291, 548, 381, 458, 399, 440, 380, 459, 397, 442, 369, 470,
+    377, 462, 410, 429, 407, 432, 281, 558, 414, 425, 247, 592, 277, 562, 271, 568, 272, 567, 264, 575,
+    259, 580, 237, 602, 239, 600, 244, 595, 243, 596, 275, 564, 278, 561, 250, 589, 246, 593, 417, 422,
+    248, 591, 394, 445, 393, 446, 370, 469, 365, 474, 300, 539, 299, 540, 364, 475, 362, 477, 298, 541,
+    312, 527, 313, 526, 314, 525, 353, 486, 352, 487, 343, 496, 327, 512, 350, 489, 326, 513, 319, 520,
+    332, 507, 333, 506, 348, 491, 347, 492, 322, 517, 330, 509, 338, 501, 341, 498, 340, 499, 342, 497,
+    301, 538, 366, 473, 401, 438, 371, 468, 408, 431, 375, 464, 249, 590, 269, 570, 238, 601, 234, 605,
+    257, 582, 273, 566, 255, 584, 254, 585, 245, 594, 251, 588, 412, 427, 372, 467, 282, 557, 403, 436,
+    396, 443, 392, 447, 391, 448, 382, 457, 389, 450, 294, 545, 297, 542, 311, 528, 344, 495, 345, 494,
+    318, 521, 331, 508, 325, 514, 321, 518, 346, 493, 339, 500, 351, 488, 306, 533, 289, 550, 400, 439,
+    378, 461, 374, 465, 415, 424, 270, 569, 241, 598, 231, 608, 260, 579, 268, 571, 276, 563, 409, 430,
+    398, 441, 290, 549, 304, 535, 308, 531, 358, 481, 316, 523, 293, 546, 288, 551, 284, 555, 368, 471,
+    253, 586, 256, 583, 263, 576, 242, 597, 274, 565, 402, 437, 383, 456, 357, 482, 329, 510, 317, 522,
+    307, 532, 286, 553, 287, 552, 266, 573, 261, 578, 236, 603, 303, 536, 356, 483, 355, 484, 405, 434,
+    404, 435, 406, 433, 235, 604, 267, 572, 302, 537, 309, 530, 265, 574, 233, 606, 367, 472, 296, 543,
+    336, 503, 305, 534, 373, 466, 280, 559, 279, 560, 419, 420, 240, 599, 258, 581, 229, 610,
+)
+
+# Table 6.3.3.1-5 (1.25 kHz), 6.3.3.1-6 (5 kHz) and 6.3.3.1-7 (L_RA = 139):
+# N_CS per zeroCorrelationZoneConfig 0-15, None where the table has no value
+N_CS_TABLES = {
+    (LONG_SEQUENCE, 1.25): {
+        'unrestricted': (0, 13, 15, 18, 22, 26, 32, 38, 46, 59, 76, 93, 119, 167, 279, 419),
+        'typeA': (15, 18, 22, 26, 32, 38, 46, 55, 68, 82, 100, 128, 158, 202, 237, None),
+        'typeB': (15, 18, 22, 26, 32, 38, 46, 55, 68, 82, 100, 118, 137, None, None, None),
+    },
+    (LONG_SEQUENCE, 5): {
+        'unrestricted': (0, 13, 26, 33, 38, 41, 49, 55, 64, 76, 93, 119, 139, 209, 279, 419),
+        'typeA': (36, 57, 72, 81, 89, 94, 103, 112, 121, 132, 137, 152, 173, 195, 216, 237),
+        'typeB': (36, 57, 60, 63, 65, 68, 71, 77, 81, 85, 97, 109, 122, 137, None, None),
+    },
+    (SHORT_SEQUENCE, None): {
+        'unrestricted': (0, 2, 4, 6, 8, 10, 12, 13, 15, 17, 19, 23, 27, 34, 46, 69),
+    },
+}
+
+
+def _build_root_tables():
+    """Read-only physical roots by logical index; Table 6.3.3.1-4 pairs u and 139 - u"""
+    short = np.arange(SHORT_SEQUENCE - 1)
+    tables = {
+        LONG_SEQUENCE: np.array(_LOGICAL_ROOTS_839, dtype=np.int64),
+        SHORT_SEQUENCE: np.where(short % 2 == 0, short // 2 + 1, SHORT_SEQUENCE - 1 - short // 2),
+    }
+    for table in tables.values():
+        table.setflags(write=False)
+    return tables
+
+
+ROOT_SEQUENCES = _build_root_tables()
+
+
+def zadoff_chu(u, length):
+    """(..., length) complex64 root sequences x_u(i) for an array of roots u"""
+    u = np.asarray(u, dtype=np.int64)[..., None]
+    i = np.arange(length, dtype=np.int64)
+    # u i (i + 1) is even, so its phase in units of pi / L is exact modulo 2 L
+    phase = (u * (i * (i + 1) % (2 * length))) % (2 * length)
+    return np.exp(-1j * np.pi / length * phase).astype(np.complex64)
+
+
+def zero_correlation_zone(length, zero_correlation_zone_config, scs_khz=1.25, restricted_set='unrestricted'):
+    """N_CS from the zeroCorrelationZoneConfig table; ValueError where it is undefined"""
+    tables = N_CS_TABLES[(length, scs_khz if length == LONG_SEQUENCE else None)]
+    if restricted_set not in tables:
+        raise ValueError(f"L_RA = {length} only supports {list(tables)} sets")
+    if not 0 <= zero_correlation_zone_config < 16:
+        raise ValueError("zeroCorrelationZoneConfig must be 0-15")
+    n_cs = tables[restricted_set][zero_correlation_zone_config]
+    if n_cs is None:
+        raise ValueError(f"zeroCorrelationZoneConfig {zero_correlation_zone_config} is not defined "
+                         f"for restricted set {restricted_set}")
+    return n_cs
+
+
+def doppler_shift(u, length):
+    """d_u: the cyclic shift a Doppler of one subcarrier spacing causes for root u"""
+    q = pow(int(u), -1, length)
+    return q if q < length / 2 else length - q
+
+
+def cyclic_shifts(u, length, n_cs, restricted_set='unrestricted'):
+    """Cyclic shifts C_v of root u in increasing order (empty if the root is unusable)"""
+    if restricted_set == 'unrestricted':
+        if n_cs == 0:
+            return np.zeros(1, dtype=np.int64)
+        return n_cs * np.arange(length // n_cs)
+    if restricted_set != 'typeA':
+        raise ValueError("Only unrestricted and restricted type A cyclic shifts are supported")
+
+    d_u = doppler_shift(u, length)
+    if n_cs <= d_u < length / 3:
+        n_shift = d_u // n_cs
+        d_start = 2 * d_u + n_shift * n_cs
+        n_group = length // d_start
+        n_extra = max((length - 2 * d_u - n_group * d_start) // n_cs, 0)
+    elif length / 3 <= d_u <= (length - n_cs) / 2:
+        n_shift = (length - 2 * d_u) // n_cs
+        d_start = length - 2 * d_u + n_shift * n_cs
+        n_group = d_u // d_start
+        n_extra = min(max((d_u - n_group * d_start) // n_cs, 0), n_shift)
+    else:
+        return np.zeros(0, dtype=np.int64)
+    v = np.arange(n_shift * n_group + n_extra)
+    return d_start * (v // n_shift) + (v % n_shift) * n_cs
+
+
+@dataclass(frozen=True)
+class PrachConfig:
+    """Cell PRACH sequence configuration (RACH-ConfigCommon fields).
+
+    ``scs_khz`` is Delta f_RA: 1.25 or 5 kHz for long preambles (L_RA = 839)
+    and 15-120 kHz for short ones (L_RA = 139).
+    """
+    root_sequence_index: int = 0
+    zero_correlation_zone_config: int = 0
+    sequence_length: int = LONG_SEQUENCE
+    scs_khz: float = 1.25
+    restricted_set: str = 'unrestricted'
+
+    def __post_init__(self):
+        if self.sequence_length not in PRACH_SCS_KHZ:
+            raise ValueError(f"Sequence length must be one of {tuple(PRACH_SCS_KHZ)}")
+        if self.scs_khz not in PRACH_SCS_KHZ[self.sequence_length]:
+            raise ValueError(f"L_RA = {self.sequence_length} needs a PRACH SCS of "
+                             f"{PRACH_SCS_KHZ[self.sequence_length]} kHz")
+        if self.restricted_set not in RESTRICTED_SETS:
+            raise ValueError(f"Restricted set must be one of {RESTRICTED_SETS}")
+        if not 0 <= self.root_sequence_index < self.sequence_length - 1:
+            raise ValueError(f"prach-RootSequenceIndex must be 0-{self.sequence_length - 2}")
+        # Raises on undefined table entries
+        self.n_cs
+
+    @property
+    def n_cs(self):
+        return zero_correlation_zone(self.sequence_length, self.zero_correlation_zone_config, self.scs_khz,
+                                     self.restricted_set)
+
+
+@lru_cache(maxsize=256)
+def preamble_assignment(config):
+    """Physical root u, logical root index and cyclic shift C_v of preambles 0-63 (read-only arrays)"""
+    roots = ROOT_SEQUENCES[config.sequence_length]
+    root, logical, shift = [], [], []
+    count = 0
+    for step in range(roots.size):
+        index = (config.root_sequence_index + step) % roots.size
+        shifts = cyclic_shifts(roots[index], config.sequence_length, config.n_cs, config.restricted_set)
+        shifts = shifts[:NUM_PREAMBLES - count]
+        root.append(np.full(shifts.size, roots[index]))
+        logical.append(np.full(shifts.size, index))
+        shift.append(shifts)
+        count += shifts.size
+        if count == NUM_PREAMBLES:
+            break
+    else:
+        raise ValueError(f"Only {count} preambles fit this configuration")
+
+    result = {'root': np.concatenate(root), 'logical_root': np.concatenate(logical),
+              'cyclic_shift': np.concatenate(shift)}
+    for arr in result.values():
+        arr.setflags(write=False)
+    return result
+
+
+@lru_cache(maxsize=32)
+def preamble_bank(config):
+    """(64, L_RA) complex64 time-domain preambles x_u,v(n) = x_u((n + C_v) mod L_RA), read-only"""
+    assignment = preamble_assignment(config)
+    roots, row = np.unique(assignment['root'], return_inverse=True)
+    n = np.arange(config.sequence_length)
+    index = (n[None, :] + assignment['cyclic_shift'][:, None]) % config.sequence_length
+    bank = zadoff_chu(roots, config.sequence_length)[row[:, None], index]
+    bank.setflags(write=False)
+    return bank
+
+
+@lru_cache(maxsize=32)
+def preamble_spectra(config):
+    """(64, L_RA) complex64 DFT y_u,v(n) of the bank, for frequency-domain detection (read-only)"""
+    spectra = np.fft.fft(preamble_bank(config), axis=-1).astype(np.complex64)
+    spectra.setflags(write=False)
+    return spectra
+
+
+def correlate(received, config):
+    """(..., 64, L_RA) periodic correlation magnitude of received L_RA-sample sequences against the bank.
+
+    A preamble delayed by tau samples peaks at lag tau in its own row and
+    at tau + C_p - C_v in the rows of other shifts of the same root.
+    """
+    spectrum = np.fft.fft(np.asarray(received, dtype=np.complex64), axis=-1)
+    corr = np.fft.ifft(spectrum[..., None, :] * np.conj(preamble_spectra(config)), axis=-1)
+    return np.abs(corr) / config.sequence_length
+
+
+def detect(received, config):
+    """(peak, delay) per preamble: the correlation peak inside its N_CS zero correlation zone.
+
+    Both have shape ``received.shape[:-1] + (64,)``; ``delay`` is the lag
+    in samples of the peak, i.e. the round-trip delay estimate.
+    """
+    corr = correlate(received, config)
+    zone = corr[..., :config.n_cs] if config.n_cs else corr
+    return zone.max(axis=-1), zone.argmax(axis=-1)
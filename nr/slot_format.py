@@ -0,0 +1,137 @@
+"""Slot formats per TS 38.213 Table 11.1.1-1.
+
+The table is held as one read-only (256, 14) uint8 array of symbol
+directions, built once at import. Any array of slot format indices expands
+to per-symbol directions with a single fancy index, and per-slot symbol
+counts come from a (256, 3) table the same way, so checking millions of
+slot-format sequences is a few array operations.
+"""
+
+import numpy as np
+
+# Symbol directions stored in the table (uint8)
+DL = 0
+UL = 1
+FLEXIBLE = 2
+RESERVED = 3
+
+DIRECTION_NAMES = {DL: 'D', UL: 'U', FLEXIBLE: 'F', RESERVED: '-'}
+
+SYMBOLS_PER_SLOT = 14
+NUM_FORMATS = 256
+
+# Formats 56-254 are reserved; 255 means "follow tdd-UL-DL-ConfigurationCommon"
+# and carries no symbol pattern of its own.
+DEFINED_FORMATS = (
+    'DDDDDDDDDDDDDD', 'UUUUUUUUUUUUUU', 'FFFFFFFFFFFFFF', 'DDDDDDDDDDDDDF',  # 0-3
+    'DDDDDDDDDDDDFF', 'DDDDDDDDDDDFFF', 'DDDDDDDDDDFFFF', 'DDDDDDDDDFFFFF',  # 4-7
+    'FFFFFFFFFFFFFU', 'FFFFFFFFFFFFUU', 'FUUUUUUUUUUUUU', 'FFUUUUUUUUUUUU',  # 8-11
+    'FFFUUUUUUUUUUU', 'FFFFUUUUUUUUUU', 'FFFFFUUUUUUUUU', 'FFFFFFUUUUUUUU',  # 12-15
+    'DFFFFFFFFFFFFF', 'DDFFFFFFFFFFFF', 'DDDFFFFFFFFFFF', 'DFFFFFFFFFFFFU',  # 16-19
+    'DDFFFFFFFFFFFU', 'DDDFFFFFFFFFFU', 'DFFFFFFFFFFFUU', 'DDFFFFFFFFFFUU',  # 20-23
+    'DDDFFFFFFFFFUU', 'DFFFFFFFFFFUUU', 'DDFFFFFFFFFUUU', 'DDDFFFFFFFFUUU',  # 24-27
+    'DDDDDDDDDDDDFU', 'DDDDDDDDDDDFFU', 'DDDDDDDDDDFFFU', 'DDDDDDDDDDDFUU',  # 28-31
+    'DDDDDDDDDDFFUU', 'DDDDDDDDDFFFUU', 'DFUUUUUUUUUUUU', 'DDFUUUUUUUUUUU',  # 32-35
+    'DDDFUUUUUUUUUU', 'DFFUUUUUUUUUUU', 'DDFFUUUUUUUUUU', 'DDDFFUUUUUUUUU',  # 36-39
+    'DFFFUUUUUUUUUU', 'DDFFFUUUUUUUUU', 'DDDFFFUUUUUUUU', 'DDDDDDDDDFFFFU',  # 40-43
+    'DDDDDDFFFFFFUU', 'DDDDDDFFUUUUUU', 'DDDDDFUDDDDDFU', 'DDFUUUUDDFUUUU',  # 44-47
+    'DFUUUUUDFUUUUU', 'DDDDFFUDDDDFFU', 'DDFFUUUDDFFUUU', 'DFFUUUUDFFUUUU',  # 48-51
+    'DFFFFFUDFFFFFU', 'DDFFFFUDDFFFFU', 'FFFFFFFDDDDDDD', 'DDFFFUUUDDDDDD',  # 52-55
+)
+
+
+def _build_table():
+    codes = np.full(256, RESERVED, dtype=np.uint8)
+    codes[[ord(c) for c in 'DUF']] = [DL, UL, FLEXIBLE]
+    table = np.full((NUM_FORMATS, SYMBOLS_PER_SLOT), RESERVED, dtype=np.uint8)
+    defined = np.frombuffer(''.join(DEFINED_FORMATS).encode('ascii'), dtype=np.uint8)
+    table[:len(DEFINED_FORMATS)] = codes[defined].reshape(-1, SYMBOLS_PER_SLOT)
+    table.setflags(write=False)
+    return table
+
+
+SLOT_FORMAT_TABLE = _build_table()
+
+# Per-format (DL, UL, flexible) symbol counts
+FORMAT_COUNTS = np.stack([(SLOT_FORMAT_TABLE == d).sum(axis=1) for d in (DL, UL, FLEXIBLE)],
+                         axis=1).astype(np.uint8)
+FORMAT_COUNTS.setflags(write=False)
+
+
+def is_defined(formats):
+    """Elementwise: format index has a symbol pattern (0-55)"""
+    formats = np.asarray(formats)
+    return (formats >= 0) & (formats < len(DEFINED_FORMATS))
+
+
+def _check(formats):
+    formats = np.asarray(formats)
+    if not is_defined(formats).all():
+        raise ValueError(f"Slot formats must be 0-{len(DEFINED_FORMATS) - 1} (56-255 have no pattern)")
+    return formats
+
+
+def expand(formats):
+    """Symbol directions of a slot-format array, shape ``formats.shape + (14,)``"""
+    return SLOT_FORMAT_TABLE[_check(formats)]
+
+
+def direction_masks(formats):
+    """Per-symbol bool masks {'dl', 'ul', 'flexible'} for a slot-format array"""
+    symbols = expand(formats)
+    return {'dl': symbols == DL, 'ul': symbols == UL, 'flexible': symbols == FLEXIBLE}
+
+
+def symbol_counts(formats):
+    """(DL, UL, flexible) symbol counts per slot, shape ``formats.shape + (3,)``"""
+    return FORMAT_COUNTS[_check(formats)]
+
+
+def pattern_string(formats):
+    """'D'/'U'/'F' string of a sequence of slot formats"""
+    return ''.join(DIRECTION_NAMES[d] for d in expand(formats).ravel())
+
+
+def find_formats(symbols):
+    """Formats whose pattern equals a 14-symbol direction array (or 'DUF' string)"""
+    if isinstance(symbols, str):
+        symbols = [{'D': DL, 'U': UL, 'F': FLEXIBLE}[c] for c in symbols]
+    symbols = np.asarray(symbols, dtype=np.uint8)
+    if symbols.shape != (SYMBOLS_PER_SLOT,):
+        raise ValueError(f"A slot has {SYMBOLS_PER_SLOT} symbols")
+    return np.flatnonzero((SLOT_FORMAT_TABLE == symbols).all(axis=1))
+
+
+def combinations(candidates, num_slots):
+    """Every length-``num_slots`` sequence over ``candidates``, shape (len**num_slots, num_slots)"""
+    candidates = _check(np.asarray(candidates, dtype=np.uint8).ravel())
+    index = np.indices((candidates.size,) * num_slots).reshape(num_slots, -1).T
+    return candidates[index]
+
+
+def conflicts(formats, semi_static):
+    """Slots whose dynamic format overrides a semi-static DL or UL symbol.
+
+    ``formats`` is (..., num_slots); ``semi_static`` is the (num_slots, 14)
+    direction array from tdd-UL-DL-ConfigurationCommon. Only flexible
+    symbols may be changed by a dynamic slot format (TS 38.213 Section 11.1).
+    """
+    formats = _check(formats)
+    semi_static = np.asarray(semi_static)
+    fixed = semi_static != FLEXIBLE
+    # (num_slots, 256) lookup of which formats clash with each slot, then one gather
+    clash = ((SLOT_FORMAT_TABLE[None, :, :] != semi_static[:, None, :]) & fixed[:, None, :]).any(axis=-1)
+    return clash[np.arange(semi_static.shape[0]), formats]
+
+
+def switch_points(formats):
+    """Number of DL-to-UL switches inside each sequence of slots (last axis)"""
+    symbols = expand(formats)
+    symbols = symbols.reshape(symbols.shape[:-2] + (-1,))
+    # Flexible symbols take the direction of the last DL/UL symbol before them
+    position = np.arange(symbols.shape[-1], dtype=np.min_scalar_type(symbols.shape[-1]))
+    idx = np.where(symbols != FLEXIBLE, position, position.dtype.type(0))
+    np.maximum.accumulate(idx, axis=-1, out=idx)
+    carried = np.take_along_axis(symbols, idx, axis=-1)
+    return ((carried[..., :-1] == DL) & (carried[..., 1:] == UL)).sum(axis=-1)
+
@@ -0,0 +1,171 @@
+"""SS/PBCH block burst sets per TS 38.213 Section 4.1.
+
+Candidate SSB positions in a half frame are ``offsets + period * n`` OFDM
+symbols for the case's offsets, period and set of n. They are computed
+once per (case, L_max) with array arithmetic and cached read-only. An
+``ssb-PositionsInBurst`` bitmap then selects the transmitted SSBs, which
+can be rendered as a (slot, symbol) map or written into a
+``MultiFrameGrid`` with a single broadcast assignment.
+"""
+
+from functools import lru_cache
+
+import numpy as np
+
+from nr.grid import SSB
+from nr.timing import MU_BY_SCS, TC_PER_FRAME, subframe_symbol_table, symbol_start
+
+SSB_SYMBOLS = 4
+SSB_SUBCARRIERS = 240
+SYMBOLS_PER_SLOT = 14
+PERIODICITIES_MS = (5, 10, 20, 40, 80, 160)
+
+# case: (SCS kHz, first symbols within a group, group period in symbols, n per L_max)
+SSB_CASES = {
+    'A': (15, (2, 8), 14, {4: (0, 1), 8: (0, 1, 2, 3)}),
+    'B': (30, (4, 8, 16, 20), 28, {4: (0,), 8: (0, 1)}),
+    'C': (30, (2, 8), 14, {4: (0, 1), 8: (0, 1, 2, 3)}),
+    'D': (120, (4, 8, 16, 20), 28, {64: (0, 1, 2, 3, 5, 6, 7, 8, 10, 11, 12, 13, 15, 16, 17, 18)}),
+    'E': (240, (8, 12, 16, 20, 32, 36, 40, 44), 56, {64: (0, 1, 2, 3, 5, 6, 7, 8)}),
+}
+
+
+def case_scs(case):
+    return SSB_CASES[case][0]
+
+
+def l_max_options(case):
+    """L_max values defined for a case"""
+    return sorted(SSB_CASES[case][3])
+
+
+@lru_cache(maxsize=None)
+def candidate_start_symbols(case, l_max):
+    """First symbol of every candidate SSB, indexed by SSB index (read-only).
+
+    Symbols are counted from the start of the half frame in the case's SCS.
+    """
+    if case not in SSB_CASES:
+        raise ValueError(f"SSB case must be one of {sorted(SSB_CASES)}")
+    _, offsets, period, groups = SSB_CASES[case]
+    if l_max not in groups:
+        raise ValueError(f"L_max={l_max} is not defined for case {case}; valid: {sorted(groups)}")
+    starts = np.add.outer(period * np.asarray(groups[l_max]), offsets).ravel()
+    starts.setflags(write=False)
+    return starts
+
+
+def parse_bitmap(bitmap, l_max):
+    """ssb-PositionsInBurst as a bool array; the leftmost bit is SSB index 0.
+
+    Accepts None (all transmitted), a '0'/'1' string, an int or a sequence
+    of truthy values.
+    """
+    if bitmap is None:
+        return np.ones(l_max, dtype=bool)
+    if isinstance(bitmap, str):
+        bitmap = bitmap.replace(' ', '')
+        if len(bitmap) != l_max or set(bitmap) - {'0', '1'}:
+            raise ValueError(f"Bitmap must be {l_max} characters of 0/1")
+        return np.frombuffer(bitmap.encode('ascii'), dtype=np.uint8) == ord('1')
+    if isinstance(bitmap, (int, np.integer)):
+        if not 0 <= bitmap < 2**l_max:
+            raise ValueError(f"Bitmap must fit in {l_max} bits")
+        return (int(bitmap) >> np.arange(l_max - 1, -1, -1)) & 1 == 1
+    bits = np.asarray(bitmap, dtype=bool)
+    if bits.shape != (l_max,):
+        raise ValueError(f"Bitmap must have {l_max} entries")
+    return bits
+
+
+def burst_set(case, l_max, bitmap=None):
+    """Transmitted SSBs of a half frame.
+
+    Returns a dict of arrays: 'index' (SSB index), 'start' (first symbol in
+    the half frame), 'slot' (slot in the half frame) and 'symbol' (first
+    symbol in that slot).
+    """
+    starts = candidate_start_symbols(case, l_max)
+    index = np.flatnonzero(parse_bitmap(bitmap, l_max))
+    start = starts[index]
+    return {
+        'index': index,
+        'start': start,
+        'slot': start // SYMBOLS_PER_SLOT,
+        'symbol': start % SYMBOLS_PER_SLOT,
+    }
+
+
+@lru_cache(maxsize=64)
+def _half_frame_map(case, l_max, bitmap_key):
+    slots = 5 * 2**MU_BY_SCS[case_scs(case)]
+    ssb_map = np.full(slots * SYMBOLS_PER_SLOT, -1, dtype=np.int16)
+    burst = burst_set(case, l_max, np.frombuffer(bitmap_key, dtype=bool))
+    symbols = np.add.outer(burst['start'], np.arange(SSB_SYMBOLS))
+    ssb_map[symbols.ravel()] = np.repeat(burst['index'], SSB_SYMBOLS)
+    ssb_map = ssb_map.reshape(slots, SYMBOLS_PER_SLOT)
+    ssb_map.setflags(write=False)
+    return ssb_map
+
+
+def half_frame_map(case, l_max, bitmap=None):
+    """(slots in half frame, 14) int16 map of SSB index per symbol, -1 where none"""
+    bits = parse_bitmap(bitmap, l_max)
+    return _half_frame_map(case, l_max, bits.tobytes())
+
+
+def candidate_map(case, l_max):
+    """(slots in half frame, 14) bool map of all candidate SSB symbols"""
+    return half_frame_map(case, l_max) >= 0
+
+
+def burst_times_tc(case, l_max, bitmap=None, half_frame=0):
+    """(start, length) in Tc of each transmitted SSB, from the frame start"""
+    mu = MU_BY_SCS[case_scs(case)]
+    burst = burst_set(case, l_max, bitmap)
+    slot = burst['slot'] + half_frame * 5 * 2**mu
+    start = symbol_start(0, slot, burst['symbol'], mu)
+    last = (slot % 2**mu) * SYMBOLS_PER_SLOT + burst['symbol'] + SSB_SYMBOLS - 1
+    end = symbol_start(0, slot, burst['symbol'] + SSB_SYMBOLS - 1, mu) + subframe_symbol_table(mu)['length'][last]
+    return start, end - start
+
+
+def ssb_half_frames(num_frames, periodicity_ms=20, half_frame=0):
+    """(frame, half frame) pairs carrying a burst over ``num_frames`` frames"""
+    if periodicity_ms not in PERIODICITIES_MS:
+        raise ValueError(f"SSB periodicity must be one of {PERIODICITIES_MS} ms")
+    if periodicity_ms == 5:
+        frames = np.repeat(np.arange(num_frames), 2)
+        return frames, np.tile([0, 1], num_frames)
+    frames = np.arange(0, num_frames, periodicity_ms // 10)
+    return frames, np.full(frames.size, half_frame)
+
+
+def fill_ssb(grid, case, l_max, bitmap=None, first_subcarrier=0, periodicity_ms=20,
+             half_frame=0, label=SSB):
+    """Write every transmitted SSB of the SFN range into a ``MultiFrameGrid``.
+
+    All bursts are placed with one fancy-indexed assignment over
+    (frame, symbol, subcarrier); no per-symbol Python loop.
+    """
+    if grid.scs_khz != case_scs(case):
+        raise ValueError(f"Case {case} uses {case_scs(case)} kHz SCS, grid has {grid.scs_khz} kHz")
+    if not 0 <= first_subcarrier <= grid.num_subcarriers - SSB_SUBCARRIERS:
+        raise ValueError(f"SSB at subcarrier {first_subcarrier} does not fit in "
+                         f"{grid.num_subcarriers} subcarriers")
+
+    burst = burst_set(case, l_max, bitmap)
+    frames, halves = ssb_half_frames(grid.num_frames, periodicity_ms, half_frame)
+    symbols = np.add.outer(burst['start'], np.arange(SSB_SYMBOLS)).ravel()
+
+    # Absolute slot within the frame and symbol within the slot, per (burst, SSB symbol)
+    slots = halves[:, None] * (grid.slots_per_frame // 2) + symbols // SYMBOLS_PER_SLOT
+    grid.data[frames[:, None], slots, symbols % SYMBOLS_PER_SLOT,
+              first_subcarrier:first_subcarrier + SSB_SUBCARRIERS] = label
+    return frames.size * burst['index'].size
+
+
+def burst_duty_cycle(case, l_max, bitmap=None, periodicity_ms=20):
+    """Fraction of air time occupied by SSBs at the given periodicity"""
+    _, length = burst_times_tc(case, l_max, bitmap)
+    return float(length.sum()) / (TC_PER_FRAME * periodicity_ms / 10)
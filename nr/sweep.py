@@ -0,0 +1,128 @@
+"""Throughput sweeps over the cross product of slot configuration parameters.
+
+The sweep space is never materialized up front: chunks are described by a
+flat index range into the cartesian product, each worker rebuilds its own
+parameter arrays with ``np.unravel_index`` and evaluates them with the
+vectorized DMRS and TBS engines. ``run_sweep`` streams finished chunks back
+as they complete so callers can render partial results.
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import numpy as np
+
+from nr.dmrs import dmrs_re_count_batch
+from nr.tbs import MCS_TABLES, codeword_layers, transport_block_size
+
+# Sweep axes in cartesian-product order
+SWEEP_AXES = (
+    'scs_khz',
+    'num_rbs',
+    'dmrs_config_type',
+    'dmrs_additional_position',
+    'dmrs_cdm_groups',
+    'coreset_duration',
+    'mcs',
+    'layers',
+)
+
+
+def make_space(scs_khz=(30,), num_rbs=(52,), dmrs_config_type=(1,), dmrs_additional_position=(0,),
+               dmrs_cdm_groups=(1,), coreset_duration=(2,), mcs=None, layers=(1,),
+               mcs_table='qam64'):
+    """Describe a sweep as its axes; the product itself is built lazily per chunk.
+
+    ``dmrs_cdm_groups`` counts the CDM groups without data; the default of one
+    matches the DMRS that ``ResourceGridEngine`` draws.
+    """
+    if mcs is None:
+        mcs = range(len(MCS_TABLES[mcs_table]))
+    axes = {
+        'scs_khz': scs_khz,
+        'num_rbs': num_rbs,
+        'dmrs_config_type': dmrs_config_type,
+        'dmrs_additional_position': dmrs_additional_position,
+        'dmrs_cdm_groups': dmrs_cdm_groups,
+        'coreset_duration': coreset_duration,
+        'mcs': mcs,
+        'layers': layers,
+    }
+    return {
+        'axes': {name: np.asarray(list(values), dtype=np.int64) for name, values in axes.items()},
+        'mcs_table': mcs_table,
+    }
+
+
+def space_size(space):
+    return int(np.prod([space['axes'][name].size for name in SWEEP_AXES], dtype=np.int64))
+
+
+def evaluate_range(space, start, stop):
+    """Evaluate flat indices [start, stop) of the sweep; returns a dict of arrays"""
+    axes = space['axes']
+    shape = tuple(axes[name].size for name in SWEEP_AXES)
+    index = np.unravel_index(np.arange(start, stop, dtype=np.int64), shape)
+    params = {name: axes[name][idx] for name, idx in zip(SWEEP_AXES, index)}
+
+    # Type 1 has only two CDM groups; larger requests are capped per row
+    params['dmrs_cdm_groups'] = np.minimum(params['dmrs_cdm_groups'],
+                                           np.where(params['dmrs_config_type'] == 1, 2, 3))
+
+    # PDSCH fills the slot after the CORESET; DMRS follows mapping type A over the slot,
+    # and only its symbols after the CORESET fall in the PDSCH
+    n_symb = 14 - params['coreset_duration']
+    n_dmrs_prb = dmrs_re_count_batch(
+        1, params['dmrs_config_type'], params['dmrs_cdm_groups'],
+        params['dmrs_additional_position'], first_symbol=params['coreset_duration']
+    )
+
+    cw0, cw1 = codeword_layers(params['layers'])
+    tbs = transport_block_size(params['mcs'], params['num_rbs'], n_symb, cw0, n_dmrs_prb,
+                               mcs_table=space['mcs_table'])
+    tbs = tbs + np.where(cw1 > 0, transport_block_size(
+        params['mcs'], params['num_rbs'], n_symb, np.maximum(cw1, 1), n_dmrs_prb,
+        mcs_table=space['mcs_table']
+    ), 0)
+
+    mu = np.searchsorted([15, 30, 60, 120, 240], params['scs_khz'])
+    slots_per_second = 1000 * 2**mu
+    params['n_dmrs_prb'] = n_dmrs_prb
+    params['tbs'] = tbs
+    params['throughput_mbps'] = tbs * slots_per_second / 1e6
+    return params
+
+
+def run_sweep(space, workers=None, chunk_size=200_000, mp_context=None):
+    """Evaluate a sweep, yielding (start, stop, result) chunks as they finish.
+
+    ``workers=0`` evaluates in-process; otherwise chunks are spread over a
+    process pool (``os.cpu_count()`` workers by default).
+    """
+    total = space_size(space)
+    ranges = [(start, min(start + chunk_size, total)) for start in range(0, total, chunk_size)]
+
+    if workers == 0 or len(ranges) == 1:
+        for start, stop in ranges:
+            yield start, stop, evaluate_range(space, start, stop)
+        return
+
+    workers = workers or os.cpu_count()
+    with ProcessPoolExecutor(max_workers=min(workers, len(ranges)), mp_context=mp_context) as pool:
+        futures = {pool.submit(evaluate_range, space, start, stop): (start, stop)
+                   for start, stop in ranges}
+        for future in as_completed(futures):
+            start, stop = futures[future]
+            yield start, stop, future.result()
+
+
+def collect(space, chunks):
+    """Assemble streamed chunks into full-length result arrays"""
+    total = space_size(space)
+    results = None
+    for start, stop, chunk in chunks:
+        if results is None:
+            results = {name: np.empty(total, dtype=arr.dtype) for name, arr in chunk.items()}
+        for name, arr in chunk.items():
+            results[name][start:stop] = arr
+    return results
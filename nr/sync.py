@@ -0,0 +1,137 @@
+"""PSS and SSS sequences and SS/PBCH block RE mapping (TS 38.211 Sections 7.4.2-7.4.3).
+
+Each sequence family is built from one 127-chip m-sequence. The sequence
+for every cell ID is an index shift of it, so the PSS (3 x 127) and SSS
+(1008 x 127) tables are built once with broadcast index arithmetic and
+cached as read-only int8 BPSK values. SSBs for many cells are then just
+``table[ids]`` fancy indexing. PBCH DMRS values for many cells and SSB
+indices come from one batched ``nr.gold`` call.
+"""
+
+from functools import lru_cache
+
+import numpy as np
+
+from nr.gold import rs_sequence
+
+SEQUENCE_LENGTH = 127
+NUM_NID1 = 336
+NUM_NID2 = 3
+NUM_PCI = NUM_NID1 * NUM_NID2
+
+SSB_SYMBOLS = 4
+SSB_SUBCARRIERS = 240
+# PSS and SSS occupy these subcarriers of SSB symbols 0 and 2 (Table 7.4.3.1-1)
+SYNC_SUBCARRIERS = slice(56, 183)
+
+# PBCH DMRS REs per SSB (60 + 24 + 60 over symbols 1-3)
+PBCH_DMRS_LENGTH = 144
+
+# SSB RE labels, matching the Reference Signals page palette
+UNUSED, PBCH, PSS, PBCH_DMRS, SSS = range(5)
+
+
+def _m_sequence(taps, init):
+    """127 chips of x(i + 7) = sum of x(i + t) for t in taps, mod 2"""
+    x = np.zeros(SEQUENCE_LENGTH + 7, dtype=np.int8)
+    x[:7] = init
+    for i in range(SEQUENCE_LENGTH):
+        x[i + 7] = x[i + np.asarray(taps)].sum() % 2
+    return x[:SEQUENCE_LENGTH]
+
+
+def split_pci(pci):
+    """(N_ID1, N_ID2) of physical cell IDs; works elementwise"""
+    pci = np.asarray(pci)
+    if pci.size and (pci.min() < 0 or pci.max() >= NUM_PCI):
+        raise ValueError(f"PCI must be 0-{NUM_PCI - 1}")
+    return np.divmod(pci, NUM_NID2)
+
+
+@lru_cache(maxsize=None)
+def pss_table():
+    """(3, 127) int8 PSS d_PSS(n) for N_ID2 = 0, 1, 2 (read-only)"""
+    x = _m_sequence((0, 4), [0, 1, 1, 0, 1, 1, 1])
+    n = np.arange(SEQUENCE_LENGTH)
+    m = (n[None, :] + 43 * np.arange(NUM_NID2)[:, None]) % SEQUENCE_LENGTH
+    table = (1 - 2 * x[m]).astype(np.int8)
+    table.setflags(write=False)
+    return table
+
+
+@lru_cache(maxsize=None)
+def sss_table():
+    """(1008, 127) int8 SSS d_SSS(n) indexed by PCI (read-only)"""
+    x0 = _m_sequence((0, 4), [1, 0, 0, 0, 0, 0, 0])
+    x1 = _m_sequence((0, 1), [1, 0, 0, 0, 0, 0, 0])
+    nid1, nid2 = split_pci(np.arange(NUM_PCI))
+    m0 = 15 * (nid1 // 112) + 5 * nid2
+    m1 = nid1 % 112
+    n = np.arange(SEQUENCE_LENGTH)
+    table = ((1 - 2 * x0[(n[None, :] + m0[:, None]) % SEQUENCE_LENGTH])
+             * (1 - 2 * x1[(n[None, :] + m1[:, None]) % SEQUENCE_LENGTH])).astype(np.int8)
+    table.setflags(write=False)
+    return table
+
+
+def pss(pci):
+    """PSS of one or more PCIs, shape ``pci.shape + (127,)``"""
+    return pss_table()[split_pci(pci)[1]]
+
+
+def sss(pci):
+    """SSS of one or more PCIs, shape ``pci.shape + (127,)``"""
+    split_pci(pci)
+    return sss_table()[np.asarray(pci)]
+
+
+@lru_cache(maxsize=4)
+def ssb_labels(dmrs_shift=0):
+    """(4, 240) uint8 SSB RE labels; PBCH DMRS sits on subcarriers 4k + v (v = PCI mod 4)"""
+    labels = np.zeros((SSB_SYMBOLS, SSB_SUBCARRIERS), dtype=np.uint8)
+    labels[0, SYNC_SUBCARRIERS] = PSS
+    labels[[1, 3], :] = PBCH
+    labels[2, :48] = PBCH
+    labels[2, 192:] = PBCH
+    labels[2, SYNC_SUBCARRIERS] = SSS
+    dmrs = np.zeros_like(labels, dtype=bool)
+    dmrs[:, dmrs_shift::4] = True
+    labels[dmrs & (labels == PBCH)] = PBCH_DMRS
+    labels.setflags(write=False)
+    return labels
+
+
+def ssb_sync_values(pci):
+    """(..., 4, 240) int8 SSB grid with PSS and SSS BPSK values, 0 on the other REs.
+
+    ``pci`` may be an array of cell IDs, giving one SSB per cell.
+    """
+    pci = np.asarray(pci)
+    grid = np.zeros(pci.shape + (SSB_SYMBOLS, SSB_SUBCARRIERS), dtype=np.int8)
+    grid[..., 0, SYNC_SUBCARRIERS] = pss(pci)
+    grid[..., 2, SYNC_SUBCARRIERS] = sss(pci)
+    return grid
+
+
+def pbch_dmrs_c_init(pci, i_ssb=0):
+    """PBCH DMRS c_init for N_ID and i_SSB-bar (0-7) (TS 38.211 Section 7.4.1.4.1); works elementwise"""
+    pci, i_ssb = np.asarray(pci, dtype=np.int64), np.asarray(i_ssb, dtype=np.int64)
+    return 2**11 * (i_ssb + 1) * (pci // 4 + 1) + 2**6 * (i_ssb + 1) + pci % 4
+
+
+def pbch_dmrs_values(pci, i_ssb=0):
+    """(..., 4, 240) complex64 SSB grid with the 144 PBCH DMRS QPSK values, 0 on the other REs.
+
+    ``pci`` and ``i_ssb`` broadcast, giving one SSB per cell and SSB index.
+    The sequence is mapped in order of subcarrier, then symbol.
+    """
+    pci, i_ssb = np.broadcast_arrays(np.asarray(pci), np.asarray(i_ssb))
+    split_pci(pci)
+    r = rs_sequence(pbch_dmrs_c_init(pci, i_ssb), PBCH_DMRS_LENGTH).reshape(-1, PBCH_DMRS_LENGTH)
+    # Positions for v = 0, shifted by v = PCI mod 4 per cell
+    symbol, subcarrier = np.nonzero(ssb_labels(0) == PBCH_DMRS)
+    shift = (pci % 4).reshape(-1, 1)
+
+    grid = np.zeros((r.shape[0], SSB_SYMBOLS, SSB_SUBCARRIERS), dtype=np.complex64)
+    grid[np.arange(r.shape[0])[:, None], symbol[None, :], subcarrier[None, :] + shift] = r
+    return grid.reshape(pci.shape + (SSB_SYMBOLS, SSB_SUBCARRIERS))
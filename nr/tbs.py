@@ -0,0 +1,188 @@
+"""PDSCH transport block size per TS 38.214 Section 5.1.3.
+
+``transport_block_size`` evaluates the full procedure (N_oh, the 156-RE
+cap, quantization and code block segmentation) elementwise on arrays.
+``tbs_table`` precomputes it once per MCS table over every N'_RE, PRB
+count and layer count, and ``TbsLookup`` maps a DMRS/overhead
+configuration onto it, so per-slot queries are plain array indexing.
+"""
+
+from functools import lru_cache
+
+import numpy as np
+
+from nr.dmrs import dmrs_re_count_batch
+
+MAX_PRB = 275
+MAX_LAYERS_PER_CW = 4
+MAX_LAYERS = 8
+MAX_RE_PER_PRB = 156
+
+# (Qm, R x 1024) per MCS index; Tables 5.1.3.1-1, 5.1.3.1-2 and 5.1.3.1-3
+MCS_TABLES = {
+    'qam64': [
+        (2, 120), (2, 157), (2, 193), (2, 251), (2, 308), (2, 379), (2, 449), (2, 526),
+        (2, 602), (2, 679), (4, 340), (4, 378), (4, 434), (4, 490), (4, 553), (4, 616),
+        (4, 658), (6, 438), (6, 466), (6, 517), (6, 567), (6, 616), (6, 666), (6, 719),
+        (6, 772), (6, 822), (6, 873), (6, 910), (6, 948),
+    ],
+    'qam256': [
+        (2, 120), (2, 193), (2, 308), (2, 449), (2, 602), (4, 378), (4, 434), (4, 490),
+        (4, 553), (4, 616), (4, 658), (6, 466), (6, 517), (6, 567), (6, 616), (6, 666),
+        (6, 719), (6, 772), (6, 822), (6, 873), (8, 682.5), (8, 711), (8, 754), (8, 797),
+        (8, 841), (8, 885), (8, 916.5), (8, 948),
+    ],
+    'qam64LowSE': [
+        (2, 30), (2, 40), (2, 50), (2, 64), (2, 78), (2, 99), (2, 120), (2, 157),
+        (2, 193), (2, 251), (2, 308), (2, 379), (2, 449), (2, 526), (2, 602), (4, 340),
+        (4, 378), (4, 434), (4, 490), (4, 553), (4, 616), (6, 438), (6, 466), (6, 517),
+        (6, 567), (6, 616), (6, 666), (6, 719), (6, 772),
+    ],
+}
+
+MCS_TABLE_NAMES = {
+    'qam64': '64QAM (Table 5.1.3.1-1)',
+    'qam256': '256QAM (Table 5.1.3.1-2)',
+    'qam64LowSE': '64QAM low-SE (Table 5.1.3.1-3)',
+}
+
+# Table 5.1.3.2-1: TBS for N_info <= 3824
+TBS_TABLE = np.array([
+    24, 32, 40, 48, 56, 64, 72, 80, 88, 96, 104, 112, 120, 128, 136, 144, 152, 160, 168, 176,
+    184, 192, 208, 224, 240, 256, 272, 288, 304, 320, 336, 352, 368, 384, 408, 432, 456, 480,
+    504, 528, 552, 576, 608, 640, 672, 704, 736, 768, 808, 848, 888, 928, 984, 1032, 1064,
+    1128, 1160, 1192, 1224, 1256, 1288, 1320, 1352, 1416, 1480, 1544, 1608, 1672, 1736, 1800,
+    1864, 1928, 2024, 2088, 2152, 2216, 2280, 2408, 2472, 2536, 2600, 2664, 2728, 2792, 2856,
+    2976, 3104, 3240, 3368, 3496, 3624, 3752, 3824,
+], dtype=np.int64)
+
+
+def mcs_params(mcs, mcs_table='qam64'):
+    """(Qm, R) arrays for MCS indices of the given table"""
+    table = np.asarray(MCS_TABLES[mcs_table], dtype=float)
+    mcs = np.asarray(mcs)
+    if np.any((mcs < 0) | (mcs >= len(table))):
+        raise ValueError(f"MCS index must be 0-{len(table) - 1} for table {mcs_table}")
+    return table[mcs, 0].astype(np.int64), table[mcs, 1] / 1024
+
+
+def transport_block_size(mcs, n_prb, n_symb, layers=1, n_dmrs_prb=12, n_oh=0,
+                         mcs_table='qam64'):
+    """TBS in bits for one codeword; all arguments broadcast elementwise.
+
+    ``n_dmrs_prb`` is the number of DMRS REs per PRB in the scheduled
+    duration (including CDM groups without data) and ``n_oh`` the
+    xOverhead value (0, 6, 12 or 18).
+    """
+    qm, rate = mcs_params(mcs, mcs_table)
+    n_prb = np.asarray(n_prb, dtype=np.int64)
+    n_symb = np.asarray(n_symb, dtype=np.int64)
+    layers = np.asarray(layers, dtype=np.int64)
+
+    n_re_prb = np.clip(12 * n_symb - np.asarray(n_dmrs_prb) - np.asarray(n_oh), 0, MAX_RE_PER_PRB)
+    n_re = n_re_prb * n_prb
+    n_info = n_re * rate * qm * layers
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        # Step 3: N_info <= 3824, quantize and look up Table 5.1.3.2-1
+        n_small = np.maximum(3, np.floor(np.log2(np.maximum(n_info, 1))) - 6)
+        ninfo_small = np.maximum(24, 2**n_small * np.floor(n_info / 2**n_small))
+        tbs_small = TBS_TABLE[np.minimum(np.searchsorted(TBS_TABLE, ninfo_small),
+                                         len(TBS_TABLE) - 1)]
+
+        # Step 4: N_info > 3824, quantize and segment into code blocks
+        n_large = np.floor(np.log2(np.maximum(n_info - 24, 1))) - 5
+        ninfo_large = np.maximum(3840, 2**n_large * np.floor((n_info - 24) / 2**n_large + 0.5))
+        c_low_rate = np.ceil((ninfo_large + 24) / 3816)
+        c_high = np.ceil((ninfo_large + 24) / 8424)
+        c = np.where(rate <= 0.25, c_low_rate, np.where(ninfo_large > 8424, c_high, 1))
+        tbs_large = 8 * c * np.ceil((ninfo_large + 24) / (8 * c)) - 24
+
+    tbs = np.where(n_info <= 3824, tbs_small, tbs_large)
+    return np.where(n_info > 0, tbs, 0).astype(np.int64)
+
+
+def codeword_layers(layers):
+    """Split a layer count into (CW0, CW1) layers; CW1 is used above 4 layers"""
+    layers = np.asarray(layers)
+    cw0 = np.where(layers > MAX_LAYERS_PER_CW, layers // 2, layers)
+    return cw0, layers - cw0
+
+
+@lru_cache(maxsize=1)
+def _re_layer_index():
+    """Distinct N_RE x layers products and the [layers-1, N'_RE, n_prb] index into them"""
+    products = (np.arange(1, MAX_LAYERS_PER_CW + 1)[:, None, None]
+                * np.arange(MAX_RE_PER_PRB + 1)[:, None] * np.arange(MAX_PRB + 1))
+    values, index = np.unique(products, return_inverse=True)
+    index = index.reshape(products.shape).astype(np.int32)
+    values.setflags(write=False)
+    index.setflags(write=False)
+    return values, index
+
+
+@lru_cache(maxsize=None)
+def tbs_table(mcs_table='qam64'):
+    """(MCS, distinct N_RE x layers) int32 TBS of one MCS table, shared by every lookup"""
+    values, _ = _re_layer_index()
+    mcs = np.arange(len(MCS_TABLES[mcs_table]))[:, None]
+    # One symbol with 11 DMRS REs leaves one RE per PRB, so N_RE x layers = values
+    table = transport_block_size(mcs, values, 1, 1, 11, 0, mcs_table).astype(np.int32)
+    table.setflags(write=False)
+    return table
+
+
+class TbsLookup:
+    """TBS lookup for one MCS table, DMRS configuration and N_oh.
+
+    TBS depends on the PDSCH duration, DMRS and overhead only through
+    N'_RE, so the shared ``tbs_table`` is indexed by N'_RE x n_prb x layers
+    and a new DMRS or overhead configuration never rebuilds it; ``tbs``
+    adds the second codeword for 5-8 layers.
+    """
+
+    def __init__(self, mcs_table='qam64', dmrs_config_type=1, dmrs_cdm_groups=2,
+                 dmrs_additional_position=0, dmrs_typea_position=2, dmrs_max_length=1,
+                 n_oh=0, n_dmrs_prb=None):
+        self.mcs_table = mcs_table
+        self.num_mcs = len(MCS_TABLES[mcs_table])
+        self.n_oh = n_oh
+
+        # DMRS REs per PRB for every PDSCH duration (mapping type A, from symbol 0)
+        n_symb = np.arange(15)
+        if n_dmrs_prb is None:
+            valid = n_symb >= 3 + (dmrs_max_length - 1)
+            dmrs = np.zeros(15, dtype=np.int64)
+            dmrs[valid] = dmrs_re_count_batch(
+                1, dmrs_config_type, dmrs_cdm_groups, dmrs_additional_position,
+                dmrs_typea_position, n_symb[valid], dmrs_max_length
+            )
+            self.n_dmrs_prb = dmrs
+        else:
+            self.n_dmrs_prb = np.broadcast_to(np.asarray(n_dmrs_prb, dtype=np.int64), (15,))
+
+        # N'_RE per PRB for every PDSCH duration
+        self.n_re_prb = np.clip(12 * n_symb - self.n_dmrs_prb - n_oh, 0, MAX_RE_PER_PRB)
+        self.table = tbs_table(mcs_table)
+
+    @property
+    def nbytes(self):
+        return self.table.nbytes + _re_layer_index()[1].nbytes
+
+    def tbs(self, mcs, n_prb, n_symb, layers=1):
+        """Total TBS in bits over both codewords, by array lookup"""
+        _, index = _re_layer_index()
+        n_re_prb = self.n_re_prb[n_symb]
+        cw0, cw1 = codeword_layers(layers)
+        tbs = self.table[mcs, index[np.maximum(cw0, 1) - 1, n_re_prb, n_prb]].astype(np.int64)
+        return tbs + np.where(cw1 > 0, self.table[mcs, index[np.maximum(cw1, 1) - 1, n_re_prb, n_prb]], 0)
+
+
+@lru_cache(maxsize=32)
+def get_tbs_lookup(mcs_table='qam64', dmrs_config_type=1, dmrs_cdm_groups=2,
+                   dmrs_additional_position=0, dmrs_typea_position=2, dmrs_max_length=1,
+                   n_oh=0, n_dmrs_prb=None):
+    """Cached ``TbsLookup``; ``n_dmrs_prb`` (int) overrides the DMRS configuration"""
+    return TbsLookup(mcs_table, dmrs_config_type, dmrs_cdm_groups, dmrs_additional_position,
+                     dmrs_typea_position, dmrs_max_length, n_oh, n_dmrs_prb)
+
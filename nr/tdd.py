@@ -0,0 +1,149 @@
+"""Semi-static TDD patterns per TS 38.213 Section 11.1 (TDD-UL-DL-ConfigCommon).
+
+Periodicities are exact fractions of a millisecond and are converted to
+whole slots of the reference SCS, so combinations such as 0.625 ms at
+15 kHz are rejected instead of truncated. One period (pattern1 followed by
+the optional pattern2) is built as a (slots, 14) uint8 direction array
+using the ``nr.slot_format`` codes, and the 10.24 s SFN cycle is that
+array tiled with ``np.tile``.
+"""
+
+from dataclasses import dataclass
+from fractions import Fraction
+from functools import lru_cache
+
+import numpy as np
+
+from nr.slot_format import DL, FLEXIBLE, UL
+from nr.timing import MU_BY_SCS, SFN_CYCLE, TC_PER_MS
+
+SYMBOLS_PER_SLOT = 14
+MAX_SLOTS = 80  # nrofDownlinkSlots / nrofUplinkSlots upper bound
+
+# dl-UL-TransmissionPeriodicity (3 and 4 ms are the Rel-16 v1530 extension)
+PERIODICITIES_MS = tuple(Fraction(p) for p in ('0.5', '0.625', '1', '1.25', '2', '2.5', '3', '4', '5', '10'))
+
+# pattern1 + pattern2 (or pattern1 alone) must divide this
+PATTERN_SPAN_MS = 20
+
+
+def as_ms(value):
+    """Exact Fraction of a millisecond from an int, float, str or Fraction"""
+    return value if isinstance(value, Fraction) else Fraction(str(value))
+
+
+@dataclass(frozen=True)
+class TddPattern:
+    """One TDD-UL-DL-Pattern: DL slots and symbols first, UL symbols and slots last"""
+    periodicity_ms: Fraction = Fraction(5)
+    dl_slots: int = 7
+    dl_symbols: int = 6
+    ul_slots: int = 2
+    ul_symbols: int = 4
+
+    def __post_init__(self):
+        object.__setattr__(self, 'periodicity_ms', as_ms(self.periodicity_ms))
+        if self.periodicity_ms not in PERIODICITIES_MS:
+            raise ValueError(f"Periodicity must be one of {[f'{float(p):g}' for p in PERIODICITIES_MS]} ms")
+        for name in ('dl_slots', 'ul_slots'):
+            if not 0 <= getattr(self, name) <= MAX_SLOTS:
+                raise ValueError(f"{name} must be 0-{MAX_SLOTS}")
+        for name in ('dl_symbols', 'ul_symbols'):
+            if not 0 <= getattr(self, name) < SYMBOLS_PER_SLOT:
+                raise ValueError(f"{name} must be 0-{SYMBOLS_PER_SLOT - 1}")
+
+    def num_slots(self, mu):
+        """Slots per period at numerology ``mu``; ValueError if not a whole number"""
+        slots = self.periodicity_ms * 2**mu
+        if slots.denominator != 1:
+            raise ValueError(f"{float(self.periodicity_ms):g} ms is not a whole number of "
+                             f"{15 * 2**mu} kHz slots")
+        return int(slots)
+
+    def directions(self, mu):
+        """(slots, 14) uint8 directions of one period"""
+        num_slots = self.num_slots(mu)
+        total = num_slots * SYMBOLS_PER_SLOT
+        dl = self.dl_slots * SYMBOLS_PER_SLOT + self.dl_symbols
+        ul = self.ul_slots * SYMBOLS_PER_SLOT + self.ul_symbols
+        if dl + ul > total:
+            raise ValueError(f"{dl} DL + {ul} UL symbols exceed the {total} symbols "
+                             f"({num_slots} slots) of a {float(self.periodicity_ms):g} ms period")
+        symbols = np.repeat(np.array([DL, FLEXIBLE, UL], dtype=np.uint8), [dl, total - dl - ul, ul])
+        return symbols.reshape(num_slots, SYMBOLS_PER_SLOT)
+
+
+@dataclass(frozen=True)
+class TddConfig:
+    """TDD-UL-DL-ConfigCommon: reference SCS, pattern1 and an optional pattern2"""
+    reference_scs_khz: int = 30
+    pattern1: TddPattern = TddPattern()
+    pattern2: TddPattern = None
+
+    def __post_init__(self):
+        if self.reference_scs_khz not in MU_BY_SCS:
+            raise ValueError(f"Reference SCS must be one of {sorted(MU_BY_SCS)} kHz")
+        if PATTERN_SPAN_MS % self.periodicity_ms:
+            raise ValueError(f"Total periodicity {float(self.periodicity_ms):g} ms must divide {PATTERN_SPAN_MS} ms")
+        # Raises on fractional slots or too many symbols
+        period_directions(self)
+
+    @property
+    def mu(self):
+        return MU_BY_SCS[self.reference_scs_khz]
+
+    @property
+    def periodicity_ms(self):
+        """Combined periodicity P (+ P2) in ms"""
+        return self.pattern1.periodicity_ms + (self.pattern2.periodicity_ms if self.pattern2 else 0)
+
+    @property
+    def periodicity_tc(self):
+        """Combined periodicity in Tc (always an integer)"""
+        return int(self.periodicity_ms * TC_PER_MS)
+
+    @property
+    def num_slots(self):
+        """Reference-SCS slots in the combined period"""
+        return sum(p.num_slots(self.mu) for p in (self.pattern1, self.pattern2) if p)
+
+
+@lru_cache(maxsize=64)
+def period_directions(config):
+    """(slots, 14) uint8 directions of pattern1 then pattern2, read-only"""
+    patterns = [p for p in (config.pattern1, config.pattern2) if p]
+    directions = np.concatenate([p.directions(config.mu) for p in patterns])
+    directions.setflags(write=False)
+    return directions
+
+
+def cycle_directions(config, scs_khz=None, num_frames=SFN_CYCLE):
+    """(slots, 14) uint8 directions over ``num_frames`` frames (the SFN cycle by default).
+
+    With ``scs_khz`` above the reference SCS each reference symbol covers
+    2**(mu - mu_ref) symbols (TS 38.213 Section 11.1), so the pattern is
+    repeated along the symbol axis before it is tiled.
+    """
+    directions = period_directions(config)
+    if scs_khz is not None and scs_khz != config.reference_scs_khz:
+        ratio = 2**(MU_BY_SCS[scs_khz] - config.mu)
+        if ratio < 1:
+            raise ValueError("SCS must not be below the reference SCS")
+        directions = np.repeat(directions.ravel(), ratio).reshape(-1, SYMBOLS_PER_SLOT)
+    span_ms = 10 * num_frames
+    if span_ms % config.periodicity_ms:
+        raise ValueError(f"{num_frames} frames are not a whole number of {float(config.periodicity_ms):g} ms periods")
+    return np.tile(directions, (int(span_ms / config.periodicity_ms), 1))
+
+
+def direction_counts(directions):
+    """Symbol counts {'dl', 'ul', 'flexible'} of a direction array"""
+    counts = np.bincount(np.asarray(directions).ravel(), minlength=3)
+    return {'dl': int(counts[DL]), 'ul': int(counts[UL]), 'flexible': int(counts[FLEXIBLE])}
+
+
+def slot_types(directions):
+    """Per-slot 'D', 'U', 'F' for uniform slots and 'X' for mixed ones"""
+    directions = np.asarray(directions)
+    uniform = (directions == directions[:, :1]).all(axis=1)
+    return np.where(uniform, np.array(list('DUF'))[directions[:, 0]], 'X')
@@ -0,0 +1,142 @@
+"""Exact OFDM symbol timing in units of Tc (TS 38.211 Sections 4.1 and 5.3.1).
+
+All times are integers in Tc = 1 / (480e3 * 4096) s, so symbol boundaries
+over the whole 10.24 s SFN cycle are exact. Per-numerology tables for one
+subframe are precomputed and cached; mapping a time to its symbol is O(1)
+arithmetic and works elementwise on arrays of times.
+"""
+
+from functools import lru_cache
+
+import numpy as np
+
+KAPPA = 64  # Ts / Tc
+TC_PER_SECOND = 480000 * 4096
+TC_PER_MS = TC_PER_SECOND // 1000
+TC_PER_SUBFRAME = TC_PER_MS
+TC_PER_HALF_SUBFRAME = TC_PER_SUBFRAME // 2
+TC_PER_FRAME = 10 * TC_PER_SUBFRAME
+SFN_CYCLE = 1024
+TC_PER_SFN_CYCLE = SFN_CYCLE * TC_PER_FRAME
+
+MU_BY_SCS = {15: 0, 30: 1, 60: 2, 120: 3, 240: 4}
+
+
+def symbols_per_slot(extended_cp=False):
+    return 12 if extended_cp else 14
+
+
+def _check(mu, extended_cp):
+    if mu not in range(5):
+        raise ValueError(f"Numerology mu must be 0-4, got {mu}")
+    if extended_cp and mu != 2:
+        raise ValueError("Extended CP is only defined for mu=2 (60 kHz)")
+
+
+def useful_length(mu):
+    """Useful symbol length N_u in Tc"""
+    return 2048 * KAPPA >> mu
+
+
+def cp_lengths(mu, extended_cp=False):
+    """(long, normal) CP lengths N_CP in Tc; both equal for extended CP"""
+    _check(mu, extended_cp)
+    if extended_cp:
+        cp = 512 * KAPPA >> mu
+        return cp, cp
+    normal = 144 * KAPPA >> mu
+    return normal + 16 * KAPPA, normal
+
+
+@lru_cache(maxsize=None)
+def subframe_symbol_table(mu, extended_cp=False):
+    """Per-symbol timing over one subframe.
+
+    Returns a dict of read-only int64 arrays indexed by the symbol number
+    within the subframe: 'start' (CP start), 'cp', 'useful' and 'length',
+    all in Tc. Symbols 0 and 7 * 2^mu carry the longer CP (every 0.5 ms).
+    """
+    _check(mu, extended_cp)
+    n_symbols = symbols_per_slot(extended_cp) * 2**mu
+    long_cp, normal_cp = cp_lengths(mu, extended_cp)
+
+    cp = np.full(n_symbols, normal_cp, dtype=np.int64)
+    cp[::n_symbols // 2] = long_cp
+    useful = np.full(n_symbols, useful_length(mu), dtype=np.int64)
+    length = cp + useful
+    start = np.concatenate(([0], np.cumsum(length)[:-1]))
+
+    assert start[-1] + length[-1] == TC_PER_SUBFRAME
+    table = {'start': start, 'cp': cp, 'useful': useful, 'length': length}
+    for arr in table.values():
+        arr.setflags(write=False)
+    return table
+
+
+@lru_cache(maxsize=None)
+def slot_symbol_table(mu, slot_in_subframe=0, extended_cp=False):
+    """Symbol timing for one slot, with 'start' relative to the slot start"""
+    table = subframe_symbol_table(mu, extended_cp)
+    n = symbols_per_slot(extended_cp)
+    sl = slice(slot_in_subframe * n, (slot_in_subframe + 1) * n)
+    out = {key: arr[sl].copy() for key, arr in table.items()}
+    out['start'] -= out['start'][0]
+    for arr in out.values():
+        arr.setflags(write=False)
+    return out
+
+
+def symbol_start(sfn, slot, symbol, mu, extended_cp=False):
+    """Absolute CP start time in Tc of (SFN, slot in frame, symbol in slot)"""
+    table = subframe_symbol_table(mu, extended_cp)
+    slots_per_subframe = 2**mu
+    subframe, slot_in_subframe = np.divmod(np.asarray(slot), slots_per_subframe)
+    index = slot_in_subframe * symbols_per_slot(extended_cp) + np.asarray(symbol)
+    return (np.asarray(sfn, dtype=np.int64) * TC_PER_FRAME + subframe * TC_PER_SUBFRAME
+            + table['start'][index])
+
+
+def symbol_at(t_tc, mu, extended_cp=False):
+    """Locate the symbol containing time ``t_tc`` (Tc, wrapped to the SFN cycle).
+
+    Returns a dict of arrays: 'sfn', 'slot' (within the frame), 'symbol'
+    (within the slot), 'offset' (Tc since the symbol's CP start) and
+    'in_cp'. Runs in O(1) per query without searching the tables.
+    """
+    _check(mu, extended_cp)
+    t = np.asarray(t_tc, dtype=np.int64) % TC_PER_SFN_CYCLE
+    long_cp, normal_cp = cp_lengths(mu, extended_cp)
+    long_len = long_cp + useful_length(mu)
+    normal_len = normal_cp + useful_length(mu)
+    symbols_per_half = symbols_per_slot(extended_cp) * 2**mu // 2
+
+    sfn, t = np.divmod(t, TC_PER_FRAME)
+    subframe, t = np.divmod(t, TC_PER_SUBFRAME)
+    half, t = np.divmod(t, TC_PER_HALF_SUBFRAME)
+
+    # The first symbol of each half subframe is long_len, the rest normal_len
+    in_first = t < long_len
+    k, offset = np.divmod(t - long_len, normal_len)
+    sym_in_half = np.where(in_first, 0, k + 1)
+    offset = np.where(in_first, t, offset)
+    cp = np.where(in_first, long_cp, normal_cp)
+
+    sym_in_subframe = half * symbols_per_half + sym_in_half
+    slot_in_subframe, symbol = np.divmod(sym_in_subframe, symbols_per_slot(extended_cp))
+    return {
+        'sfn': sfn,
+        'slot': subframe * 2**mu + slot_in_subframe,
+        'symbol': symbol,
+        'offset': offset,
+        'in_cp': offset < cp,
+    }
+
+
+def tc_to_us(tc):
+    """Convert Tc to microseconds (float, for display only)"""
+    return np.asarray(tc) * 1e6 / TC_PER_SECOND
+
+
+def tc_to_ms(tc):
+    """Convert Tc to milliseconds (float, for display only)"""
+    return np.asarray(tc) * 1e3 / TC_PER_SECOND
@@ -0,0 +1 @@
+"""Lightweight runtime instrumentation for the visualizer."""
@@ -0,0 +1,106 @@
+"""Per-rerun timing spans.
+
+A rerun (the whole script, or one fragment) is opened with ``begin`` and
+closed with ``end``; in between, ``span(name)`` blocks add their wall time
+to the current rerun under ``name``. Streamlit runs each session's script
+on its own thread, so the current rerun is thread-local and ``span`` is a
+cheap no-op outside one. Spans may nest; each reports inclusive time, and
+the rerun time not covered by any outermost span is reported as
+'unattributed_ms'.
+
+Finished reruns are returned as plain dicts and can be appended to a
+JSON-lines log with ``append_jsonl``.
+"""
+
+import json
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from functools import wraps
+
+_local = threading.local()
+_log_lock = threading.Lock()
+
+
+class Rerun:
+    """Spans collected during one script or fragment run"""
+
+    def __init__(self, page, kind='script'):
+        self.page = page
+        self.kind = kind
+        self.started = time.perf_counter()
+        self.timestamp = datetime.now(timezone.utc).isoformat(timespec='milliseconds')
+        self.spans = {}  # name -> [count, seconds]
+        self.depth = 0
+        self.covered = 0.0  # seconds inside outermost spans
+
+    def add(self, name, seconds):
+        entry = self.spans.setdefault(name, [0, 0.0])
+        entry[0] += 1
+        entry[1] += seconds
+        if self.depth == 0:
+            self.covered += seconds
+
+    def record(self, **extra):
+        """JSON-serializable summary of the finished rerun"""
+        total = time.perf_counter() - self.started
+        return {
+            'ts': self.timestamp,
+            'page': self.page,
+            'kind': self.kind,
+            'total_ms': round(1000 * total, 3),
+            'unattributed_ms': round(1000 * (total - self.covered), 3),
+            'spans': {name: {'count': count, 'ms': round(1000 * seconds, 3)}
+                      for name, (count, seconds) in self.spans.items()},
+            **extra,
+        }
+
+
+def begin(page, kind='script'):
+    """Start collecting spans for a rerun on this thread"""
+    _local.rerun = Rerun(page, kind)
+    return _local.rerun
+
+
+def end(**extra):
+    """Finish the current rerun and return its record (None if none is open)"""
+    rerun = getattr(_local, 'rerun', None)
+    _local.rerun = None
+    return rerun.record(**extra) if rerun is not None else None
+
+
+def current():
+    return getattr(_local, 'rerun', None)
+
+
+@contextmanager
+def span(name):
+    """Time the enclosed block under ``name`` in the current rerun"""
+    rerun = getattr(_local, 'rerun', None)
+    if rerun is None:
+        yield
+        return
+    rerun.depth += 1
+    t0 = time.perf_counter()
+    try:
+        yield
+    finally:
+        rerun.depth -= 1
+        rerun.add(name, time.perf_counter() - t0)
+
+
+def timed(name, fn):
+    """Wrap ``fn`` so each call is recorded as a span"""
+    @wraps(fn)
+    def wrapper(*args, **kwargs):
+        with span(name):
+            return fn(*args, **kwargs)
+    return wrapper
+
+
+def append_jsonl(path, record):
+    """Append one record to a JSON-lines file (safe across sessions)"""
+    line = json.dumps(record, ensure_ascii=False, separators=(',', ':'))
+    with _log_lock, open(path, 'a', encoding='utf-8') as f:
+        f.write(line + '\n')
@@ -0,0 +1,7 @@
+"""Page modules for the Streamlit visualizer.
+
+Each module exposes ``render()`` for one sidebar page and is imported only
+when that page is first shown, so Plotly, pandas and the page code are not
+loaded or parsed for pages a session never visits. pandas is imported
+locally where a table is actually displayed.
+"""
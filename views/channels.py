@@ -0,0 +1,444 @@
+"""Physical Channels page: downlink and uplink channel overview."""
+
+import streamlit as st
+import numpy as np
+import plotly.graph_objects as go
+
+from nr.prach import (LONG_SEQUENCE, NUM_PREAMBLES, PRACH_SCS_KHZ, SHORT_SEQUENCE, PrachConfig, detect,
+                      preamble_assignment, preamble_bank)
+from perf import spans as perf_spans
+from views.common import cached_figure, show_chart, traced_fragment
+from viz.figcache import figure_key
+
+# ============================================================================
+# FIGURE BUILDERS
+# ============================================================================
+
+def build_preamble_assignment_figure(assignment):
+    """Cyclic shift of each of the 64 preambles, one marker color per root sequence"""
+    fig = go.Figure()
+    preamble = np.arange(NUM_PREAMBLES)
+    for logical in np.unique(assignment['logical_root']):
+        used = assignment['logical_root'] == logical
+        root = int(assignment['root'][used][0])
+        fig.add_trace(go.Scatter(
+            x=preamble[used],
+            y=assignment['cyclic_shift'][used],
+            mode='markers',
+            name=f"Logical root {logical} (u = {root})",
+            hovertemplate='Preamble %{x}<br>C_v = %{y}<extra>u = ' + str(root) + '</extra>'
+        ))
+    
+    fig.update_layout(
+        title="Preamble to Root Sequence and Cyclic Shift",
+        xaxis_title="Preamble Index",
+        yaxis_title="Cyclic Shift C_v (samples)",
+        height=400,
+        showlegend=len(fig.data) <= 10
+    )
+    
+    return fig
+
+def build_detection_figure(peak, sent):
+    """Zero-correlation-zone correlation peak of every preamble for one received preamble"""
+    colors = ['red' if p == sent else 'steelblue' for p in range(peak.size)]
+    fig = go.Figure(go.Bar(
+        x=np.arange(peak.size),
+        y=peak,
+        marker=dict(color=colors),
+        hovertemplate='Preamble %{x}: %{y:.3f}<extra></extra>'
+    ))
+    
+    fig.update_layout(
+        title=f"Bank Correlation for Received Preamble {sent}",
+        xaxis_title="Preamble Index",
+        yaxis_title="Normalized Peak in Zone",
+        height=350,
+        yaxis=dict(range=[0, 1.1])
+    )
+    
+    return fig
+
+# ============================================================================
+# PAGE FRAGMENTS
+# ============================================================================
+
+@traced_fragment
+def prach_panel():
+    """PRACH preamble bank of a cell from its root, N_CS and restricted-set configuration"""
+    st.markdown("### PRACH Preamble Bank")
+    
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        length = st.radio("Preamble Sequence", [LONG_SEQUENCE, SHORT_SEQUENCE], horizontal=True,
+                          format_func=lambda n: f"{'Long' if n == LONG_SEQUENCE else 'Short'} (L_RA = {n})",
+                          key='prach_length')
+        scs_khz = st.selectbox("PRACH Subcarrier Spacing (kHz)", PRACH_SCS_KHZ[length],
+                               key=f'prach_scs_{length}')
+    with col2:
+        root_index = st.number_input("prach-RootSequenceIndex", 0, length - 2, 0, key=f'prach_root_{length}')
+        zcz_config = st.slider("zeroCorrelationZoneConfig", 0, 15, 1, key='prach_zcz')
+    with col3:
+        restricted_set = st.selectbox("restrictedSetConfig",
+                                      ['unrestricted', 'typeA'] if length == LONG_SEQUENCE else ['unrestricted'],
+                                      key=f'prach_restricted_{length}')
+        delay = st.number_input("Received Delay (samples)", 0, length - 1, 0, key='prach_delay')
+    
+    try:
+        config = PrachConfig(root_sequence_index=root_index, zero_correlation_zone_config=zcz_config,
+                             sequence_length=length, scs_khz=scs_khz, restricted_set=restricted_set)
+        with perf_spans.span('prach_bank'):
+            assignment = preamble_assignment(config)
+            bank = preamble_bank(config)
+    except ValueError as e:
+        st.error(str(e))
+        return
+    
+    col_a, col_b, col_c = st.columns(3)
+    with col_a:
+        st.metric("N_CS", config.n_cs)
+    with col_b:
+        st.metric("Root Sequences Used", np.unique(assignment['root']).size)
+    with col_c:
+        st.metric("Bank Size", f"{bank.nbytes / 1024:.0f} KiB")
+    
+    fig = cached_figure(
+        figure_key('prach_assignment', config=config),
+        lambda: build_preamble_assignment_figure(assignment)
+    )
+    show_chart(fig)
+    
+    sent = st.slider("Transmitted Preamble", 0, NUM_PREAMBLES - 1, 0, key='prach_sent')
+    with perf_spans.span('prach_detect'):
+        peak, lag = detect(np.roll(bank[sent], delay), config)
+    fig = cached_figure(
+        figure_key('prach_detection', config=config, sent=sent, delay=delay),
+        lambda: build_detection_figure(peak, sent)
+    )
+    show_chart(fig)
+    
+    detected = int(peak.argmax())
+    if detected != sent:
+        st.warning(f"Detected preamble {detected} instead of {sent}: a delay of {delay} samples "
+                   f"falls outside the N_CS = {config.n_cs} zero correlation zone")
+    else:
+        st.caption(f"Detected preamble {detected} with delay {int(lag[detected])} samples")
+
+# ============================================================================
+# PAGE
+# ============================================================================
+
+def render():
+    """Render the Physical Channels page"""
+    st.markdown('<p class="section-header">📡 5G NR Physical Channels</p>', unsafe_allow_html=True)
+    
+    tab1, tab2 = st.tabs(["📥 Downlink Channels", "📤 Uplink Channels"])
+    
+    with tab1:
+        st.markdown("### Downlink Physical Channels")
+        
+        dl_channels = {
+            'PDSCH': {
+                'name': 'Physical Downlink Shared Channel',
+                'purpose': 'Carries user data and higher layer signaling',
+                'transport': 'DL-SCH (Downlink Shared Channel)',
+                'modulation': 'QPSK, 16-QAM, 64-QAM, 256-QAM',
+                'coding': 'LDPC',
+                'scheduling': 'Dynamic (per slot)',
+                'typical_symbols': '12-13 symbols/slot',
+                'color': 'blue'
+            },
+            'PDCCH': {
+                'name': 'Physical Downlink Control Channel',
+                'purpose': 'Carries downlink control information (DCI)',
+                'transport': 'DCI formats (0, 1, 2, etc.)',
+                'modulation': 'QPSK',
+                'coding': 'Polar',
+                'scheduling': 'CORESET configuration',
+                'typical_symbols': '1-3 symbols/slot',
+                'color': 'orange'
+            },
+            'PBCH': {
+                'name': 'Physical Broadcast Channel',
+                'purpose': 'Carries essential system information (MIB)',
+                'transport': 'BCH (Broadcast Channel)',
+                'modulation': 'QPSK',
+                'coding': 'Polar',
+                'scheduling': 'Fixed (SSB)',
+                'typical_symbols': 'Part of SSB (4 symbols)',
+                'color': 'green'
+            }
+        }
+        
+        # Channel selector
+        selected_dl = st.selectbox("Select Channel", list(dl_channels.keys()))
+        
+        ch_info = dl_channels[selected_dl]
+        
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            st.markdown(f"### {ch_info['name']}")
+            st.markdown(f"""
+            **Purpose:** {ch_info['purpose']}
+            
+            **Transport Channel:** {ch_info['transport']}
+            
+            **Modulation:** {ch_info['modulation']}
+            
+            **Channel Coding:** {ch_info['coding']}
+            
+            **Scheduling:** {ch_info['scheduling']}
+            
+            **Typical Allocation:** {ch_info['typical_symbols']}
+            """)
+        
+        with col2:
+            # Visual representation
+            fig = go.Figure()
+            
+            if selected_dl == 'PDSCH':
+                # PDSCH occupies most symbols except PDCCH
+                symbols = list(range(14))
+                allocation = [0.3] * 2 + [1.0] * 12  # First 2 for PDCCH
+                colors = ['orange'] * 2 + ['blue'] * 12
+                
+            elif selected_dl == 'PDCCH':
+                symbols = list(range(14))
+                allocation = [1.0] * 2 + [0] * 12  # First 2 symbols
+                colors = ['orange'] * 2 + ['lightgray'] * 12
+                
+            else:  # PBCH
+                symbols = list(range(14))
+                allocation = [1.0] * 4 + [0] * 10  # SSB occupies 4 symbols
+                colors = ['green'] * 4 + ['lightgray'] * 10
+            
+            fig.add_trace(go.Bar(
+                x=symbols,
+                y=allocation,
+                marker=dict(color=colors),
+                showlegend=False
+            ))
+            
+            fig.update_layout(
+                title=f"{selected_dl} Typical Slot Allocation",
+                xaxis_title="OFDM Symbol",
+                yaxis_title="Allocation",
+                height=400,
+                yaxis=dict(range=[0, 1.2])
+            )
+            
+            show_chart(fig)
+        
+        # DCI formats for PDCCH
+        if selected_dl == 'PDCCH':
+            st.markdown("### DCI Formats")
+            
+            import pandas as pd
+            dci_formats = pd.DataFrame({
+                'Format': ['0_0', '0_1', '1_0', '1_1', '2_0', '2_1'],
+                'Purpose': [
+                    'UL scheduling (fallback)',
+                    'UL scheduling (normal)',
+                    'DL scheduling (fallback)',
+                    'DL scheduling (normal)',
+                    'Slot format indication',
+                    'Preemption indication'
+                ],
+                'Size': ['Compact', 'Large', 'Compact', 'Large', 'Small', 'Small'],
+                'Use Case': [
+                    'Initial access, power saving',
+                    'Normal operation',
+                    'Initial access, power saving',
+                    'Normal operation',
+                    'TDD configuration',
+                    'URLLC preemption'
+                ]
+            })
+            
+            st.dataframe(dci_formats, use_container_width=True)
+    
+    with tab2:
+        st.markdown("### Uplink Physical Channels")
+        
+        ul_channels = {
+            'PUSCH': {
+                'name': 'Physical Uplink Shared Channel',
+                'purpose': 'Carries user data and higher layer signaling',
+                'transport': 'UL-SCH (Uplink Shared Channel)',
+                'modulation': 'π/2-BPSK, QPSK, 16-QAM, 64-QAM, 256-QAM',
+                'coding': 'LDPC',
+                'scheduling': 'Dynamic (granted by PDCCH)',
+                'typical_symbols': '4-14 symbols',
+                'color': 'purple'
+            },
+            'PUCCH': {
+                'name': 'Physical Uplink Control Channel',
+                'purpose': 'Carries uplink control information (UCI)',
+                'transport': 'UCI (HARQ-ACK, CSI, SR)',
+                'modulation': 'QPSK, π/2-BPSK',
+                'coding': 'Sequence-based (formats 0/1), Polar (formats 2/3/4)',
+                'scheduling': 'Semi-static configuration',
+                'typical_symbols': '1-14 symbols',
+                'color': 'teal'
+            },
+            'PRACH': {
+                'name': 'Physical Random Access Channel',
+                'purpose': 'Random access preamble transmission',
+                'transport': 'Random Access Preamble',
+                'modulation': 'Zadoff-Chu sequences',
+                'coding': 'None (sequence-based)',
+                'scheduling': 'Configured RACH occasions',
+                'typical_symbols': '1-14 symbols (format dependent)',
+                'color': 'brown'
+            }
+        }
+        
+        selected_ul = st.selectbox("Select Channel", list(ul_channels.keys()), key='ul_ch')
+        
+        ch_info_ul = ul_channels[selected_ul]
+        
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            st.markdown(f"### {ch_info_ul['name']}")
+            st.markdown(f"""
+            **Purpose:** {ch_info_ul['purpose']}
+            
+            **Transport Channel:** {ch_info_ul['transport']}
+            
+            **Modulation:** {ch_info_ul['modulation']}
+            
+            **Channel Coding:** {ch_info_ul['coding']}
+            
+            **Scheduling:** {ch_info_ul['scheduling']}
+            
+            **Typical Allocation:** {ch_info_ul['typical_symbols']}
+            """)
+        
+        with col2:
+            fig = go.Figure()
+            
+            symbols = list(range(14))
+            
+            if selected_ul == 'PUSCH':
+                allocation = [0] * 4 + [1.0] * 10  # Skip first few symbols for PUCCH
+                colors = ['lightgray'] * 4 + ['purple'] * 10
+                
+            elif selected_ul == 'PUCCH':
+                allocation = [1.0] * 2 + [0] * 12  # First 2 symbols
+                colors = ['teal'] * 2 + ['lightgray'] * 12
+                
+            else:  # PRACH
+                allocation = [0] * 6 + [1.0] * 6 + [0] * 2
+                colors = ['lightgray'] * 6 + ['brown'] * 6 + ['lightgray'] * 2
+            
+            fig.add_trace(go.Bar(
+                x=symbols,
+                y=allocation,
+                marker=dict(color=colors),
+                showlegend=False
+            ))
+            
+            fig.update_layout(
+                title=f"{selected_ul} Typical Slot Allocation",
+                xaxis_title="OFDM Symbol",
+                yaxis_title="Allocation",
+                height=400,
+                yaxis=dict(range=[0, 1.2])
+            )
+            
+            show_chart(fig)
+        
+        # UCI for PUCCH
+        if selected_ul == 'PUCCH':
+            st.markdown("### UCI (Uplink Control Information)")
+            
+            import pandas as pd
+            uci_info = pd.DataFrame({
+                'Type': ['HARQ-ACK', 'CSI', 'SR'],
+                'Purpose': [
+                    'ACK/NACK for received data',
+                    'Channel State Information (CQI, PMI, RI)',
+                    'Scheduling Request'
+                ],
+                'Size': ['1-2 bits per TB', '4-100+ bits', '1 bit'],
+                'Priority': ['High', 'Medium', 'Medium']
+            })
+            
+            st.dataframe(uci_info, use_container_width=True)
+        
+        if selected_ul == 'PRACH':
+            prach_panel()
+    
+    with st.expander("📚 Theory: Physical Channels"):
+        st.markdown("""
+        ### Channel Hierarchy
+        
+        **Logical Channels** ↔ **Transport Channels** ↔ **Physical Channels**
+        
+        **Example (Downlink):**
+        - DTCH (Logical) → DL-SCH (Transport) → PDSCH (Physical)
+        
+        ### Downlink Channels
+        
+        **PDSCH (Physical Downlink Shared Channel):**
+        - Main data channel
+        - Scheduled dynamically per slot
+        - Uses LDPC coding (better performance than Turbo codes in LTE)
+        - Supports adaptive modulation: QPSK → 256-QAM
+        - Can occupy any symbols not used by control/reference
+        
+        **PDCCH (Physical Downlink Control Channel):**
+        - Carries DCI (Downlink Control Information)
+        - Located in CORESET (Control Resource Set)
+        - Uses Polar coding (optimal for short messages)
+        - Always QPSK for robustness
+        - DCI formats: 0_x for UL, 1_x for DL, 2_x for other
+        
+        **PBCH (Physical Broadcast Channel):**
+        - Part of SSB (SS/PBCH Block)
+        - Carries MIB (Master Information Block)
+        - Transmitted periodically (typically every 20 ms)
+        - Essential for initial access
+        
+        ### Uplink Channels
+        
+        **PUSCH (Physical Uplink Shared Channel):**
+        - Main UL data channel
+        - Can use DFT-s-OFDM (for lower PAPR) or CP-OFDM
+        - π/2-BPSK at low SNR (better PAPR than QPSK)
+        - Supports transform precoding (DFT spread)
+        
+        **PUCCH (Physical Uplink Control Channel):**
+        - Carries UCI (Uplink Control Information)
+        - 5 formats (0-4) with different capacities/durations
+        - Format 0/2: Short (1-2 symbols)
+        - Format 1/3/4: Long (4-14 symbols)
+        - Uses sequence-based or coded transmission
+        
+        **PRACH (Physical Random Access Channel):**
+        - Initial access and beam recovery
+        - Uses Zadoff-Chu sequences (good autocorrelation)
+        - Multiple preamble formats (A0-A3, B1-B4, C0-C2)
+        - Short formats (1-2 symbols) for mmWave
+        - Long formats (up to 14 symbols) for sub-6 GHz
+        
+        ### Channel Coding
+        
+        **LDPC (Low-Density Parity-Check):**
+        - Used for data channels (PDSCH, PUSCH)
+        - Two base graphs: BG1 (large blocks), BG2 (small blocks)
+        - Better performance than Turbo codes
+        - Lower latency decoding
+        
+        **Polar:**
+        - Used for control channels (PDCCH, PUCCH)
+        - Achieves Shannon capacity for infinite length
+        - Good performance for short messages
+        - Lower complexity than Turbo codes
+        
+        **Sequence-based (PUCCH formats 0/1):**
+        - Very short UCI on PUCCH
+        - Uses predefined sequences and cyclic shifts
+        """)
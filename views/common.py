@@ -0,0 +1,84 @@
+"""Helpers and process-wide resources shared by the page modules."""
+
+import os
+import uuid
+from collections import deque
+from functools import wraps
+
+import streamlit as st
+
+from nr.grid import ResourceGridEngine
+from nr.timing import TC_PER_SUBFRAME
+from perf import spans as perf_spans
+from viz.figcache import FigureCache
+
+# JSON-lines performance log, one record per script or fragment rerun
+PERF_LOG = os.environ.get('NR_PERF_LOG')
+
+
+def get_slot_params(scs_khz):
+    """Get slot parameters based on subcarrier spacing"""
+    mu_map = {15: 0, 30: 1, 60: 2, 120: 3, 240: 4}
+    mu = mu_map[scs_khz]
+    
+    slot_duration_ms = 1.0 / (2**mu)
+    slots_per_subframe = 2**mu
+    slots_per_frame = 10 * slots_per_subframe
+    
+    return {
+        'mu': mu,
+        'slot_duration_ms': slot_duration_ms,
+        'slot_duration_tc': TC_PER_SUBFRAME // slots_per_subframe,
+        'slots_per_subframe': slots_per_subframe,
+        'slots_per_frame': slots_per_frame,
+        'symbols_per_slot': 14  # Normal CP
+    }
+
+@st.cache_resource
+def get_grid_engine():
+    """Process-wide resource grid engine shared by all sessions"""
+    return ResourceGridEngine()
+
+@st.cache_resource
+def get_figure_cache():
+    """Process-wide figure cache shared by all sessions"""
+    return FigureCache()
+
+def heatmap_mode():
+    """'image' (compressed label image) or 'heatmap', from the sidebar toggle"""
+    return 'image' if st.session_state.get('image_heatmaps', True) else 'heatmap'
+
+def cached_figure(key, builder):
+    """Figure from the shared cache; rebuilds are timed as 'figure_build'"""
+    with perf_spans.span('figure'):
+        return get_figure_cache().get_or_build(key, perf_spans.timed('figure_build', builder))
+
+def show_chart(fig, container=st):
+    """Send a figure to the browser, timed as 'plotly_chart' (serialization and send)"""
+    with perf_spans.span('plotly_chart'):
+        container.plotly_chart(fig, use_container_width=True)
+
+def finish_rerun():
+    """Close the current rerun's spans, keep them for the panel and log them"""
+    session = st.session_state.setdefault('perf_session', uuid.uuid4().hex[:8])
+    record = perf_spans.end(session=session)
+    if record is None:
+        return None
+    st.session_state.setdefault('perf_history', deque(maxlen=20)).append(record)
+    if PERF_LOG:
+        perf_spans.append_jsonl(PERF_LOG, record)
+    return record
+
+def traced_fragment(fn):
+    """st.fragment whose own reruns are recorded as separate span records"""
+    @wraps(fn)
+    def wrapper(*args, **kwargs):
+        if perf_spans.current() is not None:
+            with perf_spans.span(fn.__name__):
+                return fn(*args, **kwargs)
+        perf_spans.begin(st.session_state.get('perf_page'), kind=fn.__name__)
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            finish_rerun()
+    return st.fragment(wrapper)
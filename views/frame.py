@@ -0,0 +1,409 @@
+"""Frame & Slot Structure page: numerology, frame/subframe/slot/symbol timing views."""
+
+import streamlit as st
+import numpy as np
+import plotly.graph_objects as go
+from plotly.subplots import make_subplots
+
+from nr.timing import cp_lengths, slot_symbol_table, tc_to_ms, tc_to_us, useful_length
+from views.common import cached_figure, get_slot_params, show_chart
+from viz.figcache import figure_key
+from viz.timeline import interval_trace, timeline_layout
+
+# ============================================================================
+# FIGURE BUILDERS
+# ============================================================================
+
+def build_frame_figure(params, scs_khz, num_frames=1):
+    """Radio frame overview with its 10 subframes"""
+    subframe = np.arange(10 * num_frames)
+    sfn, sf = np.divmod(subframe, 10)
+    
+    fig = go.Figure(interval_trace(
+        subframe, 1.0,
+        color="lightblue", line_color="blue", line_width=2, opacity=0.3,
+        labels=[f"SF {k}" for k in sf],
+        customdata=np.stack([sfn, sf], axis=-1),
+        hovertemplate='SFN %{customdata[0]}, Subframe %{customdata[1]}<br>%{x:.1f} ms<extra></extra>'
+    ))
+    
+    frames_label = "10 subframes" if num_frames == 1 else f"{num_frames} frames × 10 subframes"
+    return timeline_layout(
+        fig,
+        f"Radio Frame ({frames_label}, {params['slots_per_frame']} slots/frame @ {scs_khz} kHz SCS)",
+        "Time (ms)", [0, 10 * num_frames], 200
+    )
+
+def build_frame_slots_figure(params, num_frames=1):
+    """All slots of a frame, grouped by subframe"""
+    slot = np.arange(num_frames * params['slots_per_frame'])
+    sfn, slot_in_frame = np.divmod(slot, params['slots_per_frame'])
+    
+    fig2 = go.Figure(interval_trace(
+        slot * params['slot_duration_ms'], params['slot_duration_ms'],
+        color="lightgreen", line_color="green", opacity=0.5,
+        customdata=np.stack([sfn, slot_in_frame // params['slots_per_subframe'], slot_in_frame], axis=-1),
+        hovertemplate='SFN %{customdata[0]}, Subframe %{customdata[1]}<br>Slot %{customdata[2]}<extra></extra>'
+    ))
+    
+    return timeline_layout(
+        fig2,
+        f"All {num_frames * params['slots_per_frame']} Slots ({params['slots_per_subframe']} slots/subframe)",
+        "Time (ms)", [0, 10 * num_frames], 200
+    )
+
+def build_subframe_figure(params):
+    """Slots within one 1 ms subframe"""
+    slot_width_ms = params['slot_duration_ms']
+    slot = np.arange(params['slots_per_subframe'])
+    
+    fig = go.Figure(interval_trace(
+        slot * slot_width_ms, slot_width_ms,
+        color="lightblue", line_color="blue", line_width=2, opacity=0.5,
+        labels=[f"Slot {k}" for k in slot],
+        customdata=slot,
+        hovertemplate='Slot %{customdata}<br>%{x:.4f} ms<extra></extra>'
+    ))
+    
+    return timeline_layout(
+        fig,
+        f"Subframe = {params['slots_per_subframe']} Slots ({slot_width_ms:.3f} ms each)",
+        "Time (ms)", [0, 1], 250
+    )
+
+def build_slot_figure(params, slot_idx=0):
+    """OFDM symbols within slot ``slot_idx`` of the frame"""
+    # Exact symbol boundaries (the first symbol of each 0.5 ms carries a longer CP)
+    slot_timing = slot_symbol_table(params['mu'], slot_idx % params['slots_per_subframe'])
+    symbol_starts_ms = tc_to_ms(slot_timing['start'])
+    symbol_lengths_ms = tc_to_ms(slot_timing['length'])
+    sym = np.arange(params['symbols_per_slot'])
+    
+    fig = go.Figure(interval_trace(
+        symbol_starts_ms, symbol_lengths_ms,
+        color=np.where(sym % 2 == 0, "lightblue", "lightcoral"), opacity=0.6,
+        labels=[str(k) for k in sym],
+        customdata=np.stack([sym, 1000 * symbol_lengths_ms], axis=-1),
+        hovertemplate='Symbol %{customdata[0]}<br>%{customdata[1]:.3f} μs<extra></extra>'
+    ))
+    
+    return timeline_layout(
+        fig,
+        f"Slot = {params['symbols_per_slot']} OFDM Symbols ({1000 * symbol_lengths_ms.min():.2f}-{1000 * symbol_lengths_ms.max():.2f} μs each)",
+        "Time (ms)", [0, symbol_starts_ms[-1] + symbol_lengths_ms[-1]], 250
+    )
+
+def build_symbol_figure(params):
+    """CP and useful part of the first and the other OFDM symbols"""
+    # Exact CP and useful durations from TS 38.211 (in Tc, shown in μs)
+    long_cp_tc, normal_cp_tc = cp_lengths(params['mu'])
+    useful_tc = useful_length(params['mu'])
+    
+    cp_duration_first = float(tc_to_us(long_cp_tc))
+    cp_duration_others = float(tc_to_us(normal_cp_tc))
+    useful_duration = float(tc_to_us(useful_tc))
+    
+    fig = make_subplots(
+        rows=2, cols=1,
+        subplot_titles=('First Symbol (longer CP)', 'Other Symbols'),
+        vertical_spacing=0.15
+    )
+    
+    # First symbol
+    fig.add_shape(
+        type="rect",
+        x0=0, x1=cp_duration_first, y0=0, y1=1,
+        fillcolor="green", opacity=0.5,
+        line=dict(color="black"),
+        row=1, col=1
+    )
+    fig.add_annotation(
+        x=cp_duration_first/2, y=0.5,
+        text="CP",
+        showarrow=False,
+        row=1, col=1
+    )
+    
+    fig.add_shape(
+        type="rect",
+        x0=cp_duration_first, x1=cp_duration_first + useful_duration, y0=0, y1=1,
+        fillcolor="blue", opacity=0.5,
+        line=dict(color="black"),
+        row=1, col=1
+    )
+    fig.add_annotation(
+        x=cp_duration_first + useful_duration/2, y=0.5,
+        text="Useful Symbol (FFT)",
+        showarrow=False,
+        row=1, col=1
+    )
+    
+    # Other symbols
+    fig.add_shape(
+        type="rect",
+        x0=0, x1=cp_duration_others, y0=0, y1=1,
+        fillcolor="green", opacity=0.5,
+        line=dict(color="black"),
+        row=2, col=1
+    )
+    fig.add_annotation(
+        x=cp_duration_others/2, y=0.5,
+        text="CP",
+        showarrow=False,
+        row=2, col=1
+    )
+    
+    fig.add_shape(
+        type="rect",
+        x0=cp_duration_others, x1=cp_duration_others + useful_duration, y0=0, y1=1,
+        fillcolor="blue", opacity=0.5,
+        line=dict(color="black"),
+        row=2, col=1
+    )
+    fig.add_annotation(
+        x=cp_duration_others + useful_duration/2, y=0.5,
+        text="Useful Symbol (FFT)",
+        showarrow=False,
+        row=2, col=1
+    )
+    
+    fig.update_xaxes(title_text="Time (μs)", row=1, col=1)
+    fig.update_xaxes(title_text="Time (μs)", row=2, col=1)
+    fig.update_yaxes(showticklabels=False, row=1, col=1)
+    fig.update_yaxes(showticklabels=False, row=2, col=1)
+    
+    fig.update_layout(height=500, showlegend=False)
+    
+    return fig
+
+# ============================================================================
+# PAGE
+# ============================================================================
+
+def render():
+    """Render the Frame & Slot Structure page"""
+    st.markdown('<p class="section-header">🕐 5G NR Frame & Slot Structure</p>', unsafe_allow_html=True)
+    
+    col1, col2 = st.columns([1, 2])
+    
+    with col1:
+        st.markdown("### Numerology Selection")
+        
+        scs_options = {
+            '15 kHz (μ=0)': 15,
+            '30 kHz (μ=1)': 30,
+            '60 kHz (μ=2)': 60,
+            '120 kHz (μ=3)': 120,
+            '240 kHz (μ=4)': 240
+        }
+        
+        scs_label = st.selectbox("Subcarrier Spacing", list(scs_options.keys()), index=1)
+        scs_khz = scs_options[scs_label]
+        
+        params = get_slot_params(scs_khz)
+        
+        st.markdown("### Display Options")
+        view_level = st.radio(
+            "View Level",
+            ["Frame (10 ms)", "Subframe (1 ms)", "Slot", "Symbol"],
+            index=2
+        )
+        
+        if view_level == "Frame (10 ms)":
+            num_frames_show = st.slider("Number of Frames", 1, 8, 1)
+        
+        if view_level == "Slot":
+            slot_idx = st.slider("Slot Index", 0, params['slots_per_frame']-1, 0)
+        
+        show_timing = st.checkbox("Show Timing Information", value=True)
+    
+    with col2:
+        if view_level == "Frame (10 ms)":
+            st.markdown(f"### Radio Frame Structure ({10 * num_frames_show} ms)")
+            
+            fig = cached_figure(
+                figure_key('frame', scs_khz=scs_khz, num_frames=num_frames_show),
+                lambda: build_frame_figure(params, scs_khz, num_frames_show)
+            )
+            
+            show_chart(fig)
+            
+            # Slot breakdown
+            st.markdown("### Slot Distribution per Subframe")
+            
+            fig2 = cached_figure(
+                figure_key('frame_slots', scs_khz=scs_khz, num_frames=num_frames_show),
+                lambda: build_frame_slots_figure(params, num_frames_show)
+            )
+            
+            show_chart(fig2)
+        
+        elif view_level == "Subframe (1 ms)":
+            st.markdown("### Subframe Structure (1 ms)")
+            
+            fig = cached_figure(
+                figure_key('subframe', scs_khz=scs_khz),
+                lambda: build_subframe_figure(params)
+            )
+            
+            show_chart(fig)
+        
+        elif view_level == "Slot":
+            st.markdown(f"### Slot {slot_idx} Structure")
+            
+            fig = cached_figure(
+                figure_key('slot', scs_khz=scs_khz, slot_in_subframe=slot_idx % params['slots_per_subframe']),
+                lambda: build_slot_figure(params, slot_idx)
+            )
+            
+            show_chart(fig)
+        
+        else:  # Symbol level
+            st.markdown("### OFDM Symbol Structure")
+            
+            fig = cached_figure(
+                figure_key('symbol', scs_khz=scs_khz),
+                lambda: build_symbol_figure(params)
+            )
+            show_chart(fig)
+    
+    if show_timing:
+        st.markdown("### Timing Parameters Summary")
+        
+        col_a, col_b, col_c, col_d, col_e = st.columns(5)
+        
+        with col_a:
+            st.metric("Numerology (μ)", params['mu'])
+        with col_b:
+            st.metric("SCS (kHz)", scs_khz)
+        with col_c:
+            st.metric("Slot Duration", f"{params['slot_duration_ms']:.3f} ms")
+        with col_d:
+            st.metric("Slots/Frame", params['slots_per_frame'])
+        with col_e:
+            st.metric("Symbols/Slot", params['symbols_per_slot'])
+        
+        # Detailed timing table (exact values, computed in Tc)
+        long_cp_tc, normal_cp_tc = cp_lengths(params['mu'])
+        useful_tc = useful_length(params['mu'])
+        
+        import pandas as pd
+        timing_df = pd.DataFrame({
+            'Parameter': [
+                'Radio Frame',
+                'Subframe',
+                'Slot',
+                'OFDM Symbol',
+                'OFDM Symbol (every 0.5 ms)',
+                'Useful Symbol (FFT)',
+                'Cyclic Prefix',
+                'Cyclic Prefix (every 0.5 ms)',
+                'Slots per Frame',
+                'Slots per Subframe',
+                'Symbols per Slot'
+            ],
+            'Duration': [
+                '10 ms',
+                '1 ms',
+                f'{params["slot_duration_ms"]:.4f} ms',
+                f'{tc_to_us(normal_cp_tc + useful_tc):.3f} μs ({normal_cp_tc + useful_tc} Tc)',
+                f'{tc_to_us(long_cp_tc + useful_tc):.3f} μs ({long_cp_tc + useful_tc} Tc)',
+                f'{tc_to_us(useful_tc):.3f} μs ({useful_tc} Tc)',
+                f'{tc_to_us(normal_cp_tc):.3f} μs ({normal_cp_tc} Tc)',
+                f'{tc_to_us(long_cp_tc):.3f} μs ({long_cp_tc} Tc)',
+                '-',
+                '-',
+                '-'
+            ],
+            'Count': [
+                '1',
+                '10',
+                f'{params["slots_per_frame"]}',
+                f'{params["symbols_per_slot"] * params["slots_per_frame"] - 20}',
+                '20',
+                f'{params["symbols_per_slot"] * params["slots_per_frame"]}',
+                f'{params["symbols_per_slot"] * params["slots_per_frame"] - 20}',
+                '20',
+                f'{params["slots_per_frame"]}',
+                f'{params["slots_per_subframe"]}',
+                f'{params["symbols_per_slot"]}'
+            ]
+        })
+        
+        st.dataframe(timing_df, use_container_width=True)
+    
+    with st.expander("📚 Theory: 5G NR Frame Structure"):
+        st.markdown("""
+        ### Frame Hierarchy
+        
+        **5G NR time domain hierarchy:**
+        
+        ```
+        Radio Frame (10 ms)
+        └── Subframe (1 ms) × 10
+            └── Slot (variable) × 2^μ
+                └── OFDM Symbol (variable) × 14 (normal CP)
+        ```
+        
+        ### Radio Frame
+        
+        - **Duration:** Always 10 ms (fixed)
+        - **Contains:** 10 subframes
+        - **Frame number:** System Frame Number (SFN), 0-1023 (repeats every 10.24 seconds)
+        
+        ### Subframe
+        
+        - **Duration:** Always 1 ms (fixed)
+        - **Contains:** $2^\\mu$ slots
+        - Used for TDD UL/DL configuration
+        
+        ### Slot
+        
+        - **Duration:** $T_{slot} = \\frac{1}{2^\\mu}$ ms
+        - **Contains:** 14 OFDM symbols (normal CP) or 12 (extended CP)
+        - Basic scheduling unit in 5G NR
+        
+        | μ | SCS | Slot Duration | Slots/Subframe | Slots/Frame |
+        |---|-----|---------------|----------------|-------------|
+        | 0 | 15 kHz | 1.0 ms | 1 | 10 |
+        | 1 | 30 kHz | 0.5 ms | 2 | 20 |
+        | 2 | 60 kHz | 0.25 ms | 4 | 40 |
+        | 3 | 120 kHz | 0.125 ms | 8 | 80 |
+        | 4 | 240 kHz | 0.0625 ms | 16 | 160 |
+        
+        ### OFDM Symbol
+        
+        - **Duration:** $T_{symbol} = \\frac{T_{slot}}{14}$
+        - **Consists of:** Cyclic Prefix + Useful Symbol
+        - **CP duration:** Longer for first symbol, shorter for others
+        
+        **Why different CP lengths?**
+        - Allows FFT window to be exactly $1/\\Delta f$
+        - Total slot duration remains constant
+        
+        ### Cyclic Prefix
+        
+        **Normal CP (most common):**
+        - First symbol: ≈ 5.2 μs at 15 kHz SCS
+        - Other symbols: ≈ 4.7 μs at 15 kHz SCS
+        - Scales with numerology (divide by $2^\mu$)
+        
+        **Extended CP (only for μ=2, 60 kHz):**
+        - Longer CP with 12 symbols per slot
+        - Used for high delay spread scenarios
+        
+        ### Mini-Slots
+        
+        For **ultra-low latency** applications:
+        - Can be 2, 4, or 7 symbols
+        - Allows faster scheduling
+        - Used for URLLC (Ultra-Reliable Low Latency Communication)
+        
+        ### Time Domain Flexibility
+        
+        Unlike LTE (fixed 1 ms TTI), 5G NR offers:
+        - **Slot-based scheduling:** 14 symbols
+        - **Non-slot scheduling:** Flexible start/duration
+        - **Mini-slots:** 2-13 symbols
+        - Enables diverse latency requirements
+        """)
@@ -0,0 +1,673 @@
+"""Reference Signals page: DMRS, CSI-RS and SSB."""
+
+import streamlit as st
+import numpy as np
+import plotly.graph_objects as go
+from plotly.colors import hex_to_rgb, qualitative
+
+from nr.bandwidth import MAX_NRB
+from nr.csirs import (CSI_RS_ROWS, PERIODICITIES_SLOTS, CsiRsConfig, cdm_group_ports, required_bits, res_per_rb,
+                      rows_for_ports, uses_l1)
+from nr.csirs import overhead as csirs_overhead, slot_grid as csirs_slot_grid, slot_values as csirs_slot_values
+from nr.dmrs import MAX_CDM_GROUPS, dmrs_cdm_group_grid, dmrs_symbol_positions, dmrs_values
+from nr.ssb import (PERIODICITIES_MS, burst_duty_cycle, burst_set, burst_times_tc, candidate_map, case_scs,
+                    half_frame_map)
+from nr.sync import NUM_PCI, pbch_dmrs_values, split_pci, ssb_labels, ssb_sync_values
+from nr.timing import MU_BY_SCS, SFN_CYCLE, tc_to_ms
+from perf import spans as perf_spans
+from views.common import cached_figure, heatmap_mode, show_chart, traced_fragment
+from viz.figcache import figure_key
+from viz.labelimage import add_label_image
+from viz.overlays import add_rb_boundaries
+
+# ============================================================================
+# FIGURE BUILDERS
+# ============================================================================
+
+# RGB per DMRS grid value (data, then CDM groups 0-2) for image rendering
+DMRS_PALETTE = [
+    (173, 216, 230),  # Data (lightblue)
+    (255, 0, 0),      # CDM group 0 (red)
+    (255, 165, 0),    # CDM group 1 (orange)
+    (128, 0, 128),    # CDM group 2 (purple)
+]
+
+def build_dmrs_figure(dmrs_grid, num_rbs_dmrs, num_symbols_dmrs, title, mode='image'):
+    """DMRS REs colored by CDM group, as a label image or a heatmap"""
+    if mode == 'image':
+        fig = add_label_image(
+            go.Figure(), dmrs_grid, DMRS_PALETTE,
+            {g + 1: f"CDM group {g}" for g in range(int(dmrs_grid.max()))},
+            hovertemplate='Symbol: %{y}<br>Subcarrier: %{x}<extra></extra>'
+        )
+    else:
+        fig = go.Figure(data=go.Heatmap(
+            z=dmrs_grid,
+            zmin=0, zmax=3,
+            colorscale=[
+                [0, 'lightblue'], [0.25, 'lightblue'],  # Data
+                [0.25, 'red'], [0.5, 'red'],            # CDM group 0
+                [0.5, 'orange'], [0.75, 'orange'],      # CDM group 1
+                [0.75, 'purple'], [1, 'purple']         # CDM group 2
+            ],
+            showscale=False,
+            hovertemplate='Symbol: %{y}<br>Subcarrier: %{x}<br>CDM group + 1: %{z}<extra></extra>'
+        ))
+    
+    # Add RB boundaries
+    add_rb_boundaries(fig, num_rbs_dmrs, num_symbols_dmrs)
+    
+    fig.update_layout(
+        title=title,
+        xaxis_title="Subcarrier",
+        yaxis_title="OFDM Symbol",
+        height=500,
+        yaxis=dict(autorange='reversed')
+    )
+    
+    return fig
+
+# RGB per CSI-RS grid value (no CSI-RS, then CDM groups 0-15) for image rendering
+CSIRS_PALETTE = [(211, 211, 211)] + [hex_to_rgb(c) for c in qualitative.Dark24[:16]]
+
+def build_csirs_figure(csirs_grid, group_ports, title, mode='image'):
+    """CSI-RS REs colored by CDM group, as a label image or a heatmap"""
+    num_groups = int(csirs_grid.max())
+    if mode == 'image':
+        fig = add_label_image(go.Figure(), csirs_grid, CSIRS_PALETTE,
+                              {g + 1: f"CDM group {g}: ports {', '.join(map(str, group_ports[g]))}"
+                               for g in range(num_groups)},
+                              hovertemplate='Symbol: %{y}<br>Subcarrier: %{x}<extra></extra>')
+    else:
+        colors = ['rgb({}, {}, {})'.format(*rgb) for rgb in CSIRS_PALETTE[:num_groups + 1]]
+        fig = go.Figure(data=go.Heatmap(
+            z=csirs_grid,
+            zmin=0, zmax=max(num_groups, 1),
+            colorscale=[[i / max(num_groups, 1), color] for i, color in enumerate(colors)],
+            showscale=False,
+            hovertemplate='Symbol: %{y}<br>Subcarrier: %{x}<br>CDM group + 1: %{z}<extra></extra>'
+        ))
+    
+    fig.update_layout(
+        title=title,
+        xaxis_title="Subcarrier",
+        yaxis_title="OFDM Symbol",
+        height=400,
+        yaxis=dict(autorange='reversed')
+    )
+    
+    return fig
+
+# RGB per SSB grid value (unused, PBCH, PSS, PBCH DMRS, SSS) for image rendering
+SSB_PALETTE = [
+    (255, 255, 255),  # Unused
+    (173, 216, 230),  # PBCH (lightblue)
+    (255, 0, 0),      # PSS (red)
+    (255, 165, 0),    # PBCH DMRS (orange)
+    (0, 0, 255),      # SSS (blue)
+]
+
+def build_ssb_figure(ssb_grid, mode='image'):
+    """SS/PBCH block structure, as a label image or a heatmap"""
+    if mode == 'image':
+        fig = add_label_image(
+            go.Figure(), ssb_grid.astype(np.uint8), SSB_PALETTE,
+            {1: "PBCH", 2: "PSS", 3: "PBCH DMRS", 4: "SSS"},
+            hovertemplate='Symbol: %{y}<br>Subcarrier: %{x}<extra></extra>'
+        )
+    else:
+        fig = go.Figure(data=go.Heatmap(
+            z=ssb_grid,
+            colorscale=[
+                [0, 'white'],
+                [0.2, 'lightblue'],  # PBCH
+                [0.4, 'red'],         # PSS
+                [0.6, 'orange'],      # DMRS
+                [0.8, 'blue'],        # SSS
+                [1, 'blue']
+            ],
+            showscale=False
+        ))
+    
+    fig.update_layout(
+        title="SSB Block Structure",
+        xaxis_title="Subcarrier (within SSB)",
+        yaxis_title="Symbol",
+        height=300,
+        yaxis=dict(autorange='reversed')
+    )
+    
+    return fig
+
+# RGB per sequence value (-1, unused, +1) for image rendering
+SSB_SEQUENCE_PALETTE = [(0, 0, 255), (255, 255, 255), (255, 0, 0)]
+
+def build_ssb_sequence_figure(values, pci, mode='image'):
+    """PSS and SSS BPSK values of one cell, as a label image or a heatmap"""
+    if mode == 'image':
+        fig = add_label_image(
+            go.Figure(), (values + 1).astype(np.uint8), SSB_SEQUENCE_PALETTE,
+            {0: "-1", 2: "+1"},
+            hovertemplate='Symbol: %{y}<br>Subcarrier: %{x}<extra></extra>'
+        )
+    else:
+        fig = go.Figure(data=go.Heatmap(
+            z=values,
+            zmin=-1, zmax=1,
+            colorscale=[[0, 'blue'], [0.5, 'white'], [1, 'red']],
+            showscale=False,
+            hovertemplate='Symbol: %{y}<br>Subcarrier: %{x}<br>Value: %{z}<extra></extra>'
+        ))
+    
+    fig.update_layout(
+        title=f"PSS (symbol 0) and SSS (symbol 2) for PCI {pci}",
+        xaxis_title="Subcarrier (within SSB)",
+        yaxis_title="Symbol",
+        height=250,
+        yaxis=dict(autorange='reversed')
+    )
+    
+    return fig
+
+# Burst map values: no SSB, transmitted SSB, candidate position left unused
+SSB_BURST_PALETTE = [(255, 255, 255), (255, 0, 0), (211, 211, 211)]
+
+def build_ssb_burst_figure(case, l_max, bitmap, mode='image'):
+    """Transmitted and unused SSB candidate symbols over the slots of a half frame"""
+    ssb_map = half_frame_map(case, l_max, bitmap)
+    burst_map = np.where(ssb_map >= 0, 1, np.where(candidate_map(case, l_max), 2, 0)).astype(np.uint8).T
+    hovertemplate = 'Slot: %{x}<br>Symbol: %{y}<extra></extra>'
+    
+    if mode == 'image':
+        fig = add_label_image(go.Figure(), burst_map, SSB_BURST_PALETTE,
+                              {1: "Transmitted SSB", 2: "Unused candidate"}, hovertemplate=hovertemplate)
+    else:
+        fig = go.Figure(data=go.Heatmap(
+            z=burst_map,
+            zmin=0, zmax=2,
+            colorscale=[
+                [0, 'white'], [0.33, 'white'],
+                [0.33, 'red'], [0.67, 'red'],
+                [0.67, 'lightgray'], [1, 'lightgray']
+            ],
+            showscale=False,
+            hovertemplate=hovertemplate
+        ))
+    
+    fig.update_layout(
+        title=f"Case {case}: {int(np.count_nonzero(burst_map == 1)) // 4} of {l_max} SSBs over {burst_map.shape[1]} slots",
+        xaxis_title="Slot (in half frame)",
+        yaxis_title="OFDM Symbol",
+        height=350,
+        yaxis=dict(autorange='reversed')
+    )
+    
+    return fig
+
+# RGB per QPSK value (none, then the four quadrants counterclockwise from 1 + j)
+QPSK_PALETTE = [(255, 255, 255), (255, 0, 0), (0, 128, 0), (0, 0, 255), (255, 165, 0)]
+QPSK_NAMES = {1: "+1+j", 2: "-1+j", 3: "-1-j", 4: "+1-j"}
+
+def qpsk_labels(values):
+    """uint8 quadrant 1-4 of every nonzero QPSK value, 0 elsewhere"""
+    quadrant = np.floor(np.angle(values) / (np.pi / 2)).astype(np.int64) % 4
+    return np.where(values != 0, quadrant + 1, 0).astype(np.uint8)
+
+def build_qpsk_figure(values, title, xaxis_title="Subcarrier", height=400, mode='image'):
+    """Reference-signal QPSK values colored by quadrant (scaled by 1/√2), as a label image or a heatmap"""
+    labels = qpsk_labels(values)
+    if mode == 'image':
+        fig = add_label_image(go.Figure(), labels, QPSK_PALETTE, QPSK_NAMES,
+                              hovertemplate='Symbol: %{y}<br>Subcarrier: %{x}<extra></extra>')
+    else:
+        colors = ['rgb({}, {}, {})'.format(*rgb) for rgb in QPSK_PALETTE]
+        fig = go.Figure(data=go.Heatmap(
+            z=labels,
+            zmin=0, zmax=4,
+            colorscale=[[i / 4, color] for i, color in enumerate(colors)],
+            showscale=False,
+            hovertemplate='Symbol: %{y}<br>Subcarrier: %{x}<br>Quadrant: %{z}<extra></extra>'
+        ))
+    
+    fig.update_layout(
+        title=title,
+        xaxis_title=xaxis_title,
+        yaxis_title="OFDM Symbol",
+        height=height,
+        yaxis=dict(autorange='reversed')
+    )
+    
+    return fig
+
+# ============================================================================
+# PAGE FRAGMENTS
+# ============================================================================
+
+@traced_fragment
+def dmrs_panel():
+    """DMRS configuration and pattern; reruns alone on its own widgets"""
+    st.markdown("### DMRS (Demodulation Reference Signal)")
+    
+    col1, col2 = st.columns([1, 2])
+    
+    with col1:
+        st.markdown("#### Configuration")
+        
+        dmrs_config_type = st.radio("DMRS Configuration Type", ["Type 1", "Type 2"])
+        dmrs_max_length = st.radio("DMRS Length", [1, 2], horizontal=True,
+                                   format_func=lambda n: "Single-symbol" if n == 1 else "Double-symbol")
+        dmrs_typea_pos = st.radio("dmrs-TypeA-Position", [2, 3], horizontal=True)
+        # Additional position 3 needs dmrs-TypeA-Position 2
+        dmrs_additional = st.selectbox(
+            "dmrs-AdditionalPosition",
+            [0, 1] if dmrs_max_length == 2 else [0, 1, 2, 3] if dmrs_typea_pos == 2 else [0, 1, 2],
+            index=0
+        )
+        
+        config_type_num = 1 if dmrs_config_type == "Type 1" else 2
+        num_cdm_groups = st.slider("Number of CDM Groups (without data)", 1,
+                                   MAX_CDM_GROUPS[config_type_num], 1)
+        dmrs_slot = st.number_input("Slot Number in Frame", 0, 159, 0, key='dmrs_slot')
+        dmrs_nid = st.number_input("scramblingID (N_ID)", 0, 65535, 0, key='dmrs_nid')
+        
+        st.markdown("""
+        **DMRS Type 1:**
+        - Every other subcarrier
+        - 6 REs per RB per symbol
+        - Suitable for normal scenarios
+        
+        **DMRS Type 2:**
+        - 2 consecutive out of 6 subcarriers
+        - 4 REs per RB per symbol
+        - Lower overhead, supports more CDM groups
+        """)
+    
+    with col2:
+        # Visualize DMRS pattern
+        num_rbs_dmrs = 10
+        num_symbols_dmrs = 14
+        
+        with perf_spans.span('dmrs'):
+            dmrs_grid = dmrs_cdm_group_grid(
+                num_rbs_dmrs, num_symbols_dmrs, config_type_num, num_cdm_groups,
+                additional_position=dmrs_additional, typea_position=dmrs_typea_pos,
+                max_length=dmrs_max_length
+            )
+        
+        dmrs_positions_shown = dmrs_symbol_positions(num_symbols_dmrs, dmrs_typea_pos, dmrs_additional, dmrs_max_length)
+        dmrs_title = f"DMRS Pattern - {dmrs_config_type}, symbols {dmrs_positions_shown}"
+        fig = cached_figure(
+            figure_key('dmrs', config_type=config_type_num, cdm_groups=num_cdm_groups,
+                       additional_position=dmrs_additional, typea_position=dmrs_typea_pos,
+                       max_length=dmrs_max_length, mode=heatmap_mode()),
+            lambda: build_dmrs_figure(dmrs_grid, num_rbs_dmrs, num_symbols_dmrs, dmrs_title, heatmap_mode())
+        )
+        
+        show_chart(fig)
+        
+        st.markdown("🔴 **CDM group 0** | 🟠 **CDM group 1** | 🟣 **CDM group 2**")
+        
+        # Calculate overhead
+        dmrs_res = np.count_nonzero(dmrs_grid)
+        total_res = num_rbs_dmrs * 12 * num_symbols_dmrs
+        overhead_pct = 100 * dmrs_res / total_res
+        
+        st.metric("DMRS Overhead", f"{overhead_pct:.1f}%")
+        
+        with perf_spans.span('dmrs_values'):
+            dmrs_qpsk = dmrs_values(dmrs_grid, config_type_num, dmrs_slot, dmrs_nid)
+        fig = cached_figure(
+            figure_key('dmrs_values', config_type=config_type_num, cdm_groups=num_cdm_groups,
+                       additional_position=dmrs_additional, typea_position=dmrs_typea_pos,
+                       max_length=dmrs_max_length, slot=dmrs_slot, n_id=dmrs_nid, mode=heatmap_mode()),
+            lambda: build_qpsk_figure(dmrs_qpsk, f"DMRS QPSK Values - slot {dmrs_slot}, N_ID {dmrs_nid}",
+                                      mode=heatmap_mode())
+        )
+        
+        show_chart(fig)
+
+@traced_fragment
+def csirs_panel():
+    """CSI-RS resource configuration, mapping and overhead over the SFN cycle"""
+    st.markdown("### CSI-RS (Channel State Information Reference Signal)")
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.markdown("""
+        **Purpose:**
+        - Channel quality measurement (CQI)
+        - Beam management
+        - Mobility measurements
+        - L1-RSRP reporting
+        
+        **Key Features:**
+        - Configurable density (1, 2, 4, 8, 12, 16, 24, 32 ports)
+        - Periodic, aperiodic, or semi-persistent
+        - Lower overhead than DMRS
+        - Can be beamformed
+        """)
+        
+        csi_rs_ports = st.selectbox("Number of Ports", [1, 2, 4, 8, 12, 16, 24, 32], index=2)
+        csi_rs_row = st.selectbox(
+            "Table 7.4.1.5.3-1 Row", rows_for_ports(csi_rs_ports),
+            format_func=lambda row: f"Row {row}: {CSI_RS_ROWS[row][2]}"
+        )
+        csi_rs_density = st.selectbox("Density (REs/RB/port)", CSI_RS_ROWS[csi_rs_row][1])
+        
+        num_bits = CSI_RS_ROWS[csi_rs_row][3]
+        csi_rs_bitmap = st.text_input(
+            f"frequencyDomainAllocation (b{num_bits - 1} ... b0)",
+            format(2**required_bits(csi_rs_row) - 1, f'0{num_bits}b'),
+            max_chars=num_bits, key=f'csirs_bitmap_{csi_rs_row}'
+        )
+        csi_rs_l0 = st.slider("firstOFDMSymbolInTimeDomain (l0)", 0, 13, 5)
+        csi_rs_l1 = (st.slider("firstOFDMSymbolInTimeDomain2 (l1)", 2, 12, 9)
+                     if uses_l1(csi_rs_row) else 9)
+        
+        csi_rs_scs = st.selectbox("Subcarrier Spacing (kHz)", [15, 30, 60, 120], index=1, key='csirs_scs')
+        slots_per_ms = 2**MU_BY_SCS[csi_rs_scs]
+        csi_rs_periodicity = st.selectbox(
+            "Periodicity",
+            [ms for ms in (5, 10, 20, 40, 80, 160) if ms * slots_per_ms in PERIODICITIES_SLOTS],
+            index=1, format_func=lambda ms: f"{ms} ms ({ms * slots_per_ms} slots)"
+        )
+        csi_rs_rbs = st.slider("CSI-RS Bandwidth (RBs)", 4, MAX_NRB, 52)
+        csi_rs_nid = st.number_input("scramblingID", 0, 1023, 0, key='csirs_nid')
+    
+    with col2:
+        st.markdown("#### CSI-RS Resource Mapping")
+        
+        try:
+            csirs_config = CsiRsConfig(
+                row=csi_rs_row, frequency_bitmap=int(csi_rs_bitmap, 2) if csi_rs_bitmap else -1,
+                l0=csi_rs_l0, l1=csi_rs_l1, density=csi_rs_density, num_rbs=csi_rs_rbs,
+                periodicity=csi_rs_periodicity * slots_per_ms
+            )
+        except ValueError as e:
+            st.error(str(e))
+            return
+        
+        # The figure shows the first RBs of the allocation; metrics cover all of it
+        num_rbs_shown = min(10, csi_rs_rbs)
+        csirs_grid = csirs_slot_grid(csirs_config, num_rbs_shown)
+        fig = cached_figure(
+            figure_key('csirs', config=csirs_config, num_rbs=num_rbs_shown, mode=heatmap_mode()),
+            lambda: build_csirs_figure(
+                csirs_grid, cdm_group_ports(csirs_config),
+                f"Row {csi_rs_row}: {csi_rs_ports} ports, {csirs_config.cdm_type}, first {num_rbs_shown} RBs",
+                heatmap_mode()
+            )
+        )
+        
+        show_chart(fig)
+        
+        # Values in the first occasion's slot, before the CDM cover codes
+        csirs_slot = csirs_config.offset % (10 * slots_per_ms)
+        with perf_spans.span('csirs_values'):
+            csirs_qpsk = csirs_slot_values(csirs_config, csirs_slot, csi_rs_nid, num_rbs_shown)
+        fig = cached_figure(
+            figure_key('csirs_values', config=csirs_config, num_rbs=num_rbs_shown, n_id=csi_rs_nid,
+                       mode=heatmap_mode()),
+            lambda: build_qpsk_figure(csirs_qpsk, f"CSI-RS QPSK Values - slot {csirs_slot}, scramblingID {csi_rs_nid}",
+                                      mode=heatmap_mode())
+        )
+        
+        show_chart(fig)
+        
+        with perf_spans.span('csirs_overhead'):
+            csirs_budget = csirs_overhead(csirs_config, csi_rs_scs)
+        col_a, col_b, col_c = st.columns(3)
+        with col_a:
+            st.metric("REs per RB per Slot", res_per_rb(csirs_config))
+        with col_b:
+            st.metric("Occasions per SFN Cycle", f"{csirs_budget['occasions']:,}")
+        with col_c:
+            st.metric("Overhead (SFN cycle)", f"{100 * csirs_budget['fraction']:.3f}%")
+        
+        st.info(f"CSI-RS uses {csirs_budget['res_per_occasion']:,} REs per occasion and "
+                f"{csirs_budget['total_res']:,} REs over {SFN_CYCLE} frames")
+
+# ============================================================================
+# PAGE
+# ============================================================================
+
+def render():
+    """Render the Reference Signals page"""
+    st.markdown('<p class="section-header">🎯 Reference Signals in 5G NR</p>', unsafe_allow_html=True)
+    
+    st.markdown("""
+    Reference signals are known sequences used for **synchronization**, **channel estimation**, 
+    and **measurements**. 5G NR has several types optimized for different purposes.
+    """)
+    
+    tab1, tab2, tab3 = st.tabs(["📊 DMRS", "🔍 CSI-RS", "📡 SSB"])
+    
+    with tab1:
+        dmrs_panel()
+    
+    with tab2:
+        csirs_panel()
+    
+    with tab3:
+        st.markdown("### SSB (SS/PBCH Block)")
+        
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            st.markdown("""
+            **SS/PBCH Block consists of:**
+            1. **PSS** (Primary Synchronization Signal)
+            2. **SSS** (Secondary Synchronization Signal)
+            3. **PBCH** (Physical Broadcast Channel)
+            4. **PBCH DMRS** (Reference signals for PBCH)
+            
+            **Purpose:**
+            - Cell search and initial synchronization
+            - Cell identification (Physical Cell ID)
+            - Coarse time/frequency synchronization
+            - Broadcast essential system info (MIB)
+            """)
+            
+            ssb_frequency = st.selectbox(
+                "SSB Frequency Range",
+                ["sub-3 GHz (FR1 low)", "3-6 GHz (FR1 high)", "24-40 GHz (FR2)"],
+                index=0
+            )
+            
+            if "FR1" in ssb_frequency:
+                max_ssb = 4 if "low" in ssb_frequency else 8
+                case_options = ["Case A", "Case B", "Case C"]
+            else:
+                max_ssb = 64
+                case_options = ["Case D", "Case E"]
+            
+            ssb_pattern = st.selectbox("SSB Pattern", case_options)
+            ssb_case = ssb_pattern[-1]
+            st.caption(f"{case_scs(ssb_case)} kHz SCS, L_max = {max_ssb}")
+            
+            ssb_bitmap = st.text_input(
+                "ssb-PositionsInBurst (bitmap, SSB 0 first)", "1" * max_ssb,
+                max_chars=max_ssb, key=f'ssb_bitmap_{max_ssb}'
+            )
+            ssb_periodicity = st.selectbox("SSB Periodicity (ms)", PERIODICITIES_MS, index=2)
+            ssb_pci = st.number_input("Physical Cell ID", 0, NUM_PCI - 1, 0, key='ssb_pci')
+            nid1, nid2 = split_pci(ssb_pci)
+            st.caption(f"N_ID1 = {nid1}, N_ID2 = {nid2}")
+            ssb_index = st.number_input("SSB Index", 0, max_ssb - 1, 0, key=f'ssb_index_{max_ssb}')
+        
+        with col2:
+            st.markdown("#### SSB Structure (4 OFDM Symbols × 240 Subcarriers)")
+            
+            # SSB RE map for the selected cell (PBCH DMRS shift v = PCI mod 4)
+            ssb_grid = ssb_labels(ssb_pci % 4)
+            
+            fig = cached_figure(
+                figure_key('ssb_block', dmrs_shift=ssb_pci % 4, mode=heatmap_mode()),
+                lambda: build_ssb_figure(ssb_grid, heatmap_mode())
+            )
+            
+            show_chart(fig)
+            
+            fig = cached_figure(
+                figure_key('ssb_sequences', pci=ssb_pci, mode=heatmap_mode()),
+                lambda: build_ssb_sequence_figure(ssb_sync_values(ssb_pci), ssb_pci, heatmap_mode())
+            )
+            
+            show_chart(fig)
+            
+            # i_SSB-bar is the index (+ 4 n_hf, here 0) for L_max = 4 and its 3 LSBs otherwise
+            ssb_dmrs_index = ssb_index % 8
+            fig = cached_figure(
+                figure_key('ssb_pbch_dmrs', pci=ssb_pci, i_ssb=ssb_dmrs_index, mode=heatmap_mode()),
+                lambda: build_qpsk_figure(pbch_dmrs_values(ssb_pci, ssb_dmrs_index),
+                                          f"PBCH DMRS QPSK Values - PCI {ssb_pci}, SSB {ssb_index}",
+                                          "Subcarrier (within SSB)", 250, heatmap_mode())
+            )
+            
+            show_chart(fig)
+            
+            # Legend
+            st.markdown("""
+            🔴 **PSS** | 🔵 **SSS** | 🔵 **PBCH** | 🟠 **PBCH DMRS**
+            """)
+            
+            st.info(f"""
+            **SSB Periodicity:** 5, 10, 20, 40, 80, or 160 ms (configurable)
+            
+            **Max SSBs in burst:** {max_ssb} (depends on frequency range)
+            
+            **SSB bandwidth:** 240 subcarriers @ 15/30 kHz = 3.6/7.2 MHz
+            """)
+        
+        # Burst set placed into the slots of the first half frame
+        st.markdown(f"#### SSB Burst Set ({ssb_pattern}, first half frame)")
+        try:
+            burst = burst_set(ssb_case, max_ssb, ssb_bitmap)
+        except ValueError as e:
+            st.error(str(e))
+        else:
+            fig = cached_figure(
+                figure_key('ssb_burst', case=ssb_case, l_max=max_ssb, bitmap=ssb_bitmap, mode=heatmap_mode()),
+                lambda: build_ssb_burst_figure(ssb_case, max_ssb, ssb_bitmap, heatmap_mode())
+            )
+            show_chart(fig)
+            
+            starts_tc, lengths_tc = burst_times_tc(ssb_case, max_ssb, ssb_bitmap)
+            col_a, col_b, col_c = st.columns(3)
+            with col_a:
+                st.metric("SSBs Transmitted", f"{burst['index'].size} / {max_ssb}")
+            with col_b:
+                burst_ms = tc_to_ms(starts_tc[-1] + lengths_tc[-1] - starts_tc[0]) if burst['index'].size else 0.0
+                st.metric("Burst Span", f"{burst_ms:.3f} ms")
+            with col_c:
+                st.metric("SSB Air Time", f"{100 * burst_duty_cycle(ssb_case, max_ssb, ssb_bitmap, ssb_periodicity):.2f}%")
+    
+    with st.expander("📚 Theory: Reference Signals"):
+        st.markdown("""
+        ### Reference Signal Types in 5G NR
+        
+        | Type | Purpose | Domain | Overhead |
+        |------|---------|--------|----------|
+        | DMRS | Channel estimation for demodulation | Time-frequency | 5-20% |
+        | CSI-RS | Channel quality measurement | Time-frequency | 1-5% |
+        | PSS/SSS | Synchronization, cell ID | Time-frequency | Fixed (SSB) |
+        | PTRS | Phase tracking (mmWave) | Time-frequency | 0-5% |
+        | SRS | Uplink sounding | Frequency | Variable |
+        
+        ### DMRS (Demodulation Reference Signal)
+        
+        **Purpose:** Enable coherent demodulation of PDSCH/PUSCH
+        
+        **Key features:**
+        - **UE-specific:** Different for each user
+        - **Beamformed:** Follows data beam
+        - **Two types:**
+          - Type 1: Every other subcarrier (higher density)
+          - Type 2: 2 out of 6 subcarriers (lower density)
+        - **CDM groups:** Code Division Multiplexing for multi-layer MIMO
+        - **Front-loaded:** Typically symbols 2-3 for early channel estimation
+        - **Additional DMRS:** More symbols for high Doppler (mobility)
+        
+        **Overhead trade-off:**
+        - More DMRS → Better channel estimation → Better demodulation
+        - Less DMRS → More capacity for data → Higher throughput
+        
+        ### CSI-RS (Channel State Information Reference Signal)
+        
+        **Purpose:** UE measures channel quality and reports CSI
+        
+        **CSI includes:**
+        - **CQI** (Channel Quality Indicator): Recommended MCS
+        - **PMI** (Precoding Matrix Indicator): Recommended precoder
+        - **RI** (Rank Indicator): Number of MIMO layers
+        
+        **Configurations:**
+        - **Periodic:** Regular transmission, low signaling overhead
+        - **Semi-persistent:** Activated/deactivated by MAC-CE
+        - **Aperiodic:** Triggered by DCI, on-demand
+        
+        **Density:** Much sparser than DMRS (transmitted less frequently)
+        
+        ### SSB (SS/PBCH Block)
+        
+        **Purpose:** Initial access and cell search
+        
+        **Components:**
+        1. **PSS (Primary Sync Signal):**
+           - 3 possible sequences
+           - Gives N_ID^(2) (0, 1, or 2)
+           - First-stage synchronization
+        
+        2. **SSS (Secondary Sync Signal):**
+           - 336 possible sequences
+           - Gives N_ID^(1) (0 to 335)
+           - Second-stage synchronization
+           - Physical Cell ID = 3×N_ID^(1) + N_ID^(2) (0-1007)
+        
+        3. **PBCH (Physical Broadcast Channel):**
+           - Carries MIB (Master Information Block)
+           - Essential system information
+           - SFN (System Frame Number), subcarrier spacing, etc.
+        
+        **SSB burst:**
+        - Multiple SSBs transmitted in a burst
+        - Each SSB can have different beam direction (beam sweeping)
+        - FR1: Up to 4-8 SSBs
+        - FR2: Up to 64 SSBs (massive beam sweeping for mmWave)
+        
+        **Periodicity:** Configurable 5-160 ms
+        - More frequent → Faster cell search, more overhead
+        - Less frequent → Lower overhead, slower initial access
+        
+        ### PTRS (Phase Tracking Reference Signal)
+        
+        **Purpose:** Track and compensate phase noise (mainly for mmWave)
+        
+        **Why needed at mmWave:**
+        - Higher carrier frequency → More phase noise from oscillator
+        - Phase noise destroys high-order modulation
+        - PTRS allows tracking and correction
+        
+        **Configuration:**
+        - Only for high-order modulation (64-QAM and above)
+        - Configurable density based on modulation order
+        - Time domain: Every few symbols
+        - Frequency domain: Every few RBs
+        
+        ### SRS (Sounding Reference Signal)
+        
+        **Purpose:** Uplink channel sounding for gNB
+        
+        **Use cases:**
+        - **Frequency-selective scheduling:** Find best RBs for UE
+        - **Link adaptation:** Determine best MCS
+        - **Beamforming:** Estimate uplink channel for precoding
+        - **Timing advance:** Estimate propagation delay
+        
+        **Configuration:**
+        - Periodic, semi-persistent, or aperiodic
+        - Comb structure (transmit every Nth subcarrier)
+        - Can cover full or partial bandwidth
+        - UE-specific hopping pattern
+        """)
@@ -0,0 +1,500 @@
+"""Resource Grid page: channel allocation, RE statistics, throughput and sweeps."""
+
+import multiprocessing
+import os
+
+import streamlit as st
+import numpy as np
+import plotly.graph_objects as go
+
+from nr.bandwidth import (bandwidth_options, max_transmission_bandwidth, minimum_guardband_khz,
+                          scs_options, spectrum_utilization)
+from nr.grid import CHANNEL_NAMES, EMPTY, PDSCH, PDCCH, DMRS, GridConfig
+from nr.ofdm import cp_samples, default_fft_size, modulate, papr_db, qpsk_symbols, sample_rate_hz
+from nr.sweep import collect, make_space, run_sweep, space_size
+from nr.tbs import MCS_TABLE_NAMES, MCS_TABLES, get_tbs_lookup, mcs_params
+from nr.timing import MU_BY_SCS
+from perf import spans as perf_spans
+from views.common import (cached_figure, get_grid_engine, get_slot_params, heatmap_mode, show_chart,
+                          traced_fragment)
+from viz.figcache import figure_key
+from viz.labelimage import add_label_image
+from viz.overlays import add_rb_boundaries
+
+# ============================================================================
+# FIGURE BUILDERS
+# ============================================================================
+
+# Widest grid that still gets one dashed line per RB boundary; wider grids get
+# a line every rb_boundary_step(num_rbs) RBs
+MAX_RB_BOUNDARIES = 110
+
+# RGB per channel label (EMPTY, PDSCH, PDCCH, DMRS) for image rendering
+GRID_PALETTE = [
+    (255, 255, 255),  # Empty
+    (173, 216, 230),  # PDSCH (lightblue)
+    (255, 165, 0),    # PDCCH (orange)
+    (255, 0, 0),      # DMRS (red)
+]
+
+def rb_boundary_step(num_rbs):
+    """RBs between drawn boundary lines, keeping at most MAX_RB_BOUNDARIES lines"""
+    return -(-num_rbs // MAX_RB_BOUNDARIES)
+
+def build_resource_grid_figure(grid_allocation, num_rbs, num_symbols, mode='image'):
+    """Channel-label grid with RB boundaries, as a label image or a heatmap"""
+    if mode == 'image':
+        fig = add_label_image(
+            go.Figure(), grid_allocation, GRID_PALETTE,
+            {label: CHANNEL_NAMES[label] for label in (PDSCH, PDCCH, DMRS)},
+            hovertemplate='Symbol: %{y}<br>Subcarrier: %{x}<extra></extra>'
+        )
+    else:
+        fig = go.Figure(data=go.Heatmap(
+            z=grid_allocation,
+            zmin=EMPTY, zmax=DMRS,
+            colorscale=[
+                [0, 'white'],      # Empty
+                [0.33, 'lightblue'],  # PDSCH
+                [0.66, 'orange'],     # PDCCH
+                [1, 'red']            # DMRS
+            ],
+            showscale=False,
+            hovertemplate='Symbol: %{y}<br>Subcarrier: %{x}<br><extra></extra>'
+        ))
+    
+    # One line per RB stops being readable on wide carriers, so those are decimated
+    add_rb_boundaries(fig, num_rbs, num_symbols, rb_step=rb_boundary_step(num_rbs))
+    
+    fig.update_layout(
+        title=f"Resource Grid: {num_rbs} RBs × {num_symbols} Symbols = {num_rbs * 12 * num_symbols} REs",
+        xaxis_title="Subcarrier Index",
+        yaxis_title="OFDM Symbol Index",
+        height=600,
+        yaxis=dict(autorange='reversed')  # Symbol 0 at top
+    )
+    
+    return fig
+
+# Time-domain envelope points per plotted waveform
+WAVEFORM_POINTS = 1000
+
+def build_waveform_figure(samples, sample_rate, title):
+    """Peak magnitude envelope of an IQ waveform over time"""
+    # Peak per bin keeps the PAPR visible while bounding the payload
+    bins = -(-samples.size // WAVEFORM_POINTS)
+    padded = np.zeros(bins * WAVEFORM_POINTS, dtype=np.float32)
+    padded[:samples.size] = np.abs(samples)
+    envelope = padded.reshape(WAVEFORM_POINTS, bins).max(axis=1)
+    time_us = np.arange(WAVEFORM_POINTS) * bins * 1e6 / sample_rate
+    
+    fig = go.Figure(go.Scatter(
+        x=time_us, y=envelope,
+        mode='lines',
+        line=dict(color='steelblue', width=1),
+        hovertemplate='%{x:.1f} μs: |x| = %{y:.2f}<extra></extra>'
+    ))
+    
+    fig.update_layout(
+        title=title,
+        xaxis_title="Time (μs)",
+        yaxis_title="|x(t)| (RMS = 1)",
+        height=300
+    )
+    
+    return fig
+
+# ============================================================================
+# PAGE FRAGMENTS
+# ============================================================================
+
+@traced_fragment
+def throughput_panel(grid_config, grid_allocation):
+    """TBS-based throughput for the configured grid; reruns alone on its own widgets"""
+    num_rbs = grid_config.num_rbs
+    num_symbols = grid_config.num_symbols
+    scs_grid = grid_config.scs_khz
+    show_pdsch = grid_config.pdsch
+    
+    # Throughput calculation
+    st.markdown("### Estimated Throughput")
+    
+    col_t1, col_t2, col_t3, col_t4 = st.columns(4)
+    with col_t1:
+        mcs_table = st.selectbox("MCS Table", list(MCS_TABLE_NAMES), format_func=MCS_TABLE_NAMES.get,
+                                 index=0, key='rg_mcs_table')
+    with col_t2:
+        mcs_index = st.slider("MCS Index", 0, len(MCS_TABLES[mcs_table]) - 1, 20, key='rg_mcs')
+    with col_t3:
+        mimo_layers = st.selectbox("MIMO Layers", [1, 2, 4, 8], index=1, key='rg_mimo')
+    with col_t4:
+        n_oh = st.selectbox("xOverhead (N_oh)", [0, 6, 12, 18], index=0, key='rg_noh')
+    
+    # PDSCH occupies the symbols after the CORESET; DMRS REs per PRB come from the grid
+    pdsch_start = grid_config.coreset_duration
+    n_symb_pdsch = (num_symbols - pdsch_start) if show_pdsch else 0
+    n_dmrs_prb = int(np.count_nonzero(grid_allocation[pdsch_start:] == DMRS)) // num_rbs
+    
+    with perf_spans.span('tbs'):
+        tbs_lookup = get_tbs_lookup(mcs_table, n_oh=n_oh, n_dmrs_prb=n_dmrs_prb)
+        tbs_bits = int(tbs_lookup.tbs(mcs_index, num_rbs, n_symb_pdsch, mimo_layers))
+    qm, code_rate = mcs_params(mcs_index, mcs_table)
+    n_re_prb = min(156, max(0, 12 * n_symb_pdsch - n_dmrs_prb - n_oh))
+    
+    params_grid = get_slot_params(scs_grid)
+    slots_per_second = 1000 / params_grid['slot_duration_ms']
+    
+    throughput_mbps = tbs_bits * slots_per_second / 1e6
+    
+    st.info(f"""
+    **Throughput:** {throughput_mbps:.2f} Mbps (TS 38.214 TBS, every slot scheduled)
+    
+    Calculation:
+    - PDSCH symbols: {n_symb_pdsch}, DMRS REs/PRB: {n_dmrs_prb}, N_oh: {n_oh}
+    - N'_RE per PRB: min(156, 12 × {n_symb_pdsch} − {n_dmrs_prb} − {n_oh}) = {n_re_prb}
+    - MCS {mcs_index}: Qm = {qm}, R = {code_rate * 1024:g}/1024 = {code_rate:.4f}
+    - MIMO layers: {mimo_layers}{" (2 codewords)" if mimo_layers > 4 else ""}
+    - TBS per slot: {tbs_bits} bits
+    - Slots/sec: {slots_per_second:.0f}
+    """)
+
+@traced_fragment
+def sweep_panel():
+    """Throughput sweep form; independent of the grid shown above it"""
+    # Parameter sweep over the full cross product of slot configurations
+    with st.expander("🔬 Throughput Parameter Sweep"):
+        st.markdown("Each MCS index fixes a modulation order and code rate, so the MCS axis covers both.")
+        st.caption("DMRS follows mapping type A from symbol 2 with one CDM group without data, as in the "
+                   "grid above; DMRS symbols under the CORESET are not counted.")
+        
+        with st.form("rg_sweep"):
+            col_s1, col_s2, col_s3 = st.columns(3)
+            with col_s1:
+                sweep_scs = st.multiselect("SCS (kHz)", [15, 30, 60, 120], default=[30])
+                sweep_rb_range = st.slider("RB Range", 1, 273, (10, 273))
+                sweep_rb_step = st.number_input("RB Step", 1, 50, 1)
+            with col_s2:
+                sweep_dmrs_types = st.multiselect("DMRS Type", [1, 2], default=[1, 2])
+                sweep_dmrs_add = st.multiselect("dmrs-AdditionalPosition", [0, 1, 2, 3], default=[0, 1])
+                sweep_coreset = st.multiselect("CORESET Duration", [0, 1, 2, 3], default=[1, 2])
+            with col_s3:
+                sweep_mcs_table = st.selectbox("MCS Table", list(MCS_TABLE_NAMES),
+                                               format_func=MCS_TABLE_NAMES.get, key='sweep_mcs_table')
+                sweep_layers = st.multiselect("MIMO Layers", [1, 2, 4, 8], default=[1, 2, 4])
+                sweep_workers = st.slider("Worker Processes (0 = in-process)", 0, os.cpu_count() or 1,
+                                          min(4, os.cpu_count() or 1))
+            
+            run_sweep_clicked = st.form_submit_button("Run Sweep")
+        
+        if run_sweep_clicked:
+            sweep_space = make_space(
+                scs_khz=sweep_scs,
+                num_rbs=range(sweep_rb_range[0], sweep_rb_range[1] + 1, int(sweep_rb_step)),
+                dmrs_config_type=sweep_dmrs_types,
+                dmrs_additional_position=sweep_dmrs_add,
+                coreset_duration=sweep_coreset,
+                layers=sweep_layers,
+                mcs_table=sweep_mcs_table
+            )
+            sweep_total = space_size(sweep_space)
+            
+            if sweep_total == 0:
+                st.warning("Select at least one value for every parameter.")
+            else:
+                sweep_rbs = sweep_space['axes']['num_rbs']
+                sweep_mcs = sweep_space['axes']['mcs']
+                
+                # Best throughput per (MCS, RBs), filled in as chunks stream back
+                best = np.full((sweep_mcs.size, sweep_rbs.size), np.nan)
+                progress = st.progress(0.0, text=f"Evaluating {sweep_total:,} configurations...")
+                heatmap_slot = st.empty()
+                
+                chunks = []
+                done = 0
+                chunk_size = max(50_000, sweep_total // (4 * max(sweep_workers, 1)) + 1)
+                for start, stop, chunk in run_sweep(sweep_space, workers=sweep_workers, chunk_size=chunk_size,
+                                                    mp_context=multiprocessing.get_context('spawn')):
+                    chunks.append((start, stop, chunk))
+                    rows = np.searchsorted(sweep_mcs, chunk['mcs'])
+                    cols = np.searchsorted(sweep_rbs, chunk['num_rbs'])
+                    np.fmax.at(best, (rows, cols), chunk['throughput_mbps'])
+                    done += stop - start
+                    progress.progress(done / sweep_total, text=f"{done:,} / {sweep_total:,} configurations")
+                    
+                    fig_sweep = go.Figure(data=go.Heatmap(
+                        x=sweep_rbs, y=sweep_mcs, z=best,
+                        colorscale='Viridis',
+                        colorbar=dict(title="Mbps"),
+                        hovertemplate='RBs: %{x}<br>MCS: %{y}<br>Best: %{z:.1f} Mbps<extra></extra>'
+                    ))
+                    fig_sweep.update_layout(
+                        title="Best Throughput per (MCS, RBs) over all other parameters",
+                        xaxis_title="Number of RBs",
+                        yaxis_title="MCS Index",
+                        height=450
+                    )
+                    show_chart(fig_sweep, heatmap_slot)
+                
+                with perf_spans.span('sweep_collect'):
+                    sweep_results = collect(sweep_space, chunks)
+                top = np.argsort(sweep_results['throughput_mbps'])[::-1][:20]
+                import pandas as pd
+                st.markdown("#### Top 20 Configurations")
+                st.dataframe(pd.DataFrame({name: values[top] for name, values in sweep_results.items()}),
+                             use_container_width=True)
+
+@st.cache_resource(max_entries=8)
+def slot_waveform(grid_config, fft_size):
+    """Read-only one-slot IQ of a grid configuration, shared by all sessions"""
+    # Symbols after the configured ones stay empty; RE values are random QPSK
+    labels = np.zeros((14, grid_config.num_rbs * 12), dtype=np.uint8)
+    labels[:grid_config.num_symbols] = get_grid_engine().grid(grid_config)
+    with perf_spans.span('ofdm'):
+        samples = modulate(qpsk_symbols(labels), grid_config.scs_khz, fft_size)
+    samples.setflags(write=False)
+    return samples
+
+@traced_fragment
+def waveform_panel(grid_config):
+    """OFDM IQ of one slot of the grid, generated only on request; reruns alone on its own widgets"""
+    with st.expander("📶 OFDM Waveform (one slot)"):
+        if not st.toggle("Generate waveform", value=False, key='rg_waveform'):
+            return
+        
+        min_fft = default_fft_size(grid_config.num_rbs * 12)
+        col_w1, col_w2 = st.columns([1, 3])
+        with col_w1:
+            fft_size = st.selectbox("FFT Size", [min_fft, 2 * min_fft, 4 * min_fft], index=0, key='rg_fft')
+        
+        samples = slot_waveform(grid_config, fft_size)
+        sample_rate = sample_rate_hz(fft_size, grid_config.scs_khz)
+        cp = cp_samples(MU_BY_SCS[grid_config.scs_khz], fft_size)
+        papr = papr_db(samples)
+        
+        with col_w1:
+            st.metric("Sample Rate", f"{sample_rate / 1e6:.2f} Msps")
+            st.metric("Samples per Slot", f"{samples.size:,}")
+            st.metric("CP (long / normal)", f"{cp.max()} / {cp.min()} samples")
+            st.metric("PAPR", "—" if np.isnan(papr) else f"{papr:.1f} dB")
+            # The IQ bytes are produced only when the button is clicked
+            st.download_button("Download IQ (complex64)", samples.tobytes,
+                               file_name=f"slot_{grid_config.scs_khz}khz_{fft_size}.cf32",
+                               mime='application/octet-stream')
+        with col_w2:
+            fig = cached_figure(
+                figure_key('waveform', config=grid_config, fft_size=fft_size),
+                lambda: build_waveform_figure(samples, sample_rate,
+                                              f"Slot 0: {fft_size}-point IFFT, {grid_config.scs_khz} kHz SCS")
+            )
+            show_chart(fig)
+        
+        st.caption("Longer vectors: nr.ofdm.write_waveform streams a MultiFrameGrid to disk frame by frame.")
+
+# ============================================================================
+# PAGE
+# ============================================================================
+
+def render():
+    """Render the Resource Grid page"""
+    st.markdown('<p class="section-header">📊 5G NR Resource Grid</p>', unsafe_allow_html=True)
+    
+    col1, col2 = st.columns([1, 2])
+    
+    with col1:
+        st.markdown("### Grid Configuration")
+        
+        frequency_range = st.radio("Frequency Range", ["FR1", "FR2"], horizontal=True)
+        scs_choices = scs_options(frequency_range)
+        scs_grid = st.selectbox("Subcarrier Spacing (kHz)", scs_choices,
+                                index=scs_choices.index(30 if frequency_range == "FR1" else 120))
+        bandwidth_choices = bandwidth_options(scs_grid, frequency_range)
+        bandwidth_mhz = st.selectbox("Channel Bandwidth (MHz)", bandwidth_choices,
+                                     index=bandwidth_choices.index(20) if 20 in bandwidth_choices else 0)
+        
+        # N_RB from the maximum transmission bandwidth tables (TS 38.101-1/-2 Table 5.3.2-1)
+        max_rbs = max_transmission_bandwidth(bandwidth_mhz, scs_grid, frequency_range)
+        st.caption(
+            f"N_RB = {max_rbs} ({max_rbs * 12} subcarriers), "
+            f"{100 * spectrum_utilization(bandwidth_mhz, scs_grid, frequency_range):.1f}% of the channel, "
+            f"min. guardband {minimum_guardband_khz(bandwidth_mhz, scs_grid, frequency_range):g} kHz per side"
+        )
+        if st.checkbox("Schedule fewer RBs", value=False):
+            num_rbs = st.slider("Number of RBs", 1, max_rbs, max_rbs, 1)
+        else:
+            num_rbs = max_rbs
+        num_symbols = st.slider("Number of Symbols", 7, 14, 14, 1)
+        
+        st.markdown("### Channel Allocation")
+        
+        show_dmrs = st.checkbox("Show DMRS", value=True)
+        show_pdcch = st.checkbox("Show PDCCH Region", value=True)
+        show_pdsch = st.checkbox("Show PDSCH Region", value=True)
+        
+        if show_dmrs:
+            dmrs_type = st.radio("DMRS Type", ["Type1", "Type2"])
+            dmrs_symbols = st.multiselect(
+                "DMRS Symbol Positions",
+                list(range(num_symbols)),
+                default=[2, 11] if num_symbols >= 12 else [2]
+            )
+        
+        if show_pdcch:
+            coreset_duration = st.slider("CORESET Duration (symbols)", 1, 3, 2)
+    
+    # Create resource grid
+    grid_config = GridConfig(
+        num_rbs=num_rbs,
+        num_symbols=num_symbols,
+        scs_khz=scs_grid,
+        dmrs_type=dmrs_type if show_dmrs else None,
+        dmrs_positions=tuple(dmrs_symbols) if show_dmrs else (),
+        coreset_duration=coreset_duration if show_pdcch else 0,
+        pdsch=show_pdsch
+    )
+    grid_engine = get_grid_engine()
+    with perf_spans.span('grid'):
+        grid_allocation = grid_engine.grid(grid_config)
+    
+    with col2:
+        st.markdown("### Resource Grid Visualization")
+        
+        fig = cached_figure(
+            figure_key('resource_grid', config=grid_config, mode=heatmap_mode()),
+            lambda: build_resource_grid_figure(grid_allocation, num_rbs, num_symbols, heatmap_mode())
+        )
+        
+        show_chart(fig)
+        if rb_boundary_step(num_rbs) > 1:
+            st.caption(f"Dashed lines mark RB boundaries every {rb_boundary_step(num_rbs)} RBs.")
+        
+        # Legend
+        col_a, col_b, col_c, col_d = st.columns(4)
+        with col_a:
+            st.markdown("⬜ **Empty/Guard**")
+        with col_b:
+            st.markdown("🔵 **PDSCH (Data)**")
+        with col_c:
+            st.markdown("🟠 **PDCCH (Control)**")
+        with col_d:
+            st.markdown("🔴 **DMRS (Reference)**")
+    
+    # Resource statistics
+    st.markdown("### Resource Element Statistics")
+    
+    total_res = num_rbs * 12 * num_symbols
+    with perf_spans.span('grid'):
+        re_counts = grid_engine.counts(grid_config)
+    dmrs_res = re_counts[DMRS]
+    pdcch_res = re_counts[PDCCH]
+    pdsch_res = re_counts[PDSCH]
+    empty_res = re_counts[EMPTY]
+    
+    col_a, col_b, col_c, col_d, col_e = st.columns(5)
+    
+    with col_a:
+        st.metric("Total REs", total_res)
+    with col_b:
+        st.metric("PDSCH REs", f"{pdsch_res} ({100*pdsch_res/total_res:.1f}%)")
+    with col_c:
+        st.metric("PDCCH REs", f"{pdcch_res} ({100*pdcch_res/total_res:.1f}%)")
+    with col_d:
+        st.metric("DMRS REs", f"{dmrs_res} ({100*dmrs_res/total_res:.1f}%)")
+    with col_e:
+        st.metric("Empty REs", f"{empty_res} ({100*empty_res/total_res:.1f}%)")
+    
+    throughput_panel(grid_config, grid_allocation)
+    
+    waveform_panel(grid_config)
+    
+    sweep_panel()
+    
+    with st.expander("📚 Theory: Resource Grid"):
+        st.markdown("""
+        ### Resource Grid Basics
+        
+        **Resource Element (RE):**
+        - Smallest resource unit
+        - 1 subcarrier × 1 OFDM symbol
+        - Carries one modulation symbol
+        
+        **Resource Block (RB):**
+        - 12 consecutive subcarriers
+        - 1 slot in time (14 or 12 symbols)
+        - Basic scheduling unit
+        - Size in frequency: 12 × SCS (e.g., 180 kHz @ 15 kHz SCS)
+        
+        ### Grid Structure
+        
+        **Frequency domain:**
+        - Organized in Resource Blocks (RBs)
+        - Each RB = 12 subcarriers
+        - Total bandwidth = N_RB × 12 × SCS
+        
+        **Time domain:**
+        - Organized in slots
+        - Each slot = 14 OFDM symbols (normal CP)
+        - Flexible scheduling: can allocate any number of symbols
+        
+        ### Channel Mapping
+        
+        **PDCCH (Physical Downlink Control Channel):**
+        - Carries DCI (Downlink Control Information)
+        - Scheduling grants, power control, etc.
+        - Located in CORESET (Control Resource Set)
+        - Typically first 1-3 symbols
+        - Uses lower modulation (QPSK typically) for robustness
+        
+        **PDSCH (Physical Downlink Shared Channel):**
+        - Carries user data (DL-SCH transport channel)
+        - Scheduled by PDCCH
+        - Uses remaining REs after control and reference signals
+        - Adaptive modulation: QPSK to 256-QAM
+        
+        **DMRS (Demodulation Reference Signal):**
+        - Used for channel estimation
+        - Allows coherent demodulation
+        - Two types:
+          - **Type 1:** Every other subcarrier (50% density)
+                    - **Type 2:** 2 out of 6 subcarriers (lower density, supports more CDM ports)
+        - Typically in symbols 2 and 11 (front-loaded)
+        - Can add additional DMRS for high Doppler
+        
+        ### Resource Allocation
+        
+        **Time domain:**
+        - Slot-based: Entire slot
+        - Non-slot: Start symbol + duration
+        - Mini-slot: 2, 4, or 7 symbols
+        
+        **Frequency domain:**
+        - Type 0: Bitmap of RB groups
+        - Type 1: Start RB + number of RBs
+        
+        ### Overhead Analysis
+        
+        **Typical overhead sources:**
+        1. **DMRS:** 5-15% (depends on configuration)
+        2. **PDCCH:** 5-10% (depends on CORESET size)
+        3. **CSI-RS:** 1-3% (periodic reference signals)
+        4. **Guard bands:** ~5%
+        5. **Synchronization:** SSB overhead
+        
+        **Total overhead:** Typically 15-30%
+        - More overhead → better channel estimation, control
+        - Less overhead → higher throughput
+        - Trade-off based on channel conditions
+        
+        ### Slot Format
+        
+        5G NR supports flexible slot formats:
+        - **D:** Downlink symbols
+        - **U:** Uplink symbols
+        - **X:** Flexible (can be D or U)
+        
+        Example: DDDDDXXXUU
+        - 5 DL symbols
+        - 3 flexible symbols
+        - 2 UL symbols
+        
+        Configured via TDD configuration in SIB1.
+        """)
@@ -0,0 +1,390 @@
+"""TDD Configuration page: DL/UL patterns and their capacity split."""
+
+from fractions import Fraction
+
+import streamlit as st
+import plotly.graph_objects as go
+
+from nr.harq import DEFAULT_K1, harq_feedback, latency_profile
+from nr.slot_format import DL, FLEXIBLE, UL, find_formats
+from nr.tdd import (MAX_SLOTS, PERIODICITIES_MS, TddConfig, TddPattern, cycle_directions, direction_counts,
+                    period_directions, slot_types)
+from nr.timing import SFN_CYCLE, tc_to_ms
+from perf import spans as perf_spans
+from views.common import cached_figure, show_chart, traced_fragment
+from viz.figcache import figure_key
+
+# ============================================================================
+# FIGURE BUILDERS
+# ============================================================================
+
+def build_latency_cdf_figure(profiles):
+    """HARQ-ACK latency CDFs, one line per TDD pattern"""
+    fig = go.Figure()
+    for name, profile in profiles.items():
+        fig.add_trace(go.Scatter(
+            x=tc_to_ms(profile['latency']),
+            y=profile['probability'],
+            mode='lines',
+            name=name,
+            hovertemplate='%{x:.3f} ms: %{y:.1%}<extra>' + name + '</extra>'
+        ))
+    
+    fig.update_layout(
+        title="Packet Arrival to HARQ-ACK Latency (CDF)",
+        xaxis_title="Latency (ms)",
+        yaxis_title="P(latency ≤ x)",
+        height=350,
+        legend=dict(orientation='h', yanchor='bottom', y=1.0, x=0)
+    )
+    
+    return fig
+
+# ============================================================================
+# PAGE FRAGMENTS
+# ============================================================================
+
+# Five-slot patterns the configured one is compared against:
+# (DL slots, DL symbols, UL slots, UL symbols)
+REFERENCE_PATTERNS = {
+    "DDDSU": (3, 10, 1, 2),
+    "DDSUU": (2, 10, 2, 2),
+}
+
+@traced_fragment
+def harq_panel(tdd_config):
+    """HARQ-ACK timing and latency CDFs against DDDSU and DDSUU; reruns alone on its own widgets"""
+    st.markdown("### HARQ-ACK Feedback Latency")
+    
+    col1, col2, col3, col4 = st.columns(4)
+    with col1:
+        k1_set = tuple(st.multiselect("dl-DataToUL-ACK (K1 set)", list(range(16)), default=list(DEFAULT_K1),
+                                      key='harq_k1'))
+    with col2:
+        capability = st.radio("PDSCH Processing Capability", [1, 2], horizontal=True, key='harq_capability')
+    with col3:
+        additional_dmrs = st.checkbox("Additional DMRS", value=False, key='harq_dmrs')
+    with col4:
+        pucch_symbols = st.selectbox("PUCCH Symbols", [1, 2, 4, 14], index=0, key='harq_pucch')
+    
+    harq_options = dict(k1_set=k1_set, capability=capability, additional_dmrs=additional_dmrs,
+                        pucch_symbols=pucch_symbols)
+    # Five slots are 2.5 ms at 30 kHz, 0.625 ms at 120 kHz
+    period_ms = Fraction(5, 2**tdd_config.mu)
+    patterns = {"Configured": tdd_config}
+    for name, reference in REFERENCE_PATTERNS.items():
+        patterns[name] = TddConfig(reference_scs_khz=tdd_config.reference_scs_khz,
+                                   pattern1=TddPattern(period_ms, *reference))
+    
+    profiles = {}
+    with perf_spans.span('harq_latency'):
+        for name, config in patterns.items():
+            try:
+                profiles[name] = latency_profile(config, **harq_options)
+            except ValueError as e:
+                st.warning(f"{name}: {e}")
+    if not profiles:
+        return
+    
+    fig = cached_figure(
+        figure_key('harq_latency', patterns=[repr(patterns[name]) for name in profiles], **harq_options),
+        lambda: build_latency_cdf_figure(profiles)
+    )
+    show_chart(fig)
+    
+    st.markdown("\n".join(
+        ["| Pattern | Mean | p50 | p90 | p99 | Max |", "|---|---:|---:|---:|---:|---:|"]
+        + [f"| {name} | {tc_to_ms(profile['mean']):.3f} ms | "
+           + " | ".join(f"{tc_to_ms(value):.3f} ms" for value in profile['percentiles'].values()) + " |"
+           for name, profile in profiles.items()]
+    ))
+    
+    if "Configured" not in profiles:
+        return
+    feedback = harq_feedback(tdd_config, **harq_options)
+    first_period = feedback['slot'] < tdd_config.num_slots
+    st.caption(
+        f"Configured pattern: K1 per DL slot {feedback['k1'][first_period].tolist()}"
+        + ("" if feedback['feasible'].all() else " (-1: no feasible PUCCH, slot left unscheduled)")
+    )
+
+# ============================================================================
+# PAGE
+# ============================================================================
+
+def pattern_inputs(key, defaults):
+    """Widgets for one TDD-UL-DL-Pattern; returns (periodicity, DL slots, DL symbols, UL slots, UL symbols)"""
+    periodicity, dl_slots, dl_symbols, ul_slots, ul_symbols = defaults
+    return (
+        st.selectbox("dl-UL-TransmissionPeriodicity (ms)", PERIODICITIES_MS,
+                     index=PERIODICITIES_MS.index(periodicity), format_func=lambda p: f"{float(p):g}",
+                     key=f'tdd_{key}_periodicity'),
+        st.slider("nrofDownlinkSlots", 0, MAX_SLOTS, dl_slots, key=f'tdd_{key}_dl_slots'),
+        st.slider("nrofDownlinkSymbols", 0, 13, dl_symbols, key=f'tdd_{key}_dl_symbols'),
+        st.slider("nrofUplinkSlots", 0, MAX_SLOTS, ul_slots, key=f'tdd_{key}_ul_slots'),
+        st.slider("nrofUplinkSymbols", 0, 13, ul_symbols, key=f'tdd_{key}_ul_symbols'),
+    )
+
+def render():
+    """Render the TDD Configuration page"""
+    st.markdown('<p class="section-header">🔧 TDD Configuration</p>', unsafe_allow_html=True)
+    
+    st.markdown("""
+    **TDD (Time Division Duplex):** Uplink and downlink share the same frequency but use different time slots.
+    5G NR TDD is highly flexible with configurable DL/UL patterns.
+    """)
+    
+    col1, col2 = st.columns([1, 2])
+    
+    with col1:
+        st.markdown("### TDD Pattern Configuration")
+        
+        scs_tdd = st.selectbox("Reference Subcarrier Spacing (kHz)", [15, 30, 60, 120], index=1, key='tdd_scs')
+        
+        st.markdown("**pattern1**")
+        pattern1 = pattern_inputs('p1', (Fraction(5), 7, 6, 2, 4))
+        
+        use_pattern2 = st.checkbox("Add pattern2", value=False, key='tdd_pattern2')
+        pattern2 = pattern_inputs('p2', (Fraction(5), 3, 10, 6, 2)) if use_pattern2 else None
+    
+    try:
+        tdd_config = TddConfig(reference_scs_khz=scs_tdd, pattern1=TddPattern(*pattern1),
+                               pattern2=TddPattern(*pattern2) if pattern2 else None)
+    except ValueError as e:
+        with col2:
+            st.error(str(e))
+        return
+    
+    slot_symbols = period_directions(tdd_config)
+    slots_in_period = tdd_config.num_slots
+    tdd_periodicity_ms = float(tdd_config.periodicity_ms)
+    slot_pattern = list(slot_types(slot_symbols))
+    
+    with col2:
+        st.markdown("### TDD Pattern Visualization")
+        
+        # Visualize pattern
+        fig = go.Figure()
+        
+        colors = {'D': 'blue', 'U': 'green', 'X': 'orange', 'F': 'lightgray'}
+        color_list = [colors[s] for s in slot_pattern]
+        
+        fig.add_trace(go.Bar(
+            x=list(range(slots_in_period)),
+            y=[1] * slots_in_period,
+            marker=dict(color=color_list),
+            showlegend=False,
+            hovertemplate='Slot %{x}: %{text}<extra></extra>',
+            text=slot_pattern
+        ))
+        
+        fig.update_layout(
+            title=f"TDD Pattern ({tdd_periodicity_ms:g} ms period = {slots_in_period} slots)",
+            xaxis_title="Slot Index",
+            yaxis_title="",
+            height=300,
+            yaxis=dict(showticklabels=False, range=[0, 1.2])
+        )
+        
+        show_chart(fig)
+        
+        # Show symbol-level detail for the first partial slot
+        partial_slots = [i for i, kind in enumerate(slot_pattern) if kind == 'X']
+        if partial_slots:
+            st.markdown("### Partial Slot Detail")
+            
+            partial = slot_symbols[partial_slots[0]]
+            counts = direction_counts(partial)
+            
+            fig2 = go.Figure()
+            fig2.add_trace(go.Bar(
+                x=list(range(14)),
+                y=[1] * 14,
+                marker=dict(color=[{DL: 'blue', FLEXIBLE: 'yellow', UL: 'green'}[d] for d in partial]),
+                showlegend=False
+            ))
+            
+            fig2.update_layout(
+                title=(f"Slot {partial_slots[0]}: {counts['dl']}D + {counts['flexible']}G + {counts['ul']}U"),
+                xaxis_title="Symbol",
+                yaxis_title="",
+                height=250,
+                yaxis=dict(showticklabels=False)
+            )
+            
+            show_chart(fig2)
+            
+            special_formats = find_formats(partial)
+            if len(special_formats):
+                st.caption(f"Matches TS 38.213 slot format {', '.join(map(str, special_formats))}")
+            else:
+                st.caption("No TS 38.213 slot format matches this partial slot; it needs the semi-static pattern")
+    
+    # Calculate DL/UL ratio
+    period_counts = direction_counts(slot_symbols)
+    total_dl_symbols = period_counts['dl']
+    total_ul_symbols = period_counts['ul']
+    total_symbols = slot_symbols.size
+    
+    dl_pct = 100 * total_dl_symbols / total_symbols
+    ul_pct = 100 * total_ul_symbols / total_symbols
+    guard_pct = 100 - dl_pct - ul_pct
+    
+    st.markdown("### Resource Distribution")
+    
+    col_a, col_b, col_c, col_d = st.columns(4)
+    
+    with col_a:
+        st.metric("DL Symbols", f"{total_dl_symbols}/{total_symbols}")
+    with col_b:
+        st.metric("UL Symbols", f"{total_ul_symbols}/{total_symbols}")
+    with col_c:
+        st.metric("DL/UL Ratio", f"{dl_pct:.1f}% / {ul_pct:.1f}%")
+    with col_d:
+        st.metric("Guard/Flexible", f"{guard_pct:.1f}%")
+    
+    # The same split over the whole SFN cycle, from the tiled per-symbol mask
+    with perf_spans.span('tdd_cycle'):
+        cycle_counts = direction_counts(cycle_directions(tdd_config))
+    st.caption(
+        f"Over the {SFN_CYCLE}-frame SFN cycle ({SFN_CYCLE * 10 // tdd_config.periodicity_ms:.0f} periods): "
+        f"{cycle_counts['dl']:,} DL, {cycle_counts['ul']:,} UL and {cycle_counts['flexible']:,} flexible symbols"
+    )
+    
+    # Show pattern string
+    st.markdown("### Pattern String")
+    pattern_str = ''.join(slot_pattern)
+    st.code(pattern_str, language=None)
+    
+    st.markdown("""
+    **Legend:**
+    - **D**: Full downlink slot
+    - **U**: Full uplink slot
+    - **X**: Special/partial slot (DL + Guard + UL)
+    - **F**: Flexible (can be DL or UL as needed)
+    """)
+    
+    harq_panel(tdd_config)
+    
+    with st.expander("📚 Theory: TDD Configuration"):
+        st.markdown("""
+        ### TDD vs FDD
+        
+        **FDD (Frequency Division Duplex):**
+        - Separate frequencies for UL and DL
+        - Paired spectrum
+        - Simultaneous UL/DL transmission
+        - Better for coverage (continuous transmission)
+        - Used in lower frequency bands
+        
+        **TDD (Time Division Duplex):**
+        - Same frequency for UL and DL
+        - Unpaired spectrum
+        - Time-multiplexed UL/DL
+        - Channel reciprocity (UL ≈ DL channel)
+        - More spectrum globally available
+        - Better beamforming (can use DL CSI for UL precoding)
+        
+        ### 5G NR TDD Configuration
+        
+        **Configured in SIB1** (System Information Block 1):
+        - TDD-UL-DL-ConfigCommon
+        - Pattern1 (mandatory)
+        - Pattern2 (optional, for additional flexibility)
+        
+        **Parameters:**
+        1. **Periodicity:** 0.5, 0.625, 1, 1.25, 2, 2.5, 5, 10 ms
+        2. **nrofDownlinkSlots:** Number of full DL slots
+        3. **nrofDownlinkSymbols:** DL symbols in partial slot
+        4. **nrofUplinkSlots:** Number of full UL slots
+        5. **nrofUplinkSymbols:** UL symbols in partial slot
+        
+        ### Slot Format
+        
+        Each slot can be:
+        - **D:** All DL symbols
+        - **U:** All UL symbols
+        - **F:** Flexible (configured later, can be DL or UL)
+        
+        Special slot format: **DL - Guard - UL**
+        
+        ### Guard Period
+        
+        **Purpose:** Time for switching between DL and UL
+        - RF retune time
+        - Power ramping
+        - Timing advance adjustment
+        
+        **Duration:**
+        - Typically 1-3 OFDM symbols
+        - Depends on cell size and hardware
+        - Larger cells need longer guard
+        - At 30 kHz SCS: 1 symbol ≈ 36 μs
+        
+        ### Common TDD Patterns
+        
+        **Pattern 1: DDDSU (4:1 DL heavy)**
+        - 4 DL slots, 1 special, 0 UL
+        - 80% DL, 14% UL, 6% guard
+        - Good for FWA, video streaming
+        
+        **Pattern 2: DDDUU (3:2)**
+        - 3 DL, 2 UL
+        - 60% DL, 40% UL
+        - Balanced for general use
+        
+        **Pattern 3: DSUUU (1:3 UL heavy)**
+        - 1 DL, 1 special, 3 UL
+        - 20% DL, 66% UL, 14% guard
+        - Rare, for special UL-heavy scenarios
+        
+        ### Dynamic TDD
+        
+        **Group-Common PDCCH (GC-PDCCH):**
+        - Signals slot format to multiple UEs
+        - Overrides semi-static configuration
+        - Enables traffic-adaptive TDD
+        - Used for flexible slots ('F')
+        
+        **Benefits:**
+        - Adapt to traffic asymmetry in real-time
+        - Better spectral efficiency
+        - Requires good inter-cell coordination (avoid interference)
+        
+        ### TDD Challenges
+        
+        **1. Cross-link Interference:**
+        - Adjacent cells with different DL/UL timing
+        - gNB-to-gNB interference (DL interferes with neighbor's UL)
+        - UE-to-UE interference (UL interferes with neighbor's DL)
+        - Mitigation: Synchronized networks, guard bands
+        
+        **2. Latency:**
+        - Must wait for UL slot for feedback
+        - Longer HARQ RTT than FDD
+        - Mitigated by shorter slots (higher SCS)
+        
+        **3. Coverage:**
+        - Less UL time → Harder for cell edge UEs
+        - More retransmissions needed
+        - Solved with UL slot aggregation, power boosting
+        
+        ### Massive MIMO and TDD
+        
+        **TDD advantage: Channel reciprocity**
+        
+        $H_{UL} = H_{DL}^T$ (in TDD with calibration)
+        
+        This means:
+        - gNB learns DL channel from UL SRS
+        - No need for massive DL CSI feedback
+        - Enables large antenna arrays (64, 128, 256 elements)
+        - Critical for beamforming at mmWave and massive MIMO
+        
+        **In FDD:**
+        - Need codebook-based feedback
+        - Limited CSI feedback (overhead)
+        - Harder to scale to large arrays
+        
+        This is why **most 5G mid-band deployments use TDD**.
+        """)
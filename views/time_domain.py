@@ -0,0 +1,248 @@
+"""Time Domain Analysis page: slot, non-slot and mini-slot allocation."""
+
+import streamlit as st
+import plotly.graph_objects as go
+
+from views.common import get_slot_params, show_chart
+
+# ============================================================================
+# PAGE
+# ============================================================================
+
+def render():
+    """Render the Time Domain Analysis page"""
+    st.markdown('<p class="section-header">⏱️ Time Domain Resource Allocation</p>', unsafe_allow_html=True)
+    
+    col1, col2 = st.columns([1, 2])
+    
+    with col1:
+        st.markdown("### Configuration")
+        
+        scs_time = st.selectbox("Subcarrier Spacing (kHz)", [15, 30, 60, 120], index=1, key='time_scs')
+        
+        alloc_type = st.radio(
+            "Allocation Type",
+            ["Slot-based", "Non-slot-based", "Mini-slot"]
+        )
+        
+        if alloc_type == "Non-slot-based":
+            start_symbol = st.slider("Start Symbol", 0, 13, 2)
+            duration_symbols = st.slider("Duration (symbols)", 1, 14-start_symbol, 10)
+        elif alloc_type == "Mini-slot":
+            mini_start = st.slider("Start Symbol", 0, 13, 0, key='mini_start')
+            mini_duration = st.selectbox("Mini-slot Duration", [2, 4, 7])
+        
+        show_multiple_slots = st.checkbox("Show Multiple Slots", value=False)
+        if show_multiple_slots:
+            num_slots_show = st.slider("Number of Slots", 2, 10, 4)
+    
+    params_time = get_slot_params(scs_time)
+    
+    with col2:
+        if not show_multiple_slots:
+            st.markdown("### Single Slot Allocation")
+            
+            fig = go.Figure()
+            
+            symbols = list(range(14))
+            
+            if alloc_type == "Slot-based":
+                # Full slot allocation
+                allocation = [1.0] * 14
+                colors = ['blue'] * 14
+                title = "Slot-based Allocation (All 14 symbols)"
+                
+            elif alloc_type == "Non-slot-based":
+                allocation = [0] * 14
+                colors = ['lightgray'] * 14
+                for i in range(start_symbol, start_symbol + duration_symbols):
+                    if i < 14:
+                        allocation[i] = 1.0
+                        colors[i] = 'green'
+                title = f"Non-slot Allocation (Symbols {start_symbol}-{start_symbol+duration_symbols-1})"
+                
+            else:  # Mini-slot
+                allocation = [0] * 14
+                colors = ['lightgray'] * 14
+                for i in range(mini_start, mini_start + mini_duration):
+                    if i < 14:
+                        allocation[i] = 1.0
+                        colors[i] = 'orange'
+                title = f"Mini-slot ({mini_duration} symbols starting at {mini_start})"
+            
+            fig.add_trace(go.Bar(
+                x=symbols,
+                y=allocation,
+                marker=dict(color=colors),
+                showlegend=False
+            ))
+            
+            fig.update_layout(
+                title=title,
+                xaxis_title="OFDM Symbol",
+                yaxis_title="Allocated",
+                height=400,
+                yaxis=dict(range=[0, 1.2])
+            )
+            
+            show_chart(fig)
+            
+            # Calculate latency
+            symbol_duration_us = params_time['slot_duration_ms'] * 1000 / 14
+            
+            if alloc_type == "Slot-based":
+                latency_us = params_time['slot_duration_ms'] * 1000
+                efficiency = 100.0
+            elif alloc_type == "Non-slot-based":
+                latency_us = duration_symbols * symbol_duration_us
+                efficiency = 100.0 * duration_symbols / 14
+            else:
+                latency_us = mini_duration * symbol_duration_us
+                efficiency = 100.0 * mini_duration / 14
+            
+            col_a, col_b, col_c = st.columns(3)
+            with col_a:
+                st.metric("Latency", f"{latency_us:.1f} μs")
+            with col_b:
+                st.metric("Slot Efficiency", f"{efficiency:.1f}%")
+            with col_c:
+                st.metric("Symbols Used", f"{int(efficiency * 14 / 100)}/14")
+        
+        else:
+            st.markdown(f"### Multiple Slots ({num_slots_show} slots)")
+            
+            # Create multi-slot visualization
+            fig = go.Figure()
+            
+            total_symbols = num_slots_show * 14
+            
+            for slot_idx in range(num_slots_show):
+                for sym_idx in range(14):
+                    x_pos = slot_idx * 14 + sym_idx
+                    
+                    # Alternate pattern for visualization
+                    if slot_idx % 2 == 0:
+                        color = 'blue' if sym_idx < 12 else 'orange'  # Last 2 for UL
+                    else:
+                        color = 'lightblue' if sym_idx < 12 else 'lightyellow'
+                    
+                    fig.add_shape(
+                        type="rect",
+                        x0=x_pos-0.4, x1=x_pos+0.4,
+                        y0=0, y1=1,
+                        fillcolor=color,
+                        line=dict(color='black', width=0.5)
+                    )
+                
+                # Add slot separator
+                if slot_idx < num_slots_show - 1:
+                    fig.add_vline(x=(slot_idx+1)*14-0.5, line_dash="dash", line_color="red", line_width=2)
+            
+            fig.update_layout(
+                title=f"{num_slots_show} Consecutive Slots ({num_slots_show * params_time['slot_duration_ms']:.2f} ms total)",
+                xaxis_title="Symbol Index",
+                yaxis_title="",
+                height=300,
+                showlegend=False,
+                yaxis=dict(showticklabels=False)
+            )
+            
+            show_chart(fig)
+            
+            total_time_ms = num_slots_show * params_time['slot_duration_ms']
+            st.info(f"Total duration: {total_time_ms:.3f} ms = {total_time_ms * 1000:.1f} μs")
+    
+    with st.expander("📚 Theory: Time Domain Allocation"):
+        st.markdown("""
+        ### Time Domain Resource Allocation (TDRA)
+        
+        5G NR provides flexible time domain scheduling unlike LTE's fixed 1 ms TTI.
+        
+        ### Allocation Types
+        
+        **1. Slot-based:**
+        - Allocates entire slot (14 symbols)
+        - Traditional approach, similar to LTE
+        - Lower signaling overhead
+        - Good for throughput-oriented services
+        
+        **2. Non-slot-based:**
+        - Allocates arbitrary start symbol + duration
+        - Flexible resource allocation
+        - Can start at any symbol (0-13)
+        - Duration: 1-14 symbols
+        - Reduces latency for time-critical data
+        
+        **3. Mini-slot:**
+        - Very short allocations (2, 4, or 7 symbols)
+        - **URLLC** (Ultra-Reliable Low Latency)
+        - Fast scheduling response
+        - Can be used for preemption
+        
+        ### Latency Reduction
+        
+        **LTE:** Minimum 1 ms TTI
+        **5G NR slot-based:** 0.125-1 ms (depends on numerology)
+        **5G NR mini-slot:** As low as ~18 μs (2 symbols @ 120 kHz SCS)
+        
+        **Example:**
+        - μ=3 (120 kHz SCS): Slot = 125 μs, Symbol ≈ 9 μs
+        - 2-symbol mini-slot ≈ 18 μs
+        - Enables <1 ms air interface latency for URLLC
+        
+        ### PDSCH Time Domain Resource Allocation
+        
+        Configured in RRC as a table of SLIV (Start and Length Indicator Value):
+        
+        **SLIV** encodes:
+        - S: Start symbol (0-13)
+        - L: Length in symbols (1-14)
+        
+        Formula: $SLIV = 14(L-1) + S$ if $(L-1) \\leq 7$
+        
+        **DCI** just signals an index to this table (low overhead).
+        
+        ### Symbol-level Flexibility Benefits
+        
+        **1. TDD Flexibility:**
+        - Guard period can be just a few symbols
+        - More efficient than slot-level switching
+        
+        **2. Preemption:**
+        - URLLC can preempt eMBB mid-slot
+        - eMBB gets DPI (Downlink Preemption Indication)
+        - Retransmit only affected symbols
+        
+        **3. Mixed numerology:**
+        - Different SCS across BWPs/carriers
+        - Coexistence of services with different requirements
+        
+        **4. Cross-slot scheduling:**
+        - Schedule PDSCH/PUSCH in future slot
+        - K0/K2 offset (in slots)
+        - Allows processing time for UE
+        
+        ### Processing Timeline
+        
+        **N1 / N2:** Processing time in symbols
+        - **N1:** PDSCH reception → HARQ-ACK transmission
+        - **N2:** DCI reception → PUSCH transmission
+        
+        Depends on:
+        - UE capability (1 or 2)
+        - Numerology (μ)
+        - DL/UL timing
+        
+        **Example (μ=1, capability 1):**
+        - N1 = 13 symbols
+        - Receive PDSCH in slot n
+        - Transmit ACK in slot n+2 at earliest
+        
+        ### Slot Aggregation
+        
+        **PDSCH/PUSCH can span multiple slots:**
+        - Better coverage (longer transmission time)
+        - Lower code rate (more robust)
+        - Frequency hopping across slots
+        - Typically for cell-edge UEs or coverage scenarios
+        """)
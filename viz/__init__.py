@@ -0,0 +1 @@
+"""Plotly rendering helpers shared by the visualizer pages."""
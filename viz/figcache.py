@@ -0,0 +1,117 @@
+"""Process-wide figure cache with LRU eviction and a memory cap.
+
+Figures are keyed on a normalized page config (see ``figure_key``) and
+shared between sessions, so callers must treat returned figures as
+read-only.
+"""
+
+import threading
+from collections import OrderedDict
+
+import numpy as np
+
+
+def _normalize(value):
+    """Turn widget values into hashable, order-stable key components"""
+    if isinstance(value, dict):
+        return tuple(sorted((k, _normalize(v)) for k, v in value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(_normalize(v) for v in value)
+    if isinstance(value, (set, frozenset)):
+        return tuple(sorted(_normalize(v) for v in value))
+    if isinstance(value, np.generic):
+        value = value.item()
+    if isinstance(value, float):
+        if value.is_integer():
+            return int(value)
+        return round(value, 9)
+    return value
+
+
+def _payload_bytes(value):
+    """Approximate size of a plotly property tree: array buffers, strings, 8 bytes per scalar"""
+    if isinstance(value, np.ndarray):
+        if value.dtype == object:
+            return sum(_payload_bytes(v) for v in value.flat)
+        return value.nbytes
+    if isinstance(value, dict):
+        return sum(_payload_bytes(v) for v in value.values())
+    if isinstance(value, (list, tuple)):
+        return sum(_payload_bytes(v) for v in value)
+    if isinstance(value, (str, bytes)):
+        return len(value)
+    return 8
+
+
+def _estimate_size(fig):
+    """Approximate memory held by a figure, read from its traces without serializing"""
+    return (sum(_payload_bytes(trace.to_plotly_json()) for trace in fig.data)
+            + _payload_bytes(fig.layout.to_plotly_json()))
+
+
+def figure_key(name, **config):
+    """Build a cache key from a figure name and its page config"""
+    return (name, _normalize(config))
+
+
+class FigureCache:
+    """LRU cache of Plotly figures bounded by their estimated size and entry count"""
+
+    def __init__(self, max_bytes=64 * 1024 * 1024, max_entries=512):
+        self.max_bytes = max_bytes
+        self.max_entries = max_entries
+        self._entries = OrderedDict()  # key -> (figure, size in bytes)
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get_or_build(self, key, builder):
+        """Return the cached figure for ``key``, building it on a miss"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[0]
+            self.misses += 1
+
+        # Build outside the lock so slow figures do not block other sessions
+        fig = builder()
+        size = _estimate_size(fig)
+
+        with self._lock:
+            if key in self._entries:
+                return self._entries[key][0]
+            if size <= self.max_bytes:
+                self._entries[key] = (fig, size)
+                self._bytes += size
+                self._evict()
+        return fig
+
+    def _evict(self):
+        while self._entries and (self._bytes > self.max_bytes
+                                 or len(self._entries) > self.max_entries):
+            _, (_, size) = self._entries.popitem(last=False)
+            self._bytes -= size
+            self.evictions += 1
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self):
+        """Hit/miss counters and current occupancy"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'hit_rate': self.hits / lookups if lookups else 0.0,
+                'entries': len(self._entries),
+                'bytes': self._bytes,
+                'max_bytes': self.max_bytes,
+            }
@@ -0,0 +1,98 @@
+"""Label grids rendered as one compressed image trace.
+
+A ``go.Heatmap`` sends its ``z`` matrix cell by cell (float64 unless the
+caller is careful), so wide carriers and multi-slot grids cost megabytes
+of JSON per rerun. Channel-label grids only hold a handful of small
+integers, so here they are encoded as an 8-bit palette PNG (one byte per
+RE before deflate, a few bytes per run after it) and sent as the ``source``
+of a single ``go.Image``. The label names are carried once, as legend
+entries sharing the palette colors, instead of per-cell hover text.
+"""
+
+import base64
+import struct
+import zlib
+
+import numpy as np
+import plotly.graph_objects as go
+
+
+def _chunk(tag, data):
+    return (struct.pack('>I', len(data)) + tag + data
+            + struct.pack('>I', zlib.crc32(tag + data) & 0xffffffff))
+
+
+def palette_png(labels, palette):
+    """Encode a 2-D array of labels as an indexed-color PNG.
+
+    ``palette`` lists one (r, g, b) color per label value; labels must lie
+    in ``range(len(palette))``.
+    """
+    labels = np.asarray(labels)
+    if labels.ndim != 2:
+        raise ValueError("labels must be a 2-D array")
+    if not 0 < len(palette) <= 256:
+        raise ValueError("palette must have 1-256 colors")
+    if labels.size and (labels.min() < 0 or labels.max() >= len(palette)):
+        raise ValueError(f"labels must be in 0-{len(palette) - 1}")
+
+    height, width = labels.shape
+    # Each scanline is prefixed with filter type 0 (none)
+    raw = np.zeros((height, width + 1), dtype=np.uint8)
+    raw[:, 1:] = labels
+    plte = np.asarray(palette, dtype=np.uint8).reshape(-1, 3)
+
+    return b''.join([
+        b'\x89PNG\r\n\x1a\n',
+        _chunk(b'IHDR', struct.pack('>IIBBBBB', width, height, 8, 3, 0, 0, 0)),
+        _chunk(b'PLTE', plte.tobytes()),
+        _chunk(b'IDAT', zlib.compress(raw.tobytes(), 9)),
+        _chunk(b'IEND', b''),
+    ])
+
+
+def label_image_trace(labels, palette, x0=0, y0=0, dx=1, dy=1, hovertemplate=None, name=None):
+    """One ``go.Image`` showing ``labels`` colored by ``palette``.
+
+    Pixel (row i, column j) is centered on (x0 + j*dx, y0 + i*dy), matching
+    a heatmap with integer coordinates. Hover has the coordinates and the
+    pixel color only; pair it with ``label_legend_traces`` for the names.
+    """
+    png = base64.b64encode(palette_png(labels, palette)).decode('ascii')
+    return go.Image(
+        source=f'data:image/png;base64,{png}',
+        x0=x0, y0=y0, dx=dx, dy=dy,
+        hovertemplate=hovertemplate,
+        name=name
+    )
+
+
+def label_legend_traces(palette, names):
+    """Legend-only marker traces naming each palette color.
+
+    ``names`` maps label value -> display name; labels left out get no
+    legend entry.
+    """
+    return [
+        go.Scatter(
+            x=[None], y=[None],
+            mode='markers',
+            marker=dict(symbol='square', size=12, color='rgb({}, {}, {})'.format(*palette[label]),
+                        line=dict(color='gray', width=1)),
+            name=name,
+            showlegend=True,
+            hoverinfo='skip'
+        )
+        for label, name in names.items()
+    ]
+
+
+def add_label_image(fig, labels, palette, names, hovertemplate=None):
+    """Add a label image and its legend, leaving the axes free to stretch"""
+    fig.add_trace(label_image_trace(labels, palette, hovertemplate=hovertemplate))
+    fig.add_traces(label_legend_traces(palette, names))
+    # Image traces pin the axes to square pixels by default; grids are far wider than tall
+    fig.update_xaxes(constrain=None)
+    fig.update_yaxes(scaleanchor=False, constrain=None)
+    fig.update_layout(legend=dict(orientation='h', yanchor='bottom', y=1.0, x=0))
+    return fig
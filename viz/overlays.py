@@ -0,0 +1,51 @@
+"""Batched line overlays for heatmap pages.
+
+Each helper draws all of its lines as a single scatter trace separated by
+``None`` gaps, so the figure payload and layout cost do not grow with the
+number of lines the way one ``add_vline`` shape per line does.
+"""
+
+import numpy as np
+import plotly.graph_objects as go
+
+
+def vline_trace(x_positions, y0, y1, color='gray', dash='dash', width=1, opacity=1.0, name=None):
+    """Build one scatter trace drawing a vertical line at every x position"""
+    x_positions = np.asarray(x_positions, dtype=float)
+    n = x_positions.size
+
+    # Each line is (x, y0) -> (x, y1) followed by a None break
+    xs = np.empty(3 * n, dtype=object)
+    ys = np.empty(3 * n, dtype=object)
+    xs[0::3] = x_positions
+    xs[1::3] = x_positions
+    xs[2::3] = None
+    ys[0::3] = y0
+    ys[1::3] = y1
+    ys[2::3] = None
+
+    return go.Scatter(
+        x=xs,
+        y=ys,
+        mode='lines',
+        line=dict(color=color, dash=dash, width=width),
+        opacity=opacity,
+        hoverinfo='skip',
+        showlegend=False,
+        name=name
+    )
+
+
+def add_rb_boundaries(fig, num_rbs, num_symbols, subcarriers_per_rb=12, row=None, col=None,
+                      color='gray', dash='dash', opacity=0.3, rb_step=1):
+    """Overlay every ``rb_step``-th RB boundary on a (symbol, subcarrier) heatmap as one trace"""
+    if num_rbs < 2:
+        return fig
+
+    boundaries = np.arange(rb_step, num_rbs, rb_step) * subcarriers_per_rb - 0.5
+    fig.add_trace(
+        vline_trace(boundaries, -0.5, num_symbols - 0.5, color=color, dash=dash,
+                    opacity=opacity, name='RB boundaries'),
+        row=row, col=col
+    )
+    return fig
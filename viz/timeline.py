@@ -0,0 +1,52 @@
+"""Time-axis interval rendering for the frame, subframe and slot views.
+
+Intervals (subframes, slots, symbols) are drawn as one ``go.Bar`` trace
+with per-bar widths, colors and customdata, so figure size and layout cost
+stay flat as the numerology or the number of frames grows.
+"""
+
+import numpy as np
+import plotly.graph_objects as go
+
+# Above this many intervals per trace, in-bar labels are dropped (hover remains)
+MAX_LABELED_INTERVALS = 40
+
+
+def interval_trace(starts, widths, color, line_color='black', line_width=1, opacity=1.0,
+                   labels=None, customdata=None, hovertemplate=None, name=None):
+    """One bar trace drawing [start, start + width) intervals on the x axis.
+
+    ``color`` may be a single color or one per interval. Labels are shown
+    inside the bars only while there are few enough of them to read.
+    """
+    starts = np.asarray(starts, dtype=float)
+    widths = np.broadcast_to(np.asarray(widths, dtype=float), starts.shape)
+    show_labels = labels is not None and starts.size <= MAX_LABELED_INTERVALS
+
+    return go.Bar(
+        x=starts + widths / 2,
+        y=np.ones(starts.size),
+        width=widths,
+        marker=dict(color=color, opacity=opacity, line=dict(color=line_color, width=line_width)),
+        text=labels if show_labels else None,
+        textposition='inside' if show_labels else 'none',
+        insidetextanchor='middle',
+        textangle=0,
+        customdata=customdata,
+        hovertemplate=hovertemplate,
+        showlegend=False,
+        name=name
+    )
+
+
+def timeline_layout(fig, title, x_title, x_range, height):
+    """Shared layout for single-row timeline figures"""
+    fig.update_layout(
+        title=title,
+        xaxis=dict(title=x_title, range=x_range, showgrid=True),
+        yaxis=dict(showticklabels=False, range=[0, 1]),
+        height=height,
+        bargap=0,
+        showlegend=False
+    )
+    return fig